@@ -7,19 +7,21 @@ from fastapi import Request
 from pydantic import BaseModel
 import sys
 import os
+import asyncio
 from typing import List, Optional
 import logging
 from datetime import datetime
 import random
 import json
 from pathlib import Path
-from nba_api.stats.endpoints import scoreboardv2
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.match_predictor import NBAMatchPredictor
+from models.numpy_predictor import NUMPY_MODEL_SUFFIX, NumpyMatchPredictor
 from api.services.nba_api import NBAApiService
+from api.services.prediction_batcher import PredictionBatcher
 
 # Set up logging
 logging.basicConfig(
@@ -46,16 +48,31 @@ app.add_middleware(
 )
 
 # Initialize services
-match_predictor = NBAMatchPredictor()
-nba_api = NBAApiService()
+MODEL_PATH = 'models/match_predictor_with_overtime'
+nba_api = NBAApiService(
+    max_workers=int(os.getenv('NBA_API_MAX_WORKERS', '8')),
+    cache_max_entries=int(os.getenv('NBA_API_CACHE_MAX_ENTRIES', '256'))
+)
 
-# Load the model
-try:
-    match_predictor.load_model('models/match_predictor_with_overtime')
-    logger.info("Loaded model with overtime feature")
-except Exception as e:
-    logger.warning(f"Could not load model with overtime feature: {str(e)}")
-    logger.info("Using default model")
+# Load the model, preferring the TensorFlow-free NumPy export when available
+if os.path.exists(MODEL_PATH + NUMPY_MODEL_SUFFIX):
+    match_predictor = NumpyMatchPredictor.load(MODEL_PATH)
+    logger.info("Loaded NumPy model with overtime feature")
+else:
+    match_predictor = NBAMatchPredictor()
+    try:
+        match_predictor.load_model(MODEL_PATH)
+        logger.info("Loaded model with overtime feature")
+    except Exception as e:
+        logger.warning(f"Could not load model with overtime feature: {str(e)}")
+        logger.info("Using default model")
+
+# Concurrent /predict requests are scored together in one forward pass
+prediction_batcher = PredictionBatcher(
+    match_predictor,
+    max_batch_size=int(os.getenv('PREDICTION_BATCH_MAX_SIZE', '64')),
+    max_wait_ms=float(os.getenv('PREDICTION_BATCH_WINDOW_MS', '5'))
+)
 
 # Pydantic models
 class Team(BaseModel):
@@ -130,6 +147,12 @@ class GameInfo(BaseModel):
     away_team_logo: str
     prediction: Optional[float] = None
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop background workers"""
+    await prediction_batcher.close()
+    nba_api.shutdown()
+
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Home page with today's games"""
@@ -173,13 +196,13 @@ async def api_page(request: Request):
 @app.get("/teams", response_model=List[Team])
 async def get_teams():
     """Get all NBA teams"""
-    teams = nba_api._get_teams()
+    teams = await nba_api.get_teams_async()
     return [Team(id=t['id'], name=t['name'], abbreviation=t['abbreviation']) for t in teams]
 
 @app.get("/teams/{team_id}/stats", response_model=TeamStats)
 async def get_team_stats(team_id: int):
     """Get current stats for a team"""
-    stats = nba_api.get_team_stats(team_id)
+    stats = await nba_api.get_team_stats_async(team_id)
     if not stats:
         raise HTTPException(status_code=404, detail="Team stats not found")
     return TeamStats(**stats)
@@ -224,12 +247,12 @@ async def predict_match(request: MatchPredictionRequest):
     """Predict the outcome of a match"""
     try:
         # Get team info
-        teams = nba_api._get_teams()
+        teams = await nba_api.get_teams_async()
         home_team = next(t for t in teams if t['id'] == request.homeTeamId)
         away_team = next(t for t in teams if t['id'] == request.awayTeamId)
         
         # Get prediction from model
-        win_probability = match_predictor.predict_match(
+        win_probability = await prediction_batcher.predict(
             str(request.homeTeamId),
             str(request.awayTeamId),
             request.homeTeamStats.dict(),
@@ -274,13 +297,15 @@ async def get_historical_predictions():
 @app.get("/teams/compare/{team1_id}/{team2_id}", response_model=dict)
 async def compare_teams(team1_id: int, team2_id: int):
     """Compare two teams' statistics"""
-    team1_stats = nba_api.get_team_stats(team1_id)
-    team2_stats = nba_api.get_team_stats(team2_id)
+    team1_stats, team2_stats = await asyncio.gather(
+        nba_api.get_team_stats_async(team1_id),
+        nba_api.get_team_stats_async(team2_id)
+    )
     
     if not team1_stats or not team2_stats:
         raise HTTPException(status_code=404, detail="Team stats not found")
     
-    teams = nba_api._get_teams()
+    teams = await nba_api.get_teams_async()
     team1 = next(t for t in teams if t['id'] == team1_id)
     team2 = next(t for t in teams if t['id'] == team2_id)
     
@@ -308,7 +333,7 @@ async def health_check():
     """Health check endpoint for monitoring"""
     try:
         # Check if we can get teams data
-        teams = nba_api._get_teams()
+        teams = await nba_api.get_teams_async()
         if not teams:
             return {"status": "degraded", "message": "NBA API connection issue"}
         
@@ -318,7 +343,8 @@ async def health_check():
             "services": {
                 "nba_api": "healthy",
                 "model": "healthy" if match_predictor.model is not None else "degraded"
-            }
+            },
+            "cache": nba_api.cache.stats()
         }
     except Exception as e:
         logger.error(f"Health check failed: {str(e)}")
@@ -327,8 +353,7 @@ async def health_check():
 @app.get("/games/today", response_model=List[GameInfo])
 async def get_todays_games():
     today = datetime.now().strftime("%m/%d/%Y")
-    scoreboard = scoreboardv2.ScoreboardV2(game_date=today)
-    games = scoreboard.get_normalized_dict()["GameHeader"]
+    games = await nba_api.get_scoreboard_games_async(today)
     lines = []
     for game in games:
         home_team = game["HOME_TEAM_ABBREVIATION"]
@@ -0,0 +1,110 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class _Entry:
+    __slots__ = ('value', 'expires_at', 'stale_until', 'refreshing')
+
+    def __init__(self, value, expires_at, stale_until):
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.refreshing = False
+
+
+class TTLCache:
+    """Thread-safe LRU cache with per-key TTLs and stale-while-revalidate
+
+    Fresh entries are returned directly. Once an entry expires it is still
+    served for ``stale_ttl`` more seconds (by default as long again as its
+    own TTL) while a single background refresh runs on ``executor``; after
+    that window the next caller reloads inline.
+    Falsy loader results (the service's error values) are never cached.
+    """
+
+    def __init__(self, max_entries: int = 256, default_ttl: float = 1800, stale_ttl: Optional[float] = None,
+                 executor=None, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.executor = executor
+        self.clock = clock
+        self._entries: 'OrderedDict[Hashable, _Entry]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {'hits': 0, 'stale_hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+        """Return the cached value for ``key``, calling ``loader`` when needed"""
+        ttl = self.default_ttl if ttl is None else ttl
+        now = self.clock()
+        refresh = False
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                self._counters['misses'] += 1
+                entry = None
+            else:
+                self._entries.move_to_end(key)
+                if now < entry.expires_at:
+                    self._counters['hits'] += 1
+                else:
+                    self._counters['stale_hits'] += 1
+                    if not entry.refreshing and self.executor is not None:
+                        entry.refreshing = True
+                        refresh = True
+
+        if entry is not None:
+            if refresh:
+                self.executor.submit(self._refresh, key, loader, ttl)
+            return entry.value
+
+        value = loader()
+        if value:
+            self.set(key, value, ttl)
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None):
+        """Store ``value`` under ``key`` for ``ttl`` seconds"""
+        ttl = self.default_ttl if ttl is None else ttl
+        now = self.clock()
+        with self._lock:
+            stale_ttl = ttl if self.stale_ttl is None else self.stale_ttl
+            self._entries[key] = _Entry(value, now + ttl, now + ttl + stale_ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._counters['evictions'] += 1
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """Drop one key, or everything when ``key`` is None"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size"""
+        with self._lock:
+            return dict(self._counters, size=len(self._entries))
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], ttl: float):
+        try:
+            value = loader()
+        except Exception as e:
+            logger.error(f"Error refreshing cache entry {key}: {str(e)}")
+            value = None
+
+        with self._lock:
+            self._counters['refreshes'] += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                entry.refreshing = False
+        if value:
+            self.set(key, value, ttl)
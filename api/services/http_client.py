@@ -0,0 +1,169 @@
+import os
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .response_cache import DiskResponseCache
+
+logger = logging.getLogger(__name__)
+
+# Status codes stats.nba.com returns when throttling or briefly unavailable
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+_session: Optional[requests.Session] = None
+_cached_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+# Per-thread rate limiter consulted just before a request goes on the wire
+_pacing = threading.local()
+
+
+@contextmanager
+def rate_limited(limiter):
+    """Pace network sends made by this thread with ``limiter`` (anything with acquire())
+
+    Responses served from a DiskResponseCache never reach the network, so
+    they do not use up the limiter's budget.
+    """
+    previous = getattr(_pacing, 'limiter', None)
+    _pacing.limiter = limiter
+    try:
+        yield limiter
+    finally:
+        _pacing.limiter = previous
+
+
+class TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that applies a default timeout when the caller sets none"""
+
+    def __init__(self, *args, timeout: float = 10.0, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        limiter = getattr(_pacing, 'limiter', None)
+        if limiter is not None:
+            limiter.acquire()
+        return super().send(request, **kwargs)
+
+
+class CachingHTTPAdapter(TimeoutHTTPAdapter):
+    """TimeoutHTTPAdapter that answers GETs from a DiskResponseCache when it can"""
+
+    def __init__(self, *args, cache: DiskResponseCache, **kwargs):
+        self.cache = cache
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if request.method != 'GET' or kwargs.get('stream'):
+            return super().send(request, **kwargs)
+
+        response = self.cache.get(request)
+        if response is not None:
+            response.connection = self
+            return response
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 200:
+            try:
+                self.cache.put(request, response)
+            except OSError as e:
+                logger.error(f"Error caching response for {request.url}: {str(e)}")
+        response.from_cache = False
+        return response
+
+
+def create_session(pool_size: int = 16, timeout: float = 10.0, retries: int = 3,
+                   backoff_factor: float = 0.5, cache: Optional[DiskResponseCache] = None) -> requests.Session:
+    """Build a keep-alive session with a bounded connection pool and GET retries"""
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset(['GET']),
+        respect_retry_after_header=True,
+        # Hand the last response back so callers' raise_for_status still fires
+        raise_on_status=False
+    )
+    adapter_kwargs = dict(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+        timeout=timeout
+    )
+    if cache is not None:
+        adapter = CachingHTTPAdapter(cache=cache, **adapter_kwargs)
+    else:
+        adapter = TimeoutHTTPAdapter(**adapter_kwargs)
+
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """Process-wide session configured from NBA_HTTP_* environment variables"""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = create_session(
+                pool_size=int(os.getenv('NBA_HTTP_POOL_SIZE', '16')),
+                timeout=float(os.getenv('NBA_HTTP_TIMEOUT', '10')),
+                retries=int(os.getenv('NBA_HTTP_RETRIES', '3'))
+            )
+        return _session
+
+
+def get_cached_session() -> requests.Session:
+    """Process-wide session that also keeps responses on disk, for batch scripts
+
+    Configured like get_session, plus NBA_HTTP_CACHE_DIR (default
+    data/http_cache) and NBA_HTTP_CACHE_MAX_MB (default 512).
+    """
+    global _cached_session
+    with _session_lock:
+        if _cached_session is None:
+            cache = DiskResponseCache(
+                os.getenv('NBA_HTTP_CACHE_DIR', os.path.join('data', 'http_cache')),
+                max_bytes=int(float(os.getenv('NBA_HTTP_CACHE_MAX_MB', '512')) * 1024 * 1024)
+            )
+            _cached_session = create_session(
+                pool_size=int(os.getenv('NBA_HTTP_POOL_SIZE', '16')),
+                timeout=float(os.getenv('NBA_HTTP_TIMEOUT', '10')),
+                retries=int(os.getenv('NBA_HTTP_RETRIES', '3')),
+                cache=cache
+            )
+        return _cached_session
+
+
+class _SessionRequests:
+    """Stands in for the ``requests`` module inside nba_api, routing get() to a session"""
+
+    def __init__(self, session: requests.Session):
+        self.session = session
+
+    def get(self, *args, **kwargs):
+        return self.session.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(requests, name)
+
+
+def install_nba_api_session(session: Optional[requests.Session] = None) -> requests.Session:
+    """Make nba_api endpoint classes send their requests through ``session``
+
+    nba_api calls the module-level ``requests.get`` for every endpoint and has
+    no session hook, so its reference to ``requests`` is swapped for a shim.
+    """
+    from nba_api.library import http as nba_http
+
+    session = session or get_session()
+    nba_http.requests = _SessionRequests(session)
+    return session
@@ -1,8 +1,16 @@
-import requests
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 import logging
 from typing import Dict, List, Optional
 
+from nba_api.stats.endpoints import scoreboardv2
+
+from .cache import TTLCache
+from .http_client import get_session, install_nba_api_session
+from .single_flight import SingleFlight
+
 logger = logging.getLogger(__name__)
 
 class NBAApiService:
@@ -14,24 +22,71 @@ class NBAApiService:
         'Referer': 'https://www.nba.com/',
     }
 
-    def __init__(self):
-        self.teams_cache = None
-        self.schedule_cache = None
-        self.last_cache_update = None
-        self.cache_duration = timedelta(minutes=30)
+    # Seconds each kind of response stays fresh
+    CACHE_TTLS = {
+        'teams': 30 * 60,
+        'next_game': 5 * 60,
+        'team_stats': 10 * 60,
+    }
 
-    def _get_teams(self) -> List[Dict]:
-        """Get all NBA teams"""
-        if self.teams_cache and self.last_cache_update and datetime.now() - self.last_cache_update < self.cache_duration:
-            return self.teams_cache
+    def __init__(self, max_workers: int = 8, cache_max_entries: int = 256, session=None):
+        # Pooled keep-alive session, shared with the nba_api endpoint classes
+        self.session = install_nba_api_session(session or get_session())
+        # Upstream calls block, so async callers run them on this bounded pool
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='nba-api')
+        # Expired entries keep being served while the executor refreshes them
+        self.cache = TTLCache(max_entries=cache_max_entries, executor=self.executor)
+        # Identical in-flight upstream requests share one HTTP call
+        self.inflight = SingleFlight()
 
-        try:
-            response = requests.get(
-                f"{self.BASE_URL}/leaguestandingsv3",
+    async def _run_blocking(self, func, *args):
+        """Run a blocking call on the service executor without stalling the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args))
+
+    async def get_teams_async(self) -> List[Dict]:
+        """Async variant of _get_teams"""
+        return await self._run_blocking(self._get_teams)
+
+    async def get_next_game_async(self) -> Optional[Dict]:
+        """Async variant of get_next_game"""
+        return await self._run_blocking(self.get_next_game)
+
+    async def get_team_stats_async(self, team_id: int) -> Optional[Dict]:
+        """Async variant of get_team_stats"""
+        return await self._run_blocking(self.get_team_stats, team_id)
+
+    async def get_scoreboard_games_async(self, game_date: str) -> List[Dict]:
+        """Async variant of get_scoreboard_games"""
+        return await self._run_blocking(self.get_scoreboard_games, game_date)
+
+    def shutdown(self):
+        """Release the executor threads"""
+        self.executor.shutdown(wait=False)
+
+    def _fetch_json(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
+        """GET a stats endpoint, sharing the response with identical in-flight requests"""
+        params = params or {}
+        key = (endpoint, tuple(sorted((name, str(value)) for name, value in params.items())))
+
+        def fetch():
+            response = self.session.get(
+                f"{self.BASE_URL}/{endpoint}",
+                params=params,
                 headers=self.HEADERS
             )
             response.raise_for_status()
-            data = response.json()
+            return response.json()
+
+        return self.inflight.do(key, fetch)
+
+    def _get_teams(self) -> List[Dict]:
+        """Get all NBA teams"""
+        return self.cache.get_or_load('teams', self._fetch_teams, ttl=self.CACHE_TTLS['teams'])
+
+    def _fetch_teams(self) -> List[Dict]:
+        try:
+            data = self._fetch_json('leaguestandingsv3')
             
             teams = []
             for team in data['resultSets'][0]['rowSet']:
@@ -44,8 +99,6 @@ class NBAApiService:
                     'win_percentage': team[5],
                 })
             
-            self.teams_cache = teams
-            self.last_cache_update = datetime.now()
             return teams
         except Exception as e:
             logger.error(f"Error fetching teams: {str(e)}")
@@ -53,39 +106,27 @@ class NBAApiService:
 
     def get_next_game(self) -> Optional[Dict]:
         """Get the next scheduled NBA game"""
-        if self.schedule_cache and self.last_cache_update and datetime.now() - self.last_cache_update < self.cache_duration:
-            return self.schedule_cache
+        return self.cache.get_or_load('next_game', self._fetch_next_game, ttl=self.CACHE_TTLS['next_game'])
 
+    def _fetch_next_game(self) -> Optional[Dict]:
         try:
             # Get today's date in YYYY-MM-DD format
             today = datetime.now().strftime('%Y-%m-%d')
             
-            response = requests.get(
-                f"{self.BASE_URL}/scoreboardv2",
-                params={
-                    'DayOffset': '0',
-                    'LeagueID': '00',
-                    'gameDate': today
-                },
-                headers=self.HEADERS
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_json('scoreboardv2', {
+                'DayOffset': '0',
+                'LeagueID': '00',
+                'gameDate': today
+            })
             
             if not data['resultSets'][0]['rowSet']:
                 # If no games today, get tomorrow's games
                 tomorrow = (datetime.now() + timedelta(days=1)).strftime('%Y-%m-%d')
-                response = requests.get(
-                    f"{self.BASE_URL}/scoreboardv2",
-                    params={
-                        'DayOffset': '1',
-                        'LeagueID': '00',
-                        'gameDate': tomorrow
-                    },
-                    headers=self.HEADERS
-                )
-                response.raise_for_status()
-                data = response.json()
+                data = self._fetch_json('scoreboardv2', {
+                    'DayOffset': '1',
+                    'LeagueID': '00',
+                    'gameDate': tomorrow
+                })
 
             if data['resultSets'][0]['rowSet']:
                 game = data['resultSets'][0]['rowSet'][0]
@@ -103,8 +144,6 @@ class NBAApiService:
                     'date': game[0],
                     'time': game[1]
                 }
-                self.schedule_cache = next_game
-                self.last_cache_update = datetime.now()
                 return next_game
             
             return None
@@ -114,19 +153,20 @@ class NBAApiService:
 
     def get_team_stats(self, team_id: int) -> Optional[Dict]:
         """Get current season stats for a team"""
+        return self.cache.get_or_load(
+            ('team_stats', team_id),
+            functools.partial(self._fetch_team_stats, team_id),
+            ttl=self.CACHE_TTLS['team_stats']
+        )
+
+    def _fetch_team_stats(self, team_id: int) -> Optional[Dict]:
         try:
-            response = requests.get(
-                f"{self.BASE_URL}/teamdashboardbygeneralsplits",
-                params={
-                    'TeamID': team_id,
-                    'Season': '2023-24',
-                    'SeasonType': 'Regular Season',
-                    'MeasureType': 'Base'
-                },
-                headers=self.HEADERS
-            )
-            response.raise_for_status()
-            data = response.json()
+            data = self._fetch_json('teamdashboardbygeneralsplits', {
+                'TeamID': team_id,
+                'Season': '2023-24',
+                'SeasonType': 'Regular Season',
+                'MeasureType': 'Base'
+            })
             
             if data['resultSets'][0]['rowSet']:
                 stats = data['resultSets'][0]['rowSet'][0]
@@ -144,4 +184,9 @@ class NBAApiService:
             return None
         except Exception as e:
             logger.error(f"Error fetching team stats: {str(e)}")
-            return None 
\ No newline at end of file
+            return None 
+
+    def get_scoreboard_games(self, game_date: str) -> List[Dict]:
+        """Get the scoreboard game headers for a date (MM/DD/YYYY); errors propagate"""
+        scoreboard = scoreboardv2.ScoreboardV2(game_date=game_date)
+        return scoreboard.get_normalized_dict()["GameHeader"]
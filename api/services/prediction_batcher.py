@@ -0,0 +1,88 @@
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class PredictionBatcher:
+    """Coalesces concurrent match predictions into batched forward passes
+
+    Requests are queued for up to ``max_wait_ms`` (or until ``max_batch_size``
+    requests are waiting) and then scored with a single
+    ``predictor.predict_matches`` call in a worker thread, so the event loop
+    never blocks on the model.
+    """
+
+    def __init__(self, predictor, max_batch_size: int = 64, max_wait_ms: float = 5.0, executor=None):
+        self.predictor = predictor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.executor = executor
+        self.batches_run = 0
+        self.requests_served = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def predict(self, home_team_id, away_team_id, home_team_stats: Dict, away_team_stats: Dict) -> Optional[float]:
+        """Predict one match; returns None on failure like predict_match"""
+        self._ensure_worker()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(((home_team_id, away_team_id, home_team_stats, away_team_stats), future))
+        return await future
+
+    def _ensure_worker(self):
+        # The queue and worker are bound to the running loop, so create them lazily
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def close(self):
+        """Stop the background worker"""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            requests = [request for request, _ in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, self._predict_batch, requests)
+            except Exception as e:
+                logger.error(f"Error running prediction batch: {str(e)}")
+                results = [None] * len(batch)
+
+            self.batches_run += 1
+            self.requests_served += len(batch)
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    def _predict_batch(self, requests: List[Tuple]) -> List[Optional[float]]:
+        """Score a batch in one forward pass, isolating failures to single requests"""
+        home_ids, away_ids, home_stats, away_stats = zip(*requests)
+        try:
+            return [float(p) for p in self.predictor.predict_matches(home_ids, away_ids, list(home_stats), list(away_stats))]
+        except Exception as e:
+            if len(requests) == 1:
+                logger.error(f"Error predicting match: {str(e)}")
+                return [None]
+            # One bad request (e.g. an unknown team) should not fail the others
+            return [self._predict_batch([request])[0] for request in requests]
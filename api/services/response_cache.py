@@ -0,0 +1,187 @@
+import os
+import json
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+logger = logging.getLogger(__name__)
+
+# Seconds a response stays valid, by stats endpoint; None never expires
+ENDPOINT_TTLS = {
+    'scoreboardv2': 60,
+    'leaguestandingsv3': 60 * 60,
+    'leaguedashteamstats': 60 * 60,
+    'teamdashboardbygeneralsplits': 60 * 60,
+    'commonteamroster': 6 * 60 * 60,
+}
+DEFAULT_TTL = 60 * 60
+
+# Endpoints whose results are final once the season they cover has ended
+SEASON_ENDPOINTS = {'leaguegamefinder', 'teamgamelog', 'playergamelog', 'teamgamelogs'}
+SEASON_PARAMS = ('Season', 'SeasonNullable', 'season')
+
+# Decoded bodies are stored, so transport headers no longer apply
+DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def current_season_start_year(now: Optional[datetime] = None) -> int:
+    """Start year of the season in progress; seasons roll over in October"""
+    now = now or datetime.now()
+    return now.year if now.month >= 10 else now.year - 1
+
+
+def default_ttl_policy(endpoint: str, params: Dict[str, str]) -> Optional[float]:
+    """TTL for one request: finished seasons never expire, everything else per endpoint"""
+    if endpoint in SEASON_ENDPOINTS:
+        season = next((params[name] for name in SEASON_PARAMS if params.get(name)), None)
+        if season and season[:4].isdigit() and int(season[:4]) < current_season_start_year():
+            return None
+    return ENDPOINT_TTLS.get(endpoint, DEFAULT_TTL)
+
+
+class DiskResponseCache:
+    """Content-addressed on-disk cache of GET responses with an LRU size bound
+
+    Entries are stored under the SHA-256 of the endpoint URL and its sorted
+    query parameters. Each file holds a JSON metadata line followed by the
+    body. Reads refresh the file's mtime, and once ``max_bytes`` is exceeded
+    the least recently used files are removed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024, ttl_policy=default_ttl_policy,
+                 clock=time.time):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl_policy = ttl_policy
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+        os.makedirs(directory, exist_ok=True)
+        self._size = sum(entry.stat().st_size for entry in os.scandir(directory) if entry.name.endswith('.cache'))
+
+    @staticmethod
+    def request_key(url: str) -> Tuple[str, str, Dict[str, str]]:
+        """(hash, endpoint, params) for a request URL"""
+        parts = urlsplit(url)
+        params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+        canonical = f"{parts.netloc}{parts.path}?{json.dumps(params)}"
+        endpoint = parts.path.rstrip('/').rsplit('/', 1)[-1].lower()
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest(), endpoint, dict(params)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, f"{digest}.cache")
+
+    def get(self, request: requests.PreparedRequest) -> Optional[requests.Response]:
+        """Cached response for ``request``, or None when missing or expired"""
+        digest, _, _ = self.request_key(request.url)
+        path = self._path(digest)
+        try:
+            with open(path, 'rb') as f:
+                meta = json.loads(f.readline())
+                content = f.read()
+        except (OSError, ValueError):
+            self._count('misses')
+            return None
+
+        if meta['expires_at'] is not None and self.clock() >= meta['expires_at']:
+            self._remove(path)
+            self._count('misses')
+            return None
+
+        try:
+            # mtime doubles as the LRU timestamp
+            os.utime(path)
+        except OSError:
+            pass
+        self._count('hits')
+
+        response = requests.Response()
+        response.status_code = meta['status']
+        response.reason = meta.get('reason')
+        response.headers = CaseInsensitiveDict(meta['headers'])
+        response.encoding = meta.get('encoding')
+        response.url = request.url
+        response.request = request
+        response._content = content
+        response.from_cache = True
+        return response
+
+    def put(self, request: requests.PreparedRequest, response: requests.Response):
+        """Store a successful response according to the TTL policy"""
+        digest, endpoint, params = self.request_key(request.url)
+        ttl = self.ttl_policy(endpoint, params)
+        if ttl is not None and ttl <= 0:
+            return
+
+        meta = {
+            'url': request.url,
+            'status': response.status_code,
+            'reason': response.reason,
+            'encoding': response.encoding,
+            'headers': {k: v for k, v in response.headers.items() if k.lower() not in DROPPED_HEADERS},
+            'stored_at': self.clock(),
+            'expires_at': None if ttl is None else self.clock() + ttl
+        }
+        data = json.dumps(meta).encode('utf-8') + b'\n' + response.content
+
+        path = self._path(digest)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with self._lock:
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+            self._size += len(data) - previous
+            self.counters['stores'] += 1
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits; caller holds the lock"""
+        entries = sorted(
+            (entry.stat().st_mtime, entry.stat().st_size, entry.path)
+            for entry in os.scandir(self.directory) if entry.name.endswith('.cache')
+        )
+        for _, size, path in entries:
+            if self._size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.counters['evictions'] += 1
+
+    def _count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+    def _remove(self, path: str):
+        with self._lock:
+            try:
+                size = os.path.getsize(path)
+                os.remove(path)
+                self._size -= size
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove every cached response"""
+        with self._lock:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.cache'):
+                    os.remove(entry.path)
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and bytes on disk"""
+        with self._lock:
+            return dict(self.counters, bytes=self._size)
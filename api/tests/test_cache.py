@@ -0,0 +1,134 @@
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from services.cache import TTLCache
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def wait_for_refreshes(cache, count, timeout=5):
+    deadline = time.monotonic() + timeout
+    while cache.stats()['refreshes'] < count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+@pytest.fixture
+def executor():
+    executor = ThreadPoolExecutor(max_workers=1)
+    yield executor
+    executor.shutdown(wait=True)
+
+def test_fresh_entries_are_hits(clock):
+    cache = TTLCache(default_ttl=10, clock=clock)
+    calls = []
+    loader = lambda: calls.append(1) or 'value'
+
+    assert cache.get_or_load('key', loader) == 'value'
+    clock.now = 9
+    assert cache.get_or_load('key', loader) == 'value'
+
+    assert len(calls) == 1
+    stats = cache.stats()
+    assert stats['misses'] == 1
+    assert stats['hits'] == 1
+
+def test_per_key_ttls(clock):
+    cache = TTLCache(default_ttl=100, stale_ttl=0, clock=clock)
+    cache.get_or_load('short', lambda: 'a', ttl=5)
+    cache.get_or_load('long', lambda: 'b', ttl=50)
+
+    clock.now = 10
+    assert cache.get_or_load('short', lambda: 'a2', ttl=5) == 'a2'
+    assert cache.get_or_load('long', lambda: 'b2', ttl=50) == 'b'
+
+def test_stale_entry_served_while_refreshing(clock, executor):
+    cache = TTLCache(default_ttl=10, stale_ttl=10, executor=executor, clock=clock)
+    cache.get_or_load('key', lambda: 'old')
+
+    release = threading.Event()
+    calls = []
+
+    def slow_loader():
+        calls.append(1)
+        release.wait(5)
+        return 'new'
+
+    clock.now = 15
+    # Both callers get the stale value and only one refresh is scheduled
+    assert cache.get_or_load('key', slow_loader) == 'old'
+    assert cache.get_or_load('key', slow_loader) == 'old'
+    release.set()
+    wait_for_refreshes(cache, 1)
+
+    assert len(calls) == 1
+    assert cache.get_or_load('key', slow_loader) == 'new'
+    stats = cache.stats()
+    assert stats['stale_hits'] == 2
+    assert stats['refreshes'] == 1
+
+def test_entry_past_stale_window_reloads_inline(clock, executor):
+    cache = TTLCache(default_ttl=10, stale_ttl=5, executor=executor, clock=clock)
+    cache.get_or_load('key', lambda: 'old')
+
+    clock.now = 20
+    assert cache.get_or_load('key', lambda: 'new') == 'new'
+    assert cache.stats()['misses'] == 2
+
+def test_default_stale_window_follows_each_key_ttl(clock, executor):
+    cache = TTLCache(default_ttl=1800, executor=executor, clock=clock)
+    cache.get_or_load('next_game', lambda: 'old', ttl=300)
+    cache.get_or_load('teams', lambda: 'old')
+
+    # A 5 minute entry is served stale for 5 more minutes, not the 30 minute default
+    clock.now = 601
+    assert cache.get_or_load('next_game', lambda: 'new', ttl=300) == 'new'
+    assert cache.get_or_load('teams', lambda: 'new') == 'old'
+
+def test_failed_refresh_keeps_stale_value(clock, executor):
+    cache = TTLCache(default_ttl=10, stale_ttl=10, executor=executor, clock=clock)
+    cache.get_or_load('key', lambda: 'old')
+
+    def failing_loader():
+        raise Exception("API Error")
+
+    clock.now = 15
+    assert cache.get_or_load('key', failing_loader) == 'old'
+    wait_for_refreshes(cache, 1)
+    assert cache.get_or_load('key', failing_loader) == 'old'
+    assert cache.stats()['size'] == 1
+
+def test_error_values_are_not_cached(clock):
+    cache = TTLCache(clock=clock)
+    assert cache.get_or_load('key', lambda: []) == []
+    assert cache.get_or_load('key', lambda: ['team']) == ['team']
+    assert cache.stats()['misses'] == 2
+
+def test_lru_eviction(clock):
+    cache = TTLCache(max_entries=2, clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    # Touch 'a' so 'b' is the least recently used
+    cache.get_or_load('a', lambda: 0)
+    cache.set('c', 3)
+
+    assert cache.get_or_load('a', lambda: 0) == 1
+    assert cache.get_or_load('b', lambda: 'reloaded') == 'reloaded'
+    assert cache.stats()['evictions'] == 2
+    assert cache.stats()['size'] == 2
+
+def test_invalidate(clock):
+    cache = TTLCache(clock=clock)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.invalidate('a')
+    assert cache.stats()['size'] == 1
+    cache.invalidate()
+    assert cache.stats()['size'] == 0
@@ -0,0 +1,85 @@
+import threading
+import time
+import pytest
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from services.http_client import create_session
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.statuses = []
+        self.delay = 0
+        self.client_ports = []
+
+    def handle_error(self, request, client_address):
+        # The timeout test hangs up before the stub replies
+        pass
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/stats/endpoint"
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        time.sleep(self.server.delay)
+        status = self.server.statuses.pop(0) if self.server.statuses else 200
+        body = b'{}'
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def test_connections_are_reused(stub_server):
+    session = create_session()
+    for _ in range(5):
+        session.get(stub_server.url).raise_for_status()
+
+    assert len(stub_server.client_ports) == 5
+    assert len(set(stub_server.client_ports)) == 1
+
+def test_retries_transient_errors(stub_server):
+    stub_server.statuses = [503, 429]
+    session = create_session(retries=3, backoff_factor=0)
+
+    response = session.get(stub_server.url)
+
+    assert response.status_code == 200
+    assert len(stub_server.client_ports) == 3
+
+def test_exhausted_retries_return_last_response(stub_server):
+    stub_server.statuses = [500, 500]
+    session = create_session(retries=1, backoff_factor=0)
+
+    response = session.get(stub_server.url)
+
+    assert response.status_code == 500
+    with pytest.raises(requests.HTTPError):
+        response.raise_for_status()
+
+def test_default_timeout_applied(stub_server):
+    stub_server.delay = 0.5
+    session = create_session(timeout=0.1, retries=0)
+
+    start = time.perf_counter()
+    with pytest.raises(requests.exceptions.RequestException):
+        session.get(stub_server.url)
+    assert time.perf_counter() - start < 0.4
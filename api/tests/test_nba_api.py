@@ -1,3 +1,5 @@
+import asyncio
+import time
 import pytest
 from unittest.mock import patch, Mock
 from datetime import datetime
@@ -55,7 +57,7 @@ def mock_team_stats_response():
     }
 
 def test_get_teams(nba_api, mock_teams_response):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.json.return_value = mock_teams_response
         mock_get.return_value.raise_for_status = Mock()
         
@@ -70,7 +72,7 @@ def test_get_teams(nba_api, mock_teams_response):
         assert teams[0]['win_percentage'] == 0.6
 
 def test_get_next_game(nba_api, mock_game_response):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.json.return_value = mock_game_response
         mock_get.return_value.raise_for_status = Mock()
         
@@ -85,7 +87,7 @@ def test_get_next_game(nba_api, mock_game_response):
         assert next_game['time'] == '19:30'
 
 def test_get_team_stats(nba_api, mock_team_stats_response):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.json.return_value = mock_team_stats_response
         mock_get.return_value.raise_for_status = Mock()
         
@@ -103,7 +105,7 @@ def test_get_team_stats(nba_api, mock_team_stats_response):
         assert stats['lastTenGames'] == 0.7
 
 def test_cache_mechanism(nba_api, mock_teams_response):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.return_value.json.return_value = mock_teams_response
         mock_get.return_value.raise_for_status = Mock()
         
@@ -118,7 +120,7 @@ def test_cache_mechanism(nba_api, mock_teams_response):
         assert teams1 == teams2  # Same data returned
 
 def test_error_handling(nba_api):
-    with patch('requests.get') as mock_get:
+    with patch('requests.Session.get') as mock_get:
         mock_get.side_effect = Exception("API Error")
         
         # Test error handling in get_teams
@@ -131,4 +133,78 @@ def test_error_handling(nba_api):
         
         # Test error handling in get_team_stats
         stats = nba_api.get_team_stats(1)
-        assert stats is None 
\ No newline at end of file
+        assert stats is None 
+
+def test_async_calls_do_not_block_each_other(nba_api, mock_teams_response):
+    def slow_get(*args, **kwargs):
+        time.sleep(0.3)
+        response = Mock()
+        response.json.return_value = mock_teams_response
+        return response
+
+    async def fetch_concurrently():
+        return await asyncio.gather(
+            nba_api.get_teams_async(),
+            nba_api.get_team_stats_async(1),
+            nba_api.get_team_stats_async(2)
+        )
+
+    with patch('requests.Session.get', side_effect=slow_get):
+        start = time.perf_counter()
+        teams, _, _ = asyncio.run(fetch_concurrently())
+        elapsed = time.perf_counter() - start
+
+    assert len(teams) == 2
+    # Three 0.3s upstream calls overlap on the executor instead of running back to back
+    assert elapsed < 0.6
+
+def test_team_stats_cached_per_team(nba_api):
+    with patch('requests.Session.get') as mock_get:
+        mock_get.return_value.json.return_value = {'resultSets': [{'rowSet': [list(range(16))]}]}
+        mock_get.return_value.raise_for_status = Mock()
+
+        nba_api.get_team_stats(1)
+        nba_api.get_team_stats(1)
+        nba_api.get_team_stats(2)
+        assert mock_get.call_count == 2
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+def test_teams_cache_independent_of_next_game(nba_api, mock_teams_response, mock_game_response):
+    clock = FakeClock()
+    nba_api.cache.clock = clock
+    responses = {'leaguestandingsv3': mock_teams_response, 'scoreboardv2': mock_game_response}
+
+    def get(url, **kwargs):
+        response = Mock()
+        response.json.return_value = responses[url.rsplit('/', 1)[-1]]
+        return response
+
+    with patch('requests.Session.get', side_effect=get) as mock_get:
+        teams = nba_api._get_teams()
+        assert nba_api.get_next_game() is not None
+        assert mock_get.call_count == 2
+
+        # next_game expires and is reloaded well within the teams TTL
+        clock.now = 2 * NBAApiService.CACHE_TTLS['next_game'] + 1
+        assert nba_api.get_next_game() is not None
+        assert mock_get.call_count == 3
+
+        # Reloading next_game neither extends nor replaces the teams entry
+        assert nba_api._get_teams() == teams
+        assert mock_get.call_count == 3
+        assert nba_api.cache.stats()['hits'] == 1
+
+        # teams expires on its own TTL: the stale value is served while it refreshes
+        clock.now = NBAApiService.CACHE_TTLS['teams'] + 1
+        assert nba_api._get_teams() == teams
+        deadline = time.monotonic() + 5
+        while nba_api.cache.stats()['refreshes'] < 1 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert mock_get.call_count == 4
+        assert mock_get.call_args.args[0].endswith('/leaguestandingsv3')
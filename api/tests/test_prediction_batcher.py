@@ -0,0 +1,68 @@
+import asyncio
+import threading
+from services.prediction_batcher import PredictionBatcher
+
+UNKNOWN_TEAM = 99
+
+class StubPredictor:
+    """Records each predict_matches call; fails any batch containing UNKNOWN_TEAM"""
+    def __init__(self):
+        self.batch_sizes = []
+        self.lock = threading.Lock()
+
+    def predict_matches(self, home_ids, away_ids, home_stats, away_stats):
+        with self.lock:
+            self.batch_sizes.append(len(home_ids))
+        if UNKNOWN_TEAM in home_ids:
+            raise ValueError("Unknown team")
+        return [home_id / 100 for home_id in home_ids]
+
+async def predict_all(batcher, home_ids):
+    try:
+        return await asyncio.gather(*(batcher.predict(home_id, 1, {}, {}) for home_id in home_ids))
+    finally:
+        await batcher.close()
+
+def test_concurrent_requests_share_one_batch():
+    predictor = StubPredictor()
+    batcher = PredictionBatcher(predictor, max_batch_size=64, max_wait_ms=50)
+
+    results = asyncio.run(predict_all(batcher, range(10, 20)))
+
+    assert results == [home_id / 100 for home_id in range(10, 20)]
+    assert predictor.batch_sizes == [10]
+    assert batcher.batches_run == 1
+    assert batcher.requests_served == 10
+
+def test_max_batch_size_splits_batches():
+    predictor = StubPredictor()
+    batcher = PredictionBatcher(predictor, max_batch_size=4, max_wait_ms=50)
+
+    results = asyncio.run(predict_all(batcher, range(10, 20)))
+
+    assert results == [home_id / 100 for home_id in range(10, 20)]
+    assert predictor.batch_sizes == [4, 4, 2]
+
+def test_failing_request_does_not_fail_the_batch():
+    predictor = StubPredictor()
+    batcher = PredictionBatcher(predictor, max_wait_ms=50)
+
+    results = asyncio.run(predict_all(batcher, [10, UNKNOWN_TEAM, 30]))
+
+    assert results == [0.1, None, 0.3]
+    # The failed batch is retried one request at a time
+    assert predictor.batch_sizes == [3, 1, 1, 1]
+
+def test_close_stops_the_worker():
+    batcher = PredictionBatcher(StubPredictor(), max_wait_ms=1)
+
+    async def predict_then_close():
+        assert await batcher.predict(50, 1, {}, {}) == 0.5
+        worker = batcher._worker
+        await batcher.close()
+        return worker
+
+    worker = asyncio.run(predict_then_close())
+
+    assert worker.cancelled()
+    assert batcher._worker is None
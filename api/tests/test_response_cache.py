@@ -0,0 +1,144 @@
+import threading
+import time
+import pytest
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from services.http_client import create_session, rate_limited
+from services.response_cache import DiskResponseCache, current_season_start_year, default_ttl_policy
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubHandler)
+        self.paths = []
+        self.status = 200
+
+    def url(self, endpoint):
+        return f"http://127.0.0.1:{self.server_address[1]}/stats/{endpoint}"
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        self.server.paths.append(self.path)
+        body = b'{"resultSets": [{"rowSet": [[1, "LAL"]]}]}'
+        self.send_response(self.server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+def make_session(tmp_path, clock, **kwargs):
+    cache = DiskResponseCache(str(tmp_path / 'http_cache'), clock=clock, **kwargs)
+    return create_session(retries=0, cache=cache), cache
+
+def test_repeated_request_served_from_disk(stub_server, tmp_path, clock):
+    session, cache = make_session(tmp_path, clock)
+
+    first = session.get(stub_server.url('leaguestandingsv3'), params={'Season': '2024-25', 'LeagueID': '00'})
+    # Same params in a different order hash to the same entry
+    second = session.get(stub_server.url('leaguestandingsv3'), params={'LeagueID': '00', 'Season': '2024-25'})
+
+    assert len(stub_server.paths) == 1
+    assert second.from_cache and not first.from_cache
+    assert second.json() == first.json()
+    assert cache.stats()['hits'] == 1
+
+    # A fresh cache over the same directory still hits
+    session, _ = make_session(tmp_path, clock)
+    session.get(stub_server.url('leaguestandingsv3'), params={'Season': '2024-25', 'LeagueID': '00'})
+    assert len(stub_server.paths) == 1
+
+def test_entries_expire_per_endpoint(stub_server, tmp_path, clock):
+    session, _ = make_session(tmp_path, clock)
+    session.get(stub_server.url('scoreboardv2'), params={'GameDate': '2025-01-01'})
+    session.get(stub_server.url('leaguestandingsv3'))
+
+    clock.now += 120
+    session.get(stub_server.url('scoreboardv2'), params={'GameDate': '2025-01-01'})
+    session.get(stub_server.url('leaguestandingsv3'))
+
+    # The scoreboard expired after 60s; standings are good for an hour
+    assert len(stub_server.paths) == 3
+
+def test_errors_are_not_cached(stub_server, tmp_path, clock):
+    session, cache = make_session(tmp_path, clock)
+    stub_server.status = 500
+
+    session.get(stub_server.url('leaguestandingsv3'))
+    session.get(stub_server.url('leaguestandingsv3'))
+
+    assert len(stub_server.paths) == 2
+    assert cache.stats()['stores'] == 0
+
+def test_finished_seasons_never_expire():
+    finished = f"{current_season_start_year() - 1}-00"
+    current = f"{current_season_start_year()}-00"
+
+    assert default_ttl_policy('leaguegamefinder', {'SeasonNullable': finished}) is None
+    assert default_ttl_policy('leaguegamefinder', {'SeasonNullable': current}) is not None
+    assert default_ttl_policy('scoreboardv2', {}) == 60
+
+def test_current_season_rolls_over_in_october():
+    assert current_season_start_year(datetime(2025, 3, 1)) == 2024
+    assert current_season_start_year(datetime(2025, 10, 1)) == 2025
+
+def test_lru_eviction_keeps_recently_used(stub_server, tmp_path, clock):
+    session, cache = make_session(tmp_path, clock)
+    session.get(stub_server.url('leaguestandingsv3'), params={'id': 'a'})
+    entry_size = cache.stats()['bytes']
+    cache.max_bytes = 2 * entry_size + entry_size // 2
+
+    time.sleep(0.01)
+    session.get(stub_server.url('leaguestandingsv3'), params={'id': 'b'})
+    time.sleep(0.01)
+    # Reading 'a' makes 'b' the least recently used entry
+    session.get(stub_server.url('leaguestandingsv3'), params={'id': 'a'})
+    time.sleep(0.01)
+    session.get(stub_server.url('leaguestandingsv3'), params={'id': 'c'})
+
+    assert cache.stats()['evictions'] == 1
+    assert cache.stats()['bytes'] <= cache.max_bytes
+    requests_made = len(stub_server.paths)
+    assert session.get(stub_server.url('leaguestandingsv3'), params={'id': 'a'}).from_cache
+    assert not session.get(stub_server.url('leaguestandingsv3'), params={'id': 'b'}).from_cache
+    assert len(stub_server.paths) == requests_made + 1
+
+def test_cache_hits_skip_the_rate_limiter(stub_server, tmp_path, clock):
+    class CountingLimiter:
+        acquired = 0
+
+        def acquire(self):
+            self.acquired += 1
+
+    session, _ = make_session(tmp_path, clock)
+    limiter = CountingLimiter()
+    with rate_limited(limiter):
+        for _ in range(3):
+            session.get(stub_server.url('leaguestandingsv3'))
+
+    assert limiter.acquired == 1
@@ -0,0 +1,117 @@
+import json
+import threading
+import time
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from services.http_client import create_session
+from services.nba_api import NBAApiService
+from services.single_flight import SingleFlight
+
+CALLERS = 100
+
+class StubStatsServer(ThreadingHTTPServer):
+    """Local stand-in for stats.nba.com that counts and delays requests"""
+    daemon_threads = True
+
+    def __init__(self, delay=0.2, status=200):
+        super().__init__(('127.0.0.1', 0), StubStatsHandler)
+        self.delay = delay
+        self.status = status
+        self.paths = []
+        self.lock = threading.Lock()
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/stats"
+
+class StubStatsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.paths.append(self.path)
+        time.sleep(self.server.delay)
+
+        body = json.dumps({
+            'resultSets': [{
+                'rowSet': [
+                    [1, 'Los Angeles Lakers', 'LAL', 30, 20, 0.6],
+                    [2, 'Boston Celtics', 'BOS', 35, 15, 0.7]
+                ]
+            }]
+        }).encode()
+        self.send_response(self.server.status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    server = StubStatsServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def nba_api(stub_server):
+    # No retries, so each upstream failure is a single stub request
+    service = NBAApiService(max_workers=4, session=create_session(retries=0))
+    service.BASE_URL = stub_server.base_url
+    yield service
+    service.shutdown()
+
+def call_concurrently(func, *args):
+    """Release CALLERS threads at once and collect their results"""
+    barrier = threading.Barrier(CALLERS)
+
+    def caller():
+        barrier.wait()
+        return func(*args)
+
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        futures = [pool.submit(caller) for _ in range(CALLERS)]
+        return [future.result() for future in futures]
+
+def test_concurrent_cache_misses_share_one_request(nba_api, stub_server):
+    results = call_concurrently(nba_api._get_teams)
+
+    assert len(stub_server.paths) == 1
+    assert all(len(teams) == 2 for teams in results)
+    assert nba_api.inflight.executions == 1
+    assert nba_api.inflight.shared == CALLERS - 1
+
+def test_different_params_are_not_shared(nba_api, stub_server):
+    barrier = threading.Barrier(2)
+
+    def fetch(team_id):
+        barrier.wait()
+        return nba_api._fetch_json('teamdashboardbygeneralsplits', {'TeamID': team_id})
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        list(pool.map(fetch, [1, 2]))
+
+    assert len(stub_server.paths) == 2
+
+def test_upstream_error_shared_by_all_waiters(nba_api, stub_server):
+    stub_server.status = 500
+
+    results = call_concurrently(nba_api._get_teams)
+
+    assert len(stub_server.paths) == 1
+    assert all(teams == [] for teams in results)
+
+    # Errors are not cached, so the next call goes upstream again
+    stub_server.status = 200
+    assert len(nba_api._get_teams()) == 2
+    assert len(stub_server.paths) == 2
+
+def test_sequential_calls_are_not_coalesced():
+    flight = SingleFlight()
+    assert flight.do('key', lambda: 1) == 1
+    assert flight.do('key', lambda: 2) == 2
+    assert flight.executions == 2
@@ -0,0 +1,67 @@
+"""
+Walk-forward backtest cost: re-running prepare_features for every game
+day vs preparing features once and replaying the sorted matrix
+(models.backtest.walk_forward).
+
+The per-day path is timed on a sample of days and extrapolated to the
+season. Both paths use the logistic model, so the difference is the
+feature work; pass --model keras to time the network refits as well.
+
+Usage:
+    python benchmarks/bench_backtest.py [--seasons 1] [--sample-days 5] [--model logistic]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.schema import apply_game_schema
+from models.backtest import MODELS, walk_forward
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark walk-forward backtesting')
+    parser.add_argument('--seasons', type=int, default=1)
+    parser.add_argument('--sample-days', type=int, default=5)
+    parser.add_argument('--model', choices=sorted(MODELS), default='logistic')
+    parser.add_argument('--refit-days', type=int, default=7)
+    args = parser.parse_args()
+
+    from models.match_predictor import NBAMatchPredictor
+    predictor = NBAMatchPredictor()
+
+    games_df = apply_game_schema(make_games(2460 * args.seasons))
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    game_days = np.sort(games_df['GAME_DATE'].unique())
+    scored_days = game_days[game_days >= game_days[0] + np.timedelta64(14, 'D')]
+
+    # Per-day path: features for everything up to D are recomputed each day
+    sample = scored_days[np.linspace(0, len(scored_days) - 1, args.sample_days).astype(int)]
+    start = time.perf_counter()
+    for day in sample:
+        predictor.prepare_features(games_df[games_df['GAME_DATE'] <= day].copy())
+    per_day = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    features_df = predictor.prepare_features(games_df.copy())
+    prepare_s = time.perf_counter() - start
+    result = walk_forward(features_df, MODELS[args.model](), start_date=scored_days[0],
+                          refit_days=args.refit_days, min_train_rows=0)
+    summary = result.summary()
+
+    print(f"\n{len(games_df)} rows, {len(scored_days)} game days scored, {summary['fits']} {args.model} fits")
+    print(f"{'path':<36}{'seconds':>9}")
+    print(f"{'prepare_features per day (est.)':<36}{per_day * len(scored_days):>9.1f}")
+    print(f"{'prepare once + walk_forward':<36}{prepare_s + summary['seconds']:>9.1f}")
+    print(f"{'  of which walk_forward':<36}{summary['seconds']:>9.1f}{summary['games_per_second']:>8.0f} games/s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Compare concat-in-loop accumulation with NBADataFetcher.fetch_seasons.
+
+fetch_team_games is replaced by an in-memory lookup of synthetic per-team
+frames, so only the combining step is measured. Time and tracemalloc peak
+are reported for growing multi-season backfills: the old loop grows
+quadratically, fetch_seasons linearly.
+
+Usage:
+    python benchmarks/bench_concat_accumulation.py [--seasons 1 5 10 20]
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tracemalloc
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from api.services.http_client import create_session
+from scripts.data_fetcher import NBADataFetcher
+
+ROWS_PER_SEASON = 2460
+
+
+def season_frames(n_seasons):
+    """{(team_id, season): frame} with 30 team frames per season"""
+    games = make_games(ROWS_PER_SEASON * n_seasons)
+    frames = {}
+    for i in range(n_seasons):
+        season = f"{2000 + i}-{str(2001 + i)[2:]}"
+        chunk = games.iloc[i * ROWS_PER_SEASON:(i + 1) * ROWS_PER_SEASON]
+        for team_id, team_games in chunk.groupby('TEAM_ID'):
+            frames[(team_id, season)] = team_games.reset_index(drop=True)
+    return frames
+
+
+def concat_in_loop(frames):
+    """The previous accumulation pattern"""
+    all_games = pd.DataFrame()
+    for team_games in frames.values():
+        all_games = pd.concat([all_games, team_games], ignore_index=True)
+    return all_games.drop_duplicates(subset=['GAME_ID'], keep='first')
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multi-season frame accumulation')
+    parser.add_argument('--seasons', type=int, nargs='+', default=[1, 5, 10, 20])
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    fetcher = NBADataFetcher(max_workers=1, requests_per_second=1e9, burst=1e9, session=create_session())
+    # Map the benchmark's synthetic ids onto the fetcher's team list
+    team_ids = [team['id'] for team in fetcher.teams]
+
+    print(f"{'seasons':<9}{'loop s':>9}{'loop MB':>9}{'once s':>9}{'once MB':>9}")
+    for n_seasons in args.seasons:
+        frames = season_frames(n_seasons)
+        seasons = sorted({season for _, season in frames})
+        fetcher.fetch_team_games = lambda team_id, season: frames.get((team_id, season), pd.DataFrame())
+        assert {team_id for team_id, _ in frames} <= set(team_ids)
+
+        loop_games, loop_time, loop_peak = measure(lambda: concat_in_loop(frames))
+        once_games, once_time, once_peak = measure(lambda: fetcher.fetch_seasons(seasons))
+        assert len(loop_games) == len(once_games)
+
+        print(f"{n_seasons:<9}{loop_time:>9.3f}{loop_peak:>9.1f}{once_time:>9.3f}{once_peak:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
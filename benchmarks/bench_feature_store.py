@@ -0,0 +1,77 @@
+"""
+Scoring a slate: full prepare_features recomputation vs the feature store.
+
+The "recompute" path is what predictions did before: read the game CSV
+and run NBAMatchPredictor.prepare_features over all of it. The store
+path loads the saved TeamFeatureStore and reads each team's stats. The
+cost of ingesting one night of games into the store is reported as well.
+
+Usage:
+    python benchmarks/bench_feature_store.py [--seasons 3] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.schema import read_games_csv
+from models.feature_store import TeamFeatureStore
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the incremental feature store')
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    from models.match_predictor import NBAMatchPredictor
+    predictor = NBAMatchPredictor()
+
+    games = make_games(2460 * args.seasons)
+    dates = pd.to_datetime(games['GAME_DATE'])
+    last_night = games[dates == dates.max()]
+    history = games[dates < dates.max()]
+    team_ids = sorted(games['TEAM_ID'].unique())
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'team_games.csv')
+        games.to_csv(csv_path, index=False)
+        store_path = os.path.join(directory, 'feature_store.joblib')
+        TeamFeatureStore.build(games).save(store_path)
+
+        recompute_ms = best_of(lambda: predictor.prepare_features(read_games_csv(csv_path)), args.repeat)
+        store_ms = best_of(
+            lambda: (lambda store: [store.team_stats(team_id) for team_id in team_ids])(TeamFeatureStore.load(store_path)),
+            args.repeat
+        )
+
+        base = TeamFeatureStore.build(history)
+        start = time.perf_counter()
+        base.update(last_night)
+        update_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n{len(games)} rows, stats for {len(team_ids)} teams")
+    print(f"{'path':<34}{'ms':>9}")
+    print(f"{'read CSV + prepare_features':<34}{recompute_ms:>9.1f}")
+    print(f"{'load feature store + team_stats':<34}{store_ms:>9.1f}{recompute_ms / store_ms:>8.0f}x")
+    print(f"{f'ingest one night ({len(last_night)} rows)':<34}{update_ms:>9.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Time NBADataFetcher.fetch_all_team_games against a local LeagueGameFinder stub.
+
+The stub answers each team's request after ``--latency-ms`` with synthetic
+rows for that team. Serial (1 worker) and concurrent runs share the same
+token-bucket rate, so the concurrent run should approach the rate-limit
+floor (teams / rate) instead of teams * latency. The previous fixed-sleep
+implementation is shown as an estimate: teams * (latency + 2.25s mean sleep).
+
+Usage:
+    python benchmarks/bench_fetch_all_team_games.py [--rate 10] [--latency-ms 400] [--workers 8]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nba_api.stats.library.http import NBAStatsHTTP
+from benchmarks.synthetic import make_games
+from api.services.http_client import create_session
+from scripts.data_fetcher import NBADataFetcher
+
+LEGACY_MEAN_SLEEP = 2.25
+
+
+def make_handler(games_df, latency):
+    headers = list(games_df.columns)
+    rows_by_team = {
+        str(team_id): json.loads(team_games.to_json(orient='values'))
+        for team_id, team_games in games_df.groupby('TEAM_ID')
+    }
+
+    class LeagueGameFinderStub(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            team_id = parse_qs(urlparse(self.path).query).get('TeamID', [''])[0]
+            time.sleep(latency)
+            body = json.dumps({'resultSets': [{
+                'name': 'LeagueGameFinderResults',
+                'headers': headers,
+                'rowSet': rows_by_team.get(team_id, [])
+            }]}).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return LeagueGameFinderStub
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the concurrent league-wide game fetch')
+    parser.add_argument('--rate', type=float, default=10, help='requests per second')
+    parser.add_argument('--latency-ms', type=float, default=400)
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--rows', type=int, default=2460)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(make_games(args.rows), args.latency_ms / 1000))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    NBAStatsHTTP.base_url = f"http://127.0.0.1:{server.server_address[1]}/stats/{{endpoint}}"
+
+    # Uncached session so every run goes to the stub
+    session = create_session(pool_size=args.workers)
+    n_teams = len(NBADataFetcher(session=session).teams)
+    print(f"{n_teams} teams, {args.latency_ms:.0f} ms latency, {args.rate:g} req/s limit")
+    print(f"{'mode':<24}{'seconds':>10}{'rows':>8}")
+    print(f"{'fixed sleeps (est.)':<24}{n_teams * (args.latency_ms / 1000 + LEGACY_MEAN_SLEEP):>10.2f}{'-':>8}")
+
+    for label, workers in [('serial', 1), (f'concurrent ({args.workers})', args.workers)]:
+        fetcher = NBADataFetcher(max_workers=workers, requests_per_second=args.rate, session=session)
+        start = time.perf_counter()
+        games = fetcher.fetch_all_team_games(season='2015-16')
+        print(f"{label:<24}{time.perf_counter() - start:>10.2f}{len(games):>8}")
+
+    print(f"{'rate-limit floor':<24}{(n_teams - 1) / args.rate:>10.2f}{'-':>8}")
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
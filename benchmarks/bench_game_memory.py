@@ -0,0 +1,62 @@
+"""
+Per-row memory of game DataFrames: default read_csv dtypes vs data.schema.
+
+A synthetic multi-season history is written to CSV and read back both
+ways. The footprint (deep memory_usage) is reported after loading and
+again after NBAMatchPredictor.prepare_features has added its feature
+columns.
+
+Usage:
+    python benchmarks/bench_game_memory.py [--seasons 10]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.schema import read_games_csv
+
+
+def bytes_per_row(games_df):
+    return games_df.memory_usage(deep=True).sum() / len(games_df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark game DataFrame memory with and without the dtype schema')
+    parser.add_argument('--seasons', type=int, default=10)
+    args = parser.parse_args()
+
+    from models.match_predictor import NBAMatchPredictor
+    predictor = NBAMatchPredictor()
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'team_games.csv')
+        make_games(2460 * args.seasons).to_csv(csv_path, index=False)
+
+        results = {}
+        for name, read in [('default', pd.read_csv), ('schema', read_games_csv)]:
+            start = time.perf_counter()
+            games_df = read(csv_path)
+            read_ms = (time.perf_counter() - start) * 1000
+            loaded = bytes_per_row(games_df)
+            prepared = bytes_per_row(predictor.prepare_features(games_df))
+            results[name] = (read_ms, loaded, prepared, len(games_df))
+
+    rows = results['default'][3]
+    print(f"\n{args.seasons} synthetic seasons, {rows} rows")
+    print(f"{'dtypes':<10}{'read ms':>9}{'loaded B/row':>14}{'prepared B/row':>16}{'prepared MB':>13}")
+    for name, (read_ms, loaded, prepared, _) in results.items():
+        print(f"{name:<10}{read_ms:>9.0f}{loaded:>14.0f}{prepared:>16.0f}{prepared * rows / 1e6:>13.1f}")
+    default, schema = results['default'], results['schema']
+    print(f"{'ratio':<10}{'':>9}{default[1] / schema[1]:>13.1f}x{default[2] / schema[2]:>15.1f}x")
+
+
+if __name__ == '__main__':
+    main()
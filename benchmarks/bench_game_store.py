@@ -0,0 +1,83 @@
+"""
+Load time and disk footprint: CSV snapshots vs the Parquet GameStore.
+
+Uses data/team_games_latest.csv (and reports the size of every CSV
+snapshot in data/), plus a larger synthetic multi-season history. Each
+load is timed for the full table, three columns, and one season.
+
+Usage:
+    python benchmarks/bench_game_store.py [--synthetic-seasons 20] [--repeat 5]
+"""
+import os
+import sys
+import glob
+import time
+import argparse
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.game_store import GameStore
+
+COLUMNS = ['TEAM_ID', 'GAME_DATE', 'PTS']
+
+
+def best_of(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+
+def compare(label, csv_path, repeat):
+    with tempfile.TemporaryDirectory() as directory:
+        store = GameStore(directory)
+        store.import_csv(csv_path)
+        season = pd.read_csv(csv_path, usecols=['SEASON_ID'])['SEASON_ID'].mode()[0]
+
+        rows = [
+            ('full', lambda: pd.read_csv(csv_path), lambda: store.load()),
+            ('3 columns', lambda: pd.read_csv(csv_path, usecols=COLUMNS), lambda: store.load(columns=COLUMNS)),
+            ('1 season', lambda: (lambda df: df[df['SEASON_ID'] == season])(pd.read_csv(csv_path)),
+             lambda: store.load(seasons=[season])),
+        ]
+
+        print(f"\n{label}: CSV {os.path.getsize(csv_path) / 1024:.0f} KB, "
+              f"Parquet {directory_size(directory) / 1024:.0f} KB")
+        print(f"{'load':<12}{'CSV ms':>10}{'Parquet ms':>12}{'speedup':>9}")
+        for name, csv_load, store_load in rows:
+            csv_ms = best_of(csv_load, repeat)
+            store_ms = best_of(store_load, repeat)
+            print(f"{name:<12}{csv_ms:>10.1f}{store_ms:>12.1f}{csv_ms / store_ms:>8.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark CSV vs Parquet game storage')
+    parser.add_argument('--synthetic-seasons', type=int, default=20)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+    snapshots = glob.glob(os.path.join(data_dir, 'team_games_*.csv')) + glob.glob(os.path.join(data_dir, 'training_data_*.csv'))
+    print(f"{len(snapshots)} CSV snapshots in data/: {sum(map(os.path.getsize, snapshots)) / 1024:.0f} KB total")
+
+    compare('data/team_games_latest.csv', os.path.join(data_dir, 'team_games_latest.csv'), args.repeat)
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'synthetic.csv')
+        make_games(2460 * args.synthetic_seasons).to_csv(csv_path, index=False)
+        compare(f'synthetic {args.synthetic_seasons} seasons', csv_path, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""
+Nightly update cost: GameStore.upsert vs merging into a full CSV rewrite.
+
+A synthetic multi-season history is stored once. Each "night" then
+brings one day of rows, half of them corrections to rows already stored
+and half new games. The CSV path re-reads the whole history, drops rows
+with the same (GAME_ID, TEAM_ID) and writes it back; the store writes
+only the night's rows. Load time is reported after all the upserts and
+again after compact().
+
+Usage:
+    python benchmarks/bench_game_store_upsert.py [--seasons 10] [--nights 10]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.game_store import GameStore, PRIMARY_KEY
+
+ROWS_PER_NIGHT = 30
+
+
+def nightly_batches(history, nights):
+    """Batches of ROWS_PER_NIGHT rows: the last stored rows corrected, plus new games"""
+    new_games = make_games(ROWS_PER_NIGHT * nights, seed=7, start_date='2040-10-20')
+    # Synthetic ids restart at zero, so move the new games past the history
+    new_games['GAME_ID'] = (new_games['GAME_ID'].astype(int) + len(history)).astype(str).str.zfill(10)
+    half = ROWS_PER_NIGHT // 2
+    batches = []
+    for night in range(nights):
+        corrected = history.iloc[-half * (night + 1):len(history) - half * night].assign(PTS=lambda df: df['PTS'] + 1)
+        fresh = new_games.iloc[night * half:(night + 1) * half]
+        batches.append(pd.concat([corrected, fresh], ignore_index=True))
+    return batches
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark keyed upserts against full CSV rewrites')
+    parser.add_argument('--seasons', type=int, default=10)
+    parser.add_argument('--nights', type=int, default=10)
+    args = parser.parse_args()
+
+    history = make_games(2460 * args.seasons)
+    history['GAME_ID'] = history['GAME_ID'].astype(str).str.zfill(10)
+    batches = nightly_batches(history, args.nights)
+
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, 'team_games_latest.csv')
+        history.to_csv(csv_path, index=False)
+        store = GameStore(os.path.join(directory, 'game_store'))
+        store.replace(history)
+
+        csv_times, store_times = [], []
+        for batch in batches:
+            start = time.perf_counter()
+            games = pd.read_csv(csv_path, dtype={'GAME_ID': str})
+            games = pd.concat([games, batch], ignore_index=True).drop_duplicates(PRIMARY_KEY, keep='last')
+            games.to_csv(csv_path, index=False)
+            csv_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            store.upsert(batch)
+            store_times.append(time.perf_counter() - start)
+
+        csv_ms = sum(csv_times) / len(csv_times) * 1000
+        store_ms = sum(store_times) / len(store_times) * 1000
+        print(f"{len(history)} stored rows, {args.nights} nights of {ROWS_PER_NIGHT} rows "
+              f"({ROWS_PER_NIGHT // 2} corrections each)")
+        print(f"{'per night':<22}{'ms':>8}")
+        print(f"{'CSV merge + rewrite':<22}{csv_ms:>8.1f}")
+        print(f"{'GameStore.upsert':<22}{store_ms:>8.1f}{csv_ms / store_ms:>8.1f}x")
+
+        expected = pd.read_csv(csv_path, dtype={'GAME_ID': str})
+        start = time.perf_counter()
+        loaded = store.load()
+        load_ms = (time.perf_counter() - start) * 1000
+        assert len(loaded) == len(expected), (len(loaded), len(expected))
+
+        store.compact()
+        start = time.perf_counter()
+        compacted = store.load()
+        compact_ms = (time.perf_counter() - start) * 1000
+        assert len(compacted) == len(expected)
+        print(f"\nload after upserts   {load_ms:>8.1f} ms")
+        print(f"load after compact   {compact_ms:>8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
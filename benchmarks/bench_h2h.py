@@ -0,0 +1,79 @@
+"""
+Benchmark the head-to-head win-rate feature against the old row-wise apply.
+
+Usage:
+    python benchmarks/bench_h2h.py [--sizes 1000 10000 100000] [--legacy-max 5000]
+"""
+import os
+import sys
+import time
+import argparse
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.features import head_to_head_win_rate
+
+
+def legacy_head_to_head(games_df):
+    """Row-wise implementation previously used in prepare_features"""
+    return games_df.apply(
+        lambda row: games_df[
+            (games_df['TEAM_ID'] == row['TEAM_ID']) &
+            (games_df['OPPONENT_TEAM_ID'] == row['OPPONENT_TEAM_ID']) &
+            (games_df['GAME_DATE'] < row['GAME_DATE'])
+        ]['WIN'].mean() if len(games_df[
+            (games_df['TEAM_ID'] == row['TEAM_ID']) &
+            (games_df['OPPONENT_TEAM_ID'] == row['OPPONENT_TEAM_ID']) &
+            (games_df['GAME_DATE'] < row['GAME_DATE'])
+        ]) > 0 else 0.5,
+        axis=1
+    )
+
+
+def prepare(n_rows):
+    """Add the columns the H2H feature depends on"""
+    games_df = make_games(n_rows)
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    games_df['WIN'] = (games_df['WL'] == 'W').astype(int)
+    abbrev_to_id = games_df.drop_duplicates('TEAM_ABBREVIATION').set_index('TEAM_ABBREVIATION')['TEAM_ID']
+    games_df['OPPONENT_TEAM_ID'] = games_df['MATCHUP'].str.split().str[-1].map(abbrev_to_id)
+    return games_df
+
+
+def time_call(func, games_df, repeat):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(games_df)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the head-to-head win-rate feature')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 5000, 10000, 25000, 50000, 100000])
+    parser.add_argument('--legacy-max', type=int, default=5000, help='Largest size to run the row-wise version on')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8} {'grouped (s)':>12} {'us/row':>8} {'row-wise (s)':>13} {'speedup':>8}")
+    for size in args.sizes:
+        games_df = prepare(size)
+        fast, fast_result = time_call(head_to_head_win_rate, games_df, args.repeat)
+
+        legacy_col, speedup_col = '-', '-'
+        if size <= args.legacy_max:
+            slow, slow_result = time_call(legacy_head_to_head, games_df, 1)
+            assert (fast_result - slow_result).abs().max() < 1e-12, 'results differ'
+            legacy_col, speedup_col = f'{slow:.3f}', f'{slow / fast:.0f}x'
+
+        print(f"{size:>8} {fast:>12.4f} {fast / size * 1e6:>8.2f} {legacy_col:>13} {speedup_col:>8}")
+
+
+if __name__ == "__main__":
+    main()
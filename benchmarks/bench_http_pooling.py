@@ -0,0 +1,108 @@
+"""
+Compare requests/sec against a local HTTPS stub with and without pooling.
+
+"unpooled" calls requests.get per request, as the services did before, so
+every call pays a fresh TCP + TLS handshake. "pooled" uses the keep-alive
+session from api.services.http_client. A self-signed certificate is
+generated with the openssl CLI for the stub.
+
+Usage:
+    python benchmarks/bench_http_pooling.py [--requests 300] [--threads 1 8]
+"""
+import os
+import sys
+import ssl
+import time
+import argparse
+import tempfile
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.services.http_client import create_session
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+    disable_nagle_algorithm = True
+    body = b'{"resultSets": [{"rowSet": []}]}'
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(self.body)))
+        self.end_headers()
+        self.wfile.write(self.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_certificate(directory):
+    """Write a self-signed certificate for 127.0.0.1; return (cert, key) paths"""
+    cert = os.path.join(directory, 'cert.pem')
+    key = os.path.join(directory, 'key.pem')
+    subprocess.run(
+        ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '1',
+         '-keyout', key, '-out', cert, '-subj', '/CN=127.0.0.1',
+         '-addext', 'subjectAltName=IP:127.0.0.1'],
+        check=True, capture_output=True
+    )
+    return cert, key
+
+
+def start_server(cert, key):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    server.daemon_threads = True
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(get, url, n_requests, threads):
+    """Issue n_requests GETs from ``threads`` workers; return requests/sec"""
+    def fetch(_):
+        get(url).raise_for_status()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(fetch, range(n_requests)))
+    return n_requests / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pooled vs unpooled HTTPS requests')
+    parser.add_argument('--requests', type=int, default=300)
+    parser.add_argument('--threads', type=int, nargs='+', default=[1, 8])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(directory)
+        server = start_server(cert, key)
+        url = f"https://127.0.0.1:{server.server_address[1]}/stats/leaguestandingsv3"
+
+        print(f"{'threads':<10}{'unpooled req/s':>16}{'pooled req/s':>14}{'speedup':>10}")
+        for threads in args.threads:
+            unpooled = run(lambda u: requests.get(u, verify=cert), url, args.requests, threads)
+
+            # verify is passed per call: session.verify loses to REQUESTS_CA_BUNDLE
+            session = create_session(pool_size=threads)
+            pooled = run(lambda u: session.get(u, verify=cert), url, args.requests, threads)
+            session.close()
+
+            print(f"{threads:<10}{unpooled:>16.0f}{pooled:>14.0f}{pooled / unpooled:>9.1f}x")
+
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Hyperparameter search throughput: candidates trained one after another in
+this process (TensorFlow's default threading) vs the spawn pool in
+models.hyperparameter_search with single-threaded workers, one per core.
+
+Both run the same successive-halving schedule over the same candidates, so
+the difference is how well the cores are kept busy. Small dense networks
+parallelize poorly inside TensorFlow, which is why one process per core
+wins on multi-core machines; on a single core the two are about equal.
+
+Usage:
+    python benchmarks/bench_hyperparameter_search.py [--samples 9] [--min-epochs 1] [--max-epochs 9]
+"""
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.hyperparameter_search import (
+    _train_candidate, leaderboard, load_search_data, random_candidates, run_search, successive_halving,
+    write_search_data
+)
+
+
+def sequential(games_df, candidates, min_epochs, max_epochs, eta):
+    work_dir = tempfile.mkdtemp(prefix='bench_search_')
+    try:
+        data_dir = os.path.join(work_dir, 'data')
+        write_search_data(games_df, data_dir)
+        data = load_search_data(data_dir)
+        rows = successive_halving(
+            candidates, lambda tasks: [_train_candidate(task, data) for task in tasks],
+            work_dir, min_epochs, max_epochs, eta
+        )
+        return leaderboard(rows)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark sequential vs pooled hyperparameter search')
+    parser.add_argument('--seasons', type=int, default=2)
+    parser.add_argument('--samples', type=int, default=9)
+    parser.add_argument('--min-epochs', type=int, default=1)
+    parser.add_argument('--max-epochs', type=int, default=9)
+    parser.add_argument('--eta', type=int, default=3)
+    args = parser.parse_args()
+
+    games_df = make_games(2460 * args.seasons)
+    candidates = random_candidates(samples=args.samples)
+
+    results = {}
+    for name, search in [
+        ('sequential', lambda: sequential(games_df.copy(), candidates, args.min_epochs, args.max_epochs, args.eta)),
+        (f'pool ({os.cpu_count()} workers)', lambda: run_search(
+            games_df.copy(), candidates, min_epochs=args.min_epochs, max_epochs=args.max_epochs, eta=args.eta))
+    ]:
+        start = time.perf_counter()
+        board = search()
+        results[name] = (time.perf_counter() - start, int(board['epochs'].groupby(board['candidate']).max().sum()))
+
+    print(f"\n{len(games_df)} rows, {len(candidates)} candidates, epochs {args.min_epochs}..{args.max_epochs}, "
+          f"eta {args.eta}, {os.cpu_count()} cores")
+    print(f"{'search':<24}{'seconds':>9}{'epochs/s':>10}")
+    for name, (seconds, epochs) in results.items():
+        print(f"{name:<24}{seconds:>9.1f}{epochs / seconds:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""
+Measure cold import time of the prediction modules with ``python -X importtime``.
+
+For each module this runs a fresh interpreter several times, reports the best
+total import time and the heaviest top-level packages it pulled in.
+
+Usage:
+    python benchmarks/bench_import_time.py [--modules models.match_predictor ...] [--runs 3]
+"""
+import os
+import sys
+import argparse
+import subprocess
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_MODULES = ['models.match_predictor', 'models.numpy_predictor']
+# Heavy dependencies we want to keep off the prediction import path
+WATCHED_PACKAGES = ['tensorflow', 'matplotlib', 'seaborn', 'sklearn.metrics', 'sklearn', 'pandas', 'joblib']
+
+
+def import_profile(module):
+    """Return {top-level import: cumulative microseconds} for one cold import"""
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL='3')
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, text=True, cwd=ROOT, env=env, check=True
+    )
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        name = name.rstrip()
+        # Nested imports are indented by two spaces per level
+        depth = (len(name) - len(name.lstrip())) // 2
+        timings.setdefault(name.strip(), (int(cumulative), depth))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark module import time')
+    parser.add_argument('--modules', nargs='+', default=DEFAULT_MODULES)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    for module in args.modules:
+        profiles = [import_profile(module) for _ in range(args.runs)]
+        best = min(profiles, key=lambda profile: profile[module][0])
+        total_ms = best[module][0] / 1000
+
+        print(f"\n{module}: {total_ms:.0f} ms (best of {args.runs})")
+        loaded = [package for package in WATCHED_PACKAGES if package in best]
+        print(f"  heavy packages imported: {', '.join(loaded) if loaded else 'none'}")
+
+        direct_imports = sorted(
+            ((cumulative, name) for name, (cumulative, depth) in best.items() if depth == 1),
+            reverse=True
+        )
+        for cumulative, name in direct_imports[:args.top]:
+            print(f"  {cumulative / 1000:>8.0f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
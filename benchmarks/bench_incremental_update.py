@@ -0,0 +1,159 @@
+"""
+Daily update cost: full-season refetch vs AutoUpdater's incremental fetch.
+
+A local LeagueGameFinder stub serves one synthetic season and honours
+DateFrom. The data directory holds every game before the last ``--nights``
+game days, and both modes then pick up those nights' games:
+
+  full         fetch the whole season, rewrite the dataset twice (old behaviour)
+  incremental  AutoUpdater.update_data: fetch after the watermark, upsert into
+               the game store, update the feature store, append to the CSV
+
+The game store and feature store are seeded before the timer starts, as
+they are after the first run, so the incremental row is the steady-state
+nightly cost. Each stage is timed separately: fetch, upsert and CSV append
+grow with the nights' games, while the feature store holds a fixed window
+per team, so loading and saving it costs the same every night.
+
+Usage:
+    python benchmarks/bench_incremental_update.py [--rows 2460] [--nights 1 5]
+"""
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import importlib
+import tempfile
+import threading
+from collections import defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nba_api.stats.library.http import NBAStatsHTTP
+from api.services.http_client import create_session, install_nba_api_session
+from benchmarks.synthetic import make_games
+
+
+def make_handler(games_df, stats):
+    headers = list(games_df.columns)
+    dates = pd.to_datetime(games_df['GAME_DATE'])
+
+    class DateBoundStub(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            date_from = parse_qs(urlparse(self.path).query).get('DateFrom', [''])[0]
+            rows = games_df[dates >= pd.to_datetime(date_from)] if date_from else games_df
+            body = json.dumps({'resultSets': [{
+                'name': 'LeagueGameFinderResults',
+                'headers': headers,
+                'rowSet': json.loads(rows.to_json(orient='values'))
+            }]}).encode()
+            stats['bytes'] += len(body)
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return DateBoundStub
+
+
+def timed(obj, name, stage, timings):
+    """Wrap ``obj.name`` so its calls add their wall time to ``timings[stage]``"""
+    method = getattr(obj, name)
+
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            timings[stage] += time.perf_counter() - start
+
+    setattr(obj, name, wrapper)
+
+
+STAGES = ['fetch', 'upsert', 'features', 'csv']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark incremental AutoUpdater updates')
+    parser.add_argument('--rows', type=int, default=2460)
+    parser.add_argument('--nights', type=int, nargs='+', default=[1, 5])
+    args = parser.parse_args()
+
+    games = make_games(args.rows, start_date='2024-10-22')
+    game_days = sorted(games['GAME_DATE'].unique())
+
+    stats = {'bytes': 0}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), make_handler(games, stats))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    NBAStatsHTTP.base_url = f"http://127.0.0.1:{server.server_address[1]}/stats/{{endpoint}}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        # auto_update logs to logs/ relative to the working directory
+        os.chdir(directory)
+        os.makedirs('logs')
+        auto_update = importlib.import_module('scripts.auto_update')
+        logging.disable(logging.INFO)
+
+        print(f"{'mode':<24}" + ''.join(f"{stage:>10}" for stage in STAGES)
+              + f"{'total':>10}{'KB fetched':>12}{'rows written':>14}")
+        for nights in args.nights:
+            history = games[games['GAME_DATE'] < game_days[-nights]]
+            for mode in ['full', 'incremental']:
+                data_dir = os.path.join(directory, f'{mode}_{nights}')
+                updater = auto_update.AutoUpdater(data_dir=data_dir)
+                install_nba_api_session(create_session())
+                latest_path = os.path.join(data_dir, 'team_games_latest.csv')
+                history.to_csv(latest_path, index=False)
+                updater._save_watermark(history['GAME_DATE'].max(), len(history))
+                if mode == 'incremental':
+                    # One-time work done by the first run, outside the timed region
+                    updater._seed_game_store()
+                    updater._update_feature_store(history, rebuild=True)
+
+                timings = defaultdict(float)
+                timed(updater, 'fetch_all_games', 'fetch', timings)
+                timed(updater.game_store, 'new_rows', 'upsert', timings)
+                timed(updater.game_store, 'upsert', 'upsert', timings)
+                timed(updater, '_update_feature_store', 'features', timings)
+                timed(updater, '_append_games', 'csv', timings)
+
+                stats['bytes'] = 0
+                before = len(pd.read_csv(latest_path, usecols=['GAME_ID']))
+                start = time.perf_counter()
+                if mode == 'full':
+                    all_games = updater.fetch_all_games(season=updater.current_season)
+                    csv_start = time.perf_counter()
+                    all_games.to_csv(os.path.join(data_dir, 'team_games_20250101.csv'), index=False)
+                    all_games.to_csv(latest_path, index=False)
+                    timings['csv'] += time.perf_counter() - csv_start
+                    rows_written = 2 * len(all_games)
+                else:
+                    updater.update_data()
+                elapsed = time.perf_counter() - start
+                if mode == 'incremental':
+                    rows_written = len(pd.read_csv(latest_path, usecols=['GAME_ID'])) - before
+
+                label = f"{mode} ({nights} night{'s' if nights > 1 else ''})"
+                print(f"{label:<24}" + ''.join(f"{timings[stage]:>10.3f}" for stage in STAGES)
+                      + f"{elapsed:>10.3f}{stats['bytes'] / 1024:>12.1f}{rows_written:>14}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,87 @@
+"""
+Compare cold-start time and peak RSS of Keras vs NumPy inference.
+
+Each path runs in a fresh interpreter that imports its predictor, loads a
+saved model and scores one game.
+
+Usage:
+    python benchmarks/bench_inference_startup.py
+"""
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = '''
+import json, resource, sys, time
+start = time.perf_counter()
+sys.path.insert(0, {root!r})
+from models.features import MATCH_STAT_COLUMNS
+if {numpy!r}:
+    from models.numpy_predictor import NumpyMatchPredictor
+    predictor = NumpyMatchPredictor.load({filepath!r})
+else:
+    from models.match_predictor import NBAMatchPredictor
+    predictor = NBAMatchPredictor()
+    predictor.load_model({filepath!r})
+loaded = time.perf_counter()
+stats = {{column: 1.0 for column in MATCH_STAT_COLUMNS}}
+predictor.predict_match(1610612737.0, 1610612738.0, stats, stats)
+done = time.perf_counter()
+try:
+    # VmHWM resets on exec, unlike ru_maxrss which inherits the parent's peak
+    with open('/proc/self/status') as status:
+        max_rss_kb = next(int(line.split()[1]) for line in status if line.startswith('VmHWM'))
+except OSError:
+    max_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    'load_ms': (loaded - start) * 1000,
+    'first_prediction_ms': (done - loaded) * 1000,
+    'max_rss_mb': max_rss_kb / 1024
+}}))
+'''
+
+
+def export_model(directory):
+    """Save an untrained model with fitted encoder/scaler for the children to load"""
+    import numpy as np
+    import pandas as pd
+    from models.features import FEATURE_COLUMNS
+    from models.match_predictor import NBAMatchPredictor
+
+    predictor = NBAMatchPredictor()
+    predictor.team_encoder.fit((1610612737 + np.arange(30)).astype(float))
+    predictor.scaler.fit(pd.DataFrame(np.random.default_rng(0).normal(size=(100, 15)), columns=FEATURE_COLUMNS))
+    filepath = os.path.join(directory, 'match_predictor')
+    predictor.save_model(filepath)
+    return filepath
+
+
+def run_child(filepath, numpy):
+    code = CHILD.format(root=ROOT, filepath=filepath, numpy=numpy)
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL='3')
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = export_model(directory)
+        results = {
+            'keras': run_child(filepath, numpy=False),
+            'numpy': run_child(filepath, numpy=True)
+        }
+
+    print(f"\n{'engine':<8} {'import+load (ms)':>17} {'first predict (ms)':>19} {'peak RSS (MB)':>14}")
+    for engine, result in results.items():
+        print(f"{engine:<8} {result['load_ms']:>17.0f} {result['first_prediction_ms']:>19.1f} {result['max_rss_mb']:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Per-row cost of FT_DRAWING_RATE, MATCHUP parsing and opponent id mapping:
+the row-wise apply/iterrows versions vs the vectorized helpers in
+models/features.py.
+
+Usage:
+    python benchmarks/bench_matchup_features.py [--rows 2460 24600 123000] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.schema import apply_game_schema
+from models.features import ft_drawing_rate, opponent_team_ids, parse_matchup, team_abbreviation_map
+
+
+def row_wise(games_df):
+    games_df['FT_DRAWING_RATE'] = games_df.apply(lambda row: row['FTA'] / row['FGA'] if row['FGA'] > 0 else 0, axis=1)
+    matchup = games_df['MATCHUP'].astype(str)
+    games_df['IS_HOME'] = matchup.apply(lambda x: 1 if 'vs.' in x else 0)
+    games_df['OPPONENT_ABBREV'] = matchup.apply(lambda x: x.split()[-1] if '@' in x else x.split('vs.')[-1].strip())
+    team_abbrev_to_id = {}
+    for _, row in games_df.drop_duplicates('TEAM_ABBREVIATION')[['TEAM_ABBREVIATION', 'TEAM_ID']].iterrows():
+        team_abbrev_to_id[row['TEAM_ABBREVIATION']] = row['TEAM_ID']
+    games_df['OPPONENT_TEAM_ID'] = games_df['OPPONENT_ABBREV'].map(team_abbrev_to_id)
+
+
+def vectorized(games_df):
+    games_df['FT_DRAWING_RATE'] = ft_drawing_rate(games_df)
+    games_df['IS_HOME'], games_df['OPPONENT_ABBREV'] = parse_matchup(games_df['MATCHUP'])
+    games_df['OPPONENT_TEAM_ID'] = opponent_team_ids(games_df['OPPONENT_ABBREV'], team_abbreviation_map(games_df))
+
+
+def best_of(func, games_df, repeat):
+    times = []
+    for _ in range(repeat):
+        frame = games_df.copy()
+        start = time.perf_counter()
+        func(frame)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark row-wise vs vectorized matchup features')
+    parser.add_argument('--rows', type=int, nargs='+', default=[2460, 24600, 123000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'rows':>8}{'row-wise ms':>13}{'vectorized ms':>15}{'row-wise us/row':>17}{'vectorized us/row':>19}{'speedup':>9}")
+    for n_rows in args.rows:
+        games_df = apply_game_schema(make_games(n_rows))
+        slow = best_of(row_wise, games_df, args.repeat)
+        fast = best_of(vectorized, games_df, args.repeat)
+        print(f"{n_rows:>8}{slow * 1000:>13.1f}{fast * 1000:>15.2f}"
+              f"{slow / n_rows * 1e6:>17.2f}{fast / n_rows * 1e6:>19.3f}{slow / fast:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+"""
+Measure NBAApiService team endpoint latency with and without the TTL cache.
+
+Upstream calls are replaced by a stub that sleeps ``--upstream-ms`` and
+returns a canned payload, so the numbers isolate the caching layer. The
+"uncached" mode invalidates the cache before every call.
+
+Usage:
+    python benchmarks/bench_nba_api_cache.py [--calls 200] [--upstream-ms 150]
+"""
+import os
+import sys
+import time
+import argparse
+from unittest.mock import Mock, patch
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.services.nba_api import NBAApiService
+
+
+def stub_get(delay):
+    def get(url, **kwargs):
+        time.sleep(delay)
+        response = Mock()
+        response.json.return_value = {'resultSets': [{'rowSet': [list(range(16))]}]}
+        return response
+    return get
+
+
+def measure(service, calls, team_ids, invalidate):
+    latencies = []
+    for i in range(calls):
+        if invalidate:
+            service.cache.invalidate()
+        start = time.perf_counter()
+        service.get_team_stats(team_ids[i % len(team_ids)])
+        latencies.append(time.perf_counter() - start)
+    return np.array(latencies) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the NBAApiService cache')
+    parser.add_argument('--calls', type=int, default=200)
+    parser.add_argument('--teams', type=int, default=30)
+    parser.add_argument('--upstream-ms', type=float, default=150)
+    args = parser.parse_args()
+
+    team_ids = list(range(1, args.teams + 1))
+    service = NBAApiService()
+    try:
+        with patch('requests.Session.get', side_effect=stub_get(args.upstream_ms / 1000)):
+            uncached = measure(service, args.calls, team_ids, invalidate=True)
+            # Warm every team once so the cached pass measures steady state
+            service.cache.invalidate()
+            measure(service, len(team_ids), team_ids, invalidate=False)
+            cached = measure(service, args.calls, team_ids, invalidate=False)
+    finally:
+        service.shutdown()
+
+    print(f"{'mode':<10}{'p50 ms':>10}{'p99 ms':>10}")
+    for name, latencies in [('uncached', uncached), ('cached', cached)]:
+        print(f"{name:<10}{np.percentile(latencies, 50):>10.3f}{np.percentile(latencies, 99):>10.3f}")
+    print(f"cache stats: {service.cache.stats()}")
+
+
+if __name__ == '__main__':
+    main()
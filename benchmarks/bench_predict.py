@@ -0,0 +1,63 @@
+"""
+Benchmark per-game predict_match calls against one batched predict_matches call.
+
+Usage:
+    python benchmarks/bench_predict.py [--games 15 1000]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.match_predictor import NBAMatchPredictor
+
+
+def legacy_predict_match(predictor, home_team_id, away_team_id, home_team_stats):
+    """Previous per-game path: build a 1x15 array and call model.predict"""
+    from models.features import MATCH_STAT_COLUMNS
+    home_team_encoded = predictor.team_encoder.transform([home_team_id])[0]
+    away_team_encoded = predictor.team_encoder.transform([away_team_id])[0]
+    features = np.array([[home_team_encoded, away_team_encoded, 1] +
+                         [home_team_stats[col] for col in MATCH_STAT_COLUMNS]])
+    features = predictor.scaler.transform(features)
+    return predictor.model.predict(features, verbose=0)[0][0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark batched match prediction')
+    parser.add_argument('--games', type=int, nargs='+', default=[15, 1000])
+    args = parser.parse_args()
+
+    predictor = NBAMatchPredictor()
+    processed_df = predictor.prepare_features(make_games(5500))
+    predictor.create_feature_matrix(processed_df)  # fits the scaler
+
+    print(f"\n{'games':>6} {'per-game predict (s)':>21} {'predict_matches (s)':>20} {'speedup':>8}")
+    for n_games in args.games:
+        slate = processed_df.sample(n_games, replace=True, random_state=0)
+        home_ids = slate['TEAM_ID'].to_numpy()
+        away_ids = slate['OPPONENT_TEAM_ID'].to_numpy()
+        stats = slate.to_dict('records')
+
+        predictor.predict_matches(home_ids[:1], away_ids[:1], stats[:1])  # warm-up
+
+        start = time.perf_counter()
+        looped = [legacy_predict_match(predictor, h, a, s) for h, a, s in zip(home_ids, away_ids, stats)]
+        looped_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batched = predictor.predict_matches(home_ids, away_ids, slate)
+        batched_time = time.perf_counter() - start
+
+        assert np.allclose(looped, batched, atol=1e-5), 'batched predictions differ'
+        print(f"{n_games:>6} {looped_time:>21.3f} {batched_time:>20.4f} {looped_time / batched_time:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
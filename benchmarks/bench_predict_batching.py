@@ -0,0 +1,85 @@
+"""
+Load test the /predict scoring path with and without micro-batching.
+
+Simulates 1, 10 and 100 concurrent clients on one event loop. The
+"unbatched" mode calls predict_match inline like the previous handler did;
+the "batched" mode goes through api.services.prediction_batcher.
+
+Usage:
+    python benchmarks/bench_predict_batching.py [--requests 400] [--window-ms 5]
+"""
+import os
+import sys
+import time
+import asyncio
+import argparse
+
+import numpy as np
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.match_predictor import NBAMatchPredictor
+from api.services.prediction_batcher import PredictionBatcher
+
+
+async def run_clients(predict, requests, concurrency):
+    """Issue the requests from ``concurrency`` clients; return (req/s, latencies)"""
+    latencies = []
+    pending = iter(requests)
+
+    async def client():
+        for request in pending:
+            start = time.perf_counter()
+            result = await predict(*request)
+            latencies.append(time.perf_counter() - start)
+            assert result is not None
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return len(requests) / (time.perf_counter() - start), np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test prediction micro-batching')
+    parser.add_argument('--requests', type=int, default=400)
+    parser.add_argument('--window-ms', type=float, default=5.0)
+    parser.add_argument('--max-batch-size', type=int, default=64)
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 10, 100])
+    args = parser.parse_args()
+
+    predictor = NBAMatchPredictor()
+    processed_df = predictor.prepare_features(make_games(2000))
+    predictor.create_feature_matrix(processed_df)
+
+    sample = processed_df.sample(args.requests, replace=True, random_state=0)
+    requests = [
+        (row['TEAM_ID'], row['OPPONENT_TEAM_ID'], row, row)
+        for row in sample.to_dict('records')
+    ]
+
+    async def unbatched(*request):
+        return predictor.predict_match(*request)
+
+    async def benchmark():
+        print(f"\n{'clients':>7} {'mode':<10} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'batches':>8}")
+        for concurrency in args.clients:
+            batcher = PredictionBatcher(predictor, max_batch_size=args.max_batch_size, max_wait_ms=args.window_ms)
+            await batcher.predict(*requests[0])  # warm-up / trace
+            predictor.predict_match(*requests[0])
+
+            for mode, predict in [('unbatched', unbatched), ('batched', batcher.predict)]:
+                served_before = batcher.batches_run
+                throughput, latencies = await run_clients(predict, requests, concurrency)
+                batches = batcher.batches_run - served_before if mode == 'batched' else len(requests)
+                print(f"{concurrency:>7} {mode:<10} {throughput:>8.0f} "
+                      f"{np.percentile(latencies, 50) * 1000:>8.1f} {np.percentile(latencies, 99) * 1000:>8.1f} "
+                      f"{batches:>8}")
+            await batcher.close()
+
+    asyncio.run(benchmark())
+
+
+if __name__ == "__main__":
+    main()
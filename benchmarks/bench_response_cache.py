@@ -0,0 +1,73 @@
+"""
+Cold vs warm multi-season backfill through the on-disk response cache.
+
+Runs NBADataFetcher.fetch_seasons twice against a local LeagueGameFinder
+stub with a DiskResponseCache in a temporary directory. Finished seasons
+never expire, so the warm run should make no upstream requests.
+
+Usage:
+    python benchmarks/bench_response_cache.py [--seasons 3] [--latency-ms 200]
+"""
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+import threading
+from http.server import ThreadingHTTPServer
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nba_api.stats.library.http import NBAStatsHTTP
+from api.services.http_client import create_session
+from api.services.response_cache import DiskResponseCache
+from benchmarks.bench_fetch_all_team_games import make_handler
+from benchmarks.synthetic import make_games
+from scripts.data_fetcher import NBADataFetcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the on-disk response cache')
+    parser.add_argument('--seasons', type=int, default=3)
+    parser.add_argument('--latency-ms', type=float, default=200)
+    parser.add_argument('--rate', type=float, default=20, help='requests per second')
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    requests_seen = []
+    base_handler = make_handler(make_games(2460), args.latency_ms / 1000)
+
+    class CountingHandler(base_handler):
+        def do_GET(self):
+            requests_seen.append(self.path)
+            super().do_GET()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    NBAStatsHTTP.base_url = f"http://127.0.0.1:{server.server_address[1]}/stats/{{endpoint}}"
+
+    seasons = [f"{2010 + i}-{str(2011 + i)[2:]}" for i in range(args.seasons)]
+    with tempfile.TemporaryDirectory() as directory:
+        cache = DiskResponseCache(directory)
+        session = create_session(pool_size=args.workers, cache=cache)
+
+        print(f"{'run':<8}{'seconds':>10}{'upstream':>10}{'rows':>8}")
+        for label in ['cold', 'warm']:
+            fetcher = NBADataFetcher(max_workers=args.workers, requests_per_second=args.rate, session=session)
+            before = len(requests_seen)
+            start = time.perf_counter()
+            games = fetcher.fetch_seasons(seasons)
+            elapsed = time.perf_counter() - start
+            print(f"{label:<8}{elapsed:>10.2f}{len(requests_seen) - before:>10}{len(games):>8}")
+
+        print(f"cache stats: {cache.stats()}")
+
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Rolling features: the groupby.transform(rolling) loop vs one sort and
+the prefix-sum window kernel (models.features.trailing_window_stats).
+
+The loop is what prepare_features ran before: 20 rolling means (10 stats
+x windows 5 and 10) plus FT_DRAWING_RATE, WIN_STREAK and OVERTIME_RATE,
+each its own groupby pass over rows in CSV order (newest first). The new
+path sorts once by (TEAM_ID, GAME_DATE) and derives every window from
+one cumulative sum over the sorted stats matrix, using only earlier games.
+
+Usage:
+    python benchmarks/bench_rolling_features.py [--seasons 1 10] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.features import ft_drawing_rate, trailing_window_stats
+
+FEATURES = ['PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'FTA', 'TOV', 'STL', 'BLK']
+WINDOWS = [5, 10]
+
+
+def transform_loop(games_df):
+    for feature in FEATURES:
+        for window in WINDOWS:
+            games_df[f'{feature}_ROLLING_AVG_{window}'] = games_df.groupby('TEAM_ID')[feature].transform(
+                lambda x: x.rolling(window=window, min_periods=1).mean()
+            )
+    games_df['FT_DRAWING_RATE_ROLLING_AVG_5'] = games_df.groupby('TEAM_ID')['FT_DRAWING_RATE'].transform(
+        lambda x: x.rolling(window=5, min_periods=1).mean()
+    )
+    games_df['WIN_STREAK'] = games_df.groupby('TEAM_ID')['WIN'].transform(
+        lambda x: x.rolling(window=5, min_periods=1).sum()
+    )
+    games_df['OVERTIME_RATE'] = games_df.groupby('TEAM_ID')['IS_OVERTIME'].transform(
+        lambda x: x.rolling(window=10, min_periods=1).mean()
+    )
+    return games_df
+
+
+def sorted_cumulative(games_df):
+    games_df = games_df.sort_values(['TEAM_ID', 'GAME_DATE'], kind='stable')
+    window_stats = trailing_window_stats(games_df, FEATURES + ['FT_DRAWING_RATE', 'WIN', 'IS_OVERTIME'], WINDOWS)
+    means = {window: sums / counts.where(counts > 0) for window, (sums, counts) in window_stats.items()}
+    for feature in FEATURES:
+        for window in WINDOWS:
+            games_df[f'{feature}_ROLLING_AVG_{window}'] = means[window][feature]
+    games_df['FT_DRAWING_RATE_ROLLING_AVG_5'] = means[5]['FT_DRAWING_RATE']
+    games_df['WIN_STREAK'] = window_stats[5][0]['WIN']
+    games_df['OVERTIME_RATE'] = means[10]['IS_OVERTIME']
+    return games_df
+
+
+def best_of(func, games_df, repeat):
+    times = []
+    for _ in range(repeat):
+        frame = games_df.copy()
+        start = time.perf_counter()
+        func(frame)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark rolling feature computation')
+    parser.add_argument('--seasons', type=int, nargs='+', default=[1, 10])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'seasons':>8}{'rows':>8}{'transform loop ms':>19}{'sorted cumsum ms':>18}{'speedup':>9}")
+    for seasons in args.seasons:
+        games_df = make_games(2460 * seasons)
+        games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+        games_df['WIN'] = (games_df['WL'] == 'W').astype(np.int8)
+        games_df['IS_OVERTIME'] = (games_df['MIN'] > 240).astype(np.int8)
+        games_df['FT_DRAWING_RATE'] = ft_drawing_rate(games_df)
+        # LeagueGameFinder order
+        games_df = games_df.sort_values('GAME_DATE', ascending=False, kind='stable').reset_index(drop=True)
+
+        loop_ms = best_of(transform_loop, games_df, args.repeat)
+        cumsum_ms = best_of(sorted_cumulative, games_df, args.repeat)
+        print(f"{seasons:>8}{len(games_df):>8}{loop_ms:>19.1f}{cumsum_ms:>18.1f}{loop_ms / cumsum_ms:>8.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Multi-window rolling sums: per-window pandas groupby passes vs the single
+NumPy prefix-sum kernel (models.features.rolling_window_sums).
+
+The "transform" column is one groupby(...).transform(rolling) per stat and
+window, as prepare_features originally did. The "grouped cumsum" column is
+the pandas version that replaced it: one grouped cumulative sum plus two
+grouped shifts per window. The kernel takes one prefix sum over the sorted
+stats matrix and reads every window off it with two gathers, so wider
+window sets add little.
+
+Usage:
+    python benchmarks/bench_rolling_windows.py [--seasons 10] [--repeat 3]
+"""
+import os
+import sys
+import time
+import argparse
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.features import ft_drawing_rate, rolling_window_sums
+
+COLUMNS = ['PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'FTA', 'TOV', 'STL', 'BLK',
+           'FT_DRAWING_RATE', 'WIN', 'IS_OVERTIME']
+WINDOW_SETS = [[5, 10], [3, 5, 10, 20], [3, 5, 7, 10, 15, 20, 30, 40]]
+
+
+def transform_loop(games_df, windows):
+    grouped = games_df.groupby('TEAM_ID')
+    for column in COLUMNS:
+        for window in windows:
+            grouped[column].transform(lambda x: x.shift(1).rolling(window=window, min_periods=1).mean())
+
+
+def grouped_cumsum(games_df, windows):
+    values = games_df[COLUMNS].astype(np.float64)
+    keys = games_df['TEAM_ID'].to_numpy()
+    totals = pd.concat([values.fillna(0), values.notna().astype(np.float64)], axis=1, keys=['sum', 'count'])
+    grouped = totals.groupby(keys, sort=False).cumsum().groupby(keys, sort=False)
+    before = grouped.shift(1, fill_value=0)
+    for window in windows:
+        in_window = before - grouped.shift(window + 1, fill_value=0)
+        in_window['sum'] / in_window['count'].where(in_window['count'] > 0)
+
+
+def kernel(games_df, windows):
+    sums, counts = rolling_window_sums(games_df[COLUMNS].to_numpy(dtype=np.float64), games_df['TEAM_ID'].to_numpy(), windows)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        sums / np.where(counts > 0, counts, np.nan)
+
+
+def best_of(func, games_df, windows, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(games_df, windows)
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark multi-window rolling aggregation')
+    parser.add_argument('--seasons', type=int, default=10)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    games_df = make_games(2460 * args.seasons)
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    games_df['WIN'] = (games_df['WL'] == 'W').astype(np.int8)
+    games_df['IS_OVERTIME'] = (games_df['MIN'] > 240).astype(np.int8)
+    games_df['FT_DRAWING_RATE'] = ft_drawing_rate(games_df)
+    games_df = games_df.sort_values(['TEAM_ID', 'GAME_DATE'], kind='stable').reset_index(drop=True)
+
+    print(f"\n{len(games_df)} rows, {len(COLUMNS)} stats")
+    print(f"{'windows':<26}{'transform ms':>14}{'grouped cumsum ms':>19}{'kernel ms':>11}{'vs cumsum':>11}")
+    for windows in WINDOW_SETS:
+        loop_ms = best_of(transform_loop, games_df, windows, args.repeat)
+        cumsum_ms = best_of(grouped_cumsum, games_df, windows, args.repeat)
+        kernel_ms = best_of(kernel, games_df, windows, args.repeat)
+        label = '/'.join(str(window) for window in windows)
+        print(f"{label:<26}{loop_ms:>14.1f}{cumsum_ms:>19.1f}{kernel_ms:>11.1f}{cumsum_ms / kernel_ms:>10.1f}x")
+
+
+if __name__ == '__main__':
+    main()
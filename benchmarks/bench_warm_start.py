@@ -0,0 +1,73 @@
+"""
+Nightly retraining: a full NBAMatchPredictor.train from random weights vs
+loading the saved model and fine-tuning it on the newest night of games
+plus a replay sample (NBAMatchPredictor.fine_tune).
+
+Runs in a temporary directory because train() writes its plots and
+TensorBoard logs relative to the working directory.
+
+Usage:
+    python benchmarks/bench_warm_start.py [--seasons 2] [--replay-size 2000] [--fine-tune-epochs 5]
+"""
+import os
+import sys
+import time
+import argparse
+import tempfile
+
+import pandas as pd
+
+# Add parent directory to path for imports
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(ROOT)
+
+from benchmarks.synthetic import make_games
+from data.schema import apply_game_schema
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark full retraining vs warm-start fine-tuning')
+    parser.add_argument('--seasons', type=int, default=2)
+    parser.add_argument('--replay-size', type=int, default=2000)
+    parser.add_argument('--fine-tune-epochs', type=int, default=5)
+    args = parser.parse_args()
+
+    from models.match_predictor import NBAMatchPredictor
+
+    games_df = apply_game_schema(make_games(2460 * args.seasons))
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    last_night = games_df['GAME_DATE'].max()
+    history = games_df[games_df['GAME_DATE'] < last_night]
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.chdir(directory)
+        os.makedirs('models')
+
+        start = time.perf_counter()
+        predictor = NBAMatchPredictor()
+        predictor.train(history.copy(), verbose=0)
+        predictor.save_model('models/match_predictor')
+        history_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        NBAMatchPredictor().train(games_df.copy(), verbose=0)
+        full_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        warm = NBAMatchPredictor()
+        warm.load_model('models/match_predictor')
+        result = warm.fine_tune(games_df.copy(), epochs=args.fine_tune_epochs, replay_size=args.replay_size)
+        warm_s = time.perf_counter() - start
+        os.chdir(ROOT)
+
+    new_rows = int((games_df['GAME_DATE'] == last_night).sum())
+    print(f"\n{len(games_df)} rows, {new_rows} new rows from the last night")
+    print(f"{'nightly retrain':<38}{'seconds':>9}")
+    print(f"{'full train from scratch':<38}{full_s:>9.1f}")
+    print(f"{'load + fine-tune (' + str(args.fine_tune_epochs) + ' epochs)':<38}{warm_s:>9.1f}{full_s / warm_s:>8.1f}x")
+    print(f"(initial training on the history took {history_s:.1f}s; "
+          f"fine-tune {'ran' if result is not None else 'was declined'})")
+
+
+if __name__ == '__main__':
+    main()
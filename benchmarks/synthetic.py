@@ -0,0 +1,77 @@
+"""
+Synthetic LeagueGameFinder-shaped data for benchmarks.
+"""
+import numpy as np
+import pandas as pd
+
+NUM_TEAMS = 30
+FIRST_TEAM_ID = 1610612737
+
+
+def make_games(n_rows, seed=42, start_date='2015-10-01'):
+    """Build ``n_rows`` team-game rows (two per game) with realistic columns"""
+    rng = np.random.default_rng(seed)
+    n_games = max(n_rows // 2, 1)
+
+    team_ids = FIRST_TEAM_ID + np.arange(NUM_TEAMS)
+    abbrevs = np.array([f'T{i:02d}' for i in range(NUM_TEAMS)])
+
+    home = rng.integers(0, NUM_TEAMS, n_games)
+    away = (home + rng.integers(1, NUM_TEAMS, n_games)) % NUM_TEAMS
+    # Roughly 15 games a night, spread over consecutive days
+    dates = pd.Timestamp(start_date) + pd.to_timedelta(np.arange(n_games) // 15, unit='D')
+    seasons = 20000 + dates.year.to_numpy() - (dates.month.to_numpy() < 10)
+    home_wins = rng.random(n_games) < 0.56
+
+    team = np.concatenate([home, away])[:n_rows]
+    opp = np.concatenate([away, home])[:n_rows]
+    is_home = np.concatenate([np.ones(n_games, bool), np.zeros(n_games, bool)])[:n_rows]
+    win = np.concatenate([home_wins, ~home_wins])[:n_rows]
+    game_idx = np.concatenate([np.arange(n_games), np.arange(n_games)])[:n_rows]
+    n = len(team)
+
+    fga = rng.integers(75, 100, n)
+    fgm = (fga * rng.uniform(0.38, 0.55, n)).astype(int)
+    fg3a = rng.integers(25, 45, n)
+    fg3m = (fg3a * rng.uniform(0.25, 0.45, n)).astype(int)
+    fta = rng.integers(10, 35, n)
+    ftm = (fta * rng.uniform(0.65, 0.9, n)).astype(int)
+    oreb = rng.integers(5, 15, n)
+    dreb = rng.integers(28, 40, n)
+
+    matchup = np.where(
+        is_home,
+        np.char.add(np.char.add(abbrevs[team], ' vs. '), abbrevs[opp]),
+        np.char.add(np.char.add(abbrevs[team], ' @ '), abbrevs[opp])
+    )
+
+    return pd.DataFrame({
+        'SEASON_ID': seasons[game_idx].astype(int),
+        'TEAM_ID': team_ids[team],
+        'TEAM_ABBREVIATION': abbrevs[team],
+        'TEAM_NAME': np.char.add('Team ', abbrevs[team]),
+        'GAME_ID': np.char.zfill((20000000 + game_idx).astype(str), 10),
+        'GAME_DATE': dates[game_idx].strftime('%Y-%m-%d'),
+        'MATCHUP': matchup,
+        'WL': np.where(win, 'W', 'L'),
+        'MIN': np.where(rng.random(n) < 0.06, 265, 240),
+        'PTS': 2 * fgm + fg3m + ftm,
+        'FGM': fgm,
+        'FGA': fga,
+        'FG_PCT': np.round(fgm / fga, 3),
+        'FG3M': fg3m,
+        'FG3A': fg3a,
+        'FG3_PCT': np.round(fg3m / fg3a, 3),
+        'FTM': ftm,
+        'FTA': fta,
+        'FT_PCT': np.round(ftm / fta, 3),
+        'OREB': oreb,
+        'DREB': dreb,
+        'REB': oreb + dreb,
+        'AST': rng.integers(18, 35, n),
+        'STL': rng.integers(3, 14, n),
+        'BLK': rng.integers(1, 10, n),
+        'TOV': rng.integers(8, 20, n),
+        'PF': rng.integers(14, 26, n),
+        'PLUS_MINUS': np.round(rng.normal(0, 12, n), 1),
+    })
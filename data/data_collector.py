@@ -1,6 +1,7 @@
-import pandas as pd
 import logging
 
+from data.schema import read_games_csv
+
 class NBADataCollector:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
@@ -9,7 +10,7 @@ class NBADataCollector:
         """Load and preprocess training data"""
         try:
             # Load existing data
-            training_data = pd.read_csv('data/team_games_20250519.csv')
+            training_data = read_games_csv('data/team_games_20250519.csv')
             self.logger.info(f"Loaded {len(training_data)} training samples")
             return training_data
         except Exception as e:
@@ -0,0 +1,236 @@
+import os
+import sys
+import time
+import uuid
+import logging
+import argparse
+from datetime import datetime
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from data.schema import apply_game_schema, read_games_csv
+
+logger = logging.getLogger(__name__)
+
+PARTITION_COLUMN = 'SEASON_ID'
+# One row per team per game, so both perspectives of a game are kept
+PRIMARY_KEY = ['GAME_ID', 'TEAM_ID']
+# Write sequence stamped on every row; the highest batch wins for a key
+BATCH_COLUMN = '_BATCH'
+
+
+class GameStore:
+    """Parquet store of team-game rows partitioned by SEASON_ID
+
+    Each partition lives in ``<root>/SEASON_ID=<id>/`` (hive layout) and
+    holds one or more part files. Rows are stored with typed columns:
+    GAME_ID as its 10-character string and GAME_DATE as a date. Loaded
+    frames use the compact dtypes of data.schema.
+
+    Rows are keyed by (GAME_ID, TEAM_ID). upsert() only writes the new rows,
+    stamped with a write batch; readers keep the newest batch for each key,
+    and compact() drops the superseded rows from disk.
+    """
+
+    def __init__(self, root=os.path.join('data', 'game_store')):
+        self.root = root
+
+    @staticmethod
+    def _normalize(games_df):
+        """Coerce the key columns to the store's types"""
+        games_df = games_df.copy()
+        # Parquet gets plain columns; categoricals are restored by load()
+        for column in games_df.select_dtypes('category').columns:
+            games_df[column] = games_df[column].astype(object)
+        missing_keys = [column for column in [PARTITION_COLUMN] + PRIMARY_KEY if column not in games_df.columns]
+        if missing_keys:
+            raise ValueError(f"Game rows are missing key columns: {missing_keys}")
+
+        games_df[PARTITION_COLUMN] = games_df[PARTITION_COLUMN].astype('int64')
+        games_df['TEAM_ID'] = games_df['TEAM_ID'].astype('int64')
+        games_df['GAME_ID'] = games_df['GAME_ID'].astype(str).str.zfill(10)
+        if 'GAME_DATE' in games_df.columns:
+            games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+        return games_df
+
+    def _partition_dir(self, season_id):
+        return os.path.join(self.root, f'{PARTITION_COLUMN}={int(season_id)}')
+
+    def _conform(self, table, schema):
+        """Cast ``table`` to the stored schema so every part file reads back alike"""
+        extra_columns = [name for name in table.column_names if schema.get_field_index(name) < 0]
+        if extra_columns:
+            logger.warning(f"Dropping columns not present in {self.root}: {extra_columns}")
+        columns = [
+            table.column(field.name).cast(field.type) if field.name in table.column_names
+            else pa.nulls(len(table), type=field.type)
+            for field in schema
+        ]
+        return pa.Table.from_arrays(columns, schema=schema)
+
+    def _write(self, games_df):
+        # Within one write the last row for a key wins, as it would across writes
+        games_df = games_df.drop_duplicates(PRIMARY_KEY, keep='last')
+        games_df = games_df.assign(**{BATCH_COLUMN: time.time_ns()})
+
+        schema = None
+        if not self.is_empty():
+            stored = self._dataset().schema
+            schema = stored.remove(stored.get_field_index(PARTITION_COLUMN))
+
+        for season_id, season_games in games_df.groupby(PARTITION_COLUMN, sort=True):
+            partition_dir = self._partition_dir(season_id)
+            os.makedirs(partition_dir, exist_ok=True)
+            part_name = f"part-{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}.parquet"
+            table = pa.Table.from_pandas(season_games.drop(columns=[PARTITION_COLUMN]), preserve_index=False)
+            if schema is not None:
+                table = self._conform(table, schema.remove_metadata())
+            # Write then rename so readers never see a partial file
+            tmp_path = os.path.join(partition_dir, f'.{part_name}.tmp')
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, os.path.join(partition_dir, part_name))
+
+    def upsert(self, games_df):
+        """Insert or replace rows by (GAME_ID, TEAM_ID); returns the number of rows written
+
+        Only ``games_df`` is written, so the cost is proportional to the new rows.
+        """
+        if games_df.empty:
+            return 0
+        self._write(self._normalize(games_df))
+        logger.info(f"Upserted {len(games_df)} rows into {self.root}")
+        return len(games_df)
+
+    def replace(self, games_df):
+        """Overwrite every season partition present in ``games_df`` with its rows"""
+        if games_df.empty:
+            return 0
+        games_df = self._normalize(games_df)
+        # New parts are written before the old ones go, so a failed write loses nothing
+        old_parts = [
+            os.path.join(self._partition_dir(season_id), name)
+            for season_id in games_df[PARTITION_COLUMN].unique()
+            if os.path.isdir(self._partition_dir(season_id))
+            for name in os.listdir(self._partition_dir(season_id))
+        ]
+        self._write(games_df)
+        for path in old_parts:
+            os.remove(path)
+        logger.info(f"Wrote {len(games_df)} rows to {self.root}")
+        return len(games_df)
+
+    def seasons(self):
+        """SEASON_IDs with stored data"""
+        if not os.path.isdir(self.root):
+            return []
+        prefix = f'{PARTITION_COLUMN}='
+        return sorted(
+            int(name[len(prefix):]) for name in os.listdir(self.root)
+            if name.startswith(prefix) and os.listdir(os.path.join(self.root, name))
+        )
+
+    def part_counts(self):
+        """Number of part files in each season partition"""
+        return {
+            season_id: sum(name.endswith('.parquet') for name in os.listdir(self._partition_dir(season_id)))
+            for season_id in self.seasons()
+        }
+
+    def is_empty(self):
+        return not self.seasons()
+
+    def _dataset(self):
+        partitioning = ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.int64())]), flavor='hive')
+        dataset = ds.dataset(self.root, format='parquet', partitioning=partitioning)
+        if dataset.schema.get_field_index(BATCH_COLUMN) < 0:
+            # Parts written before batches existed read back as the oldest batch
+            schema = dataset.schema.append(pa.field(BATCH_COLUMN, pa.int64()))
+            dataset = ds.dataset(self.root, format='parquet', partitioning=partitioning, schema=schema)
+        return dataset
+
+    @staticmethod
+    def _latest_rows(games_df):
+        """Keep the newest batch of every (GAME_ID, TEAM_ID), preserving row order"""
+        if not games_df.duplicated(PRIMARY_KEY).any():
+            return games_df
+        latest = (
+            games_df.sort_values(BATCH_COLUMN, kind='stable', na_position='first')
+            .drop_duplicates(PRIMARY_KEY, keep='last')
+        )
+        return games_df.loc[latest.index.sort_values()].reset_index(drop=True)
+
+    def load(self, columns=None, seasons=None):
+        """Read the current row for each key, optionally only some columns and SEASON_IDs"""
+        if self.is_empty():
+            return pd.DataFrame(columns=columns)
+
+        dataset = self._dataset()
+        filter_expression = None
+        if seasons is not None:
+            filter_expression = ds.field(PARTITION_COLUMN).isin([int(season) for season in seasons])
+
+        # The key and batch columns are always needed to resolve upserts
+        read_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys(list(columns) + PRIMARY_KEY + [BATCH_COLUMN]))
+
+        table = dataset.to_table(columns=read_columns, filter=filter_expression)
+        games_df = self._latest_rows(table.to_pandas())
+        if columns is None:
+            # Keep the partition column first, as in the API results
+            columns = [PARTITION_COLUMN] + [c for c in games_df.columns if c not in (PARTITION_COLUMN, BATCH_COLUMN)]
+        return apply_game_schema(games_df[list(columns)])
+
+    def new_rows(self, games_df):
+        """Rows of ``games_df`` whose (GAME_ID, TEAM_ID) is not stored yet"""
+        if games_df.empty or self.is_empty():
+            return games_df
+        keys = self._normalize(games_df[[PARTITION_COLUMN] + PRIMARY_KEY])
+        stored = self.load(columns=PRIMARY_KEY, seasons=keys[PARTITION_COLUMN].unique())
+        stored_keys = pd.MultiIndex.from_arrays([stored['GAME_ID'].astype(str), stored['TEAM_ID'].astype('int64')])
+        is_new = ~pd.MultiIndex.from_frame(keys[PRIMARY_KEY]).isin(stored_keys)
+        return games_df[is_new]
+
+    def latest_game_date(self):
+        """Most recent GAME_DATE as YYYY-MM-DD, or None when the store is empty"""
+        if self.is_empty():
+            return None
+        dates = self._dataset().to_table(columns=['GAME_DATE']).column('GAME_DATE')
+        latest = pc.max(dates).as_py()
+        return latest.strftime('%Y-%m-%d') if latest is not None else None
+
+    def compact(self, seasons=None):
+        """Rewrite each partition as a single file without superseded rows"""
+        for season_id in seasons or self.seasons():
+            season_games = self.load(seasons=[season_id])
+            if not season_games.empty:
+                self.replace(season_games)
+
+    def import_csv(self, path):
+        """Load a LeagueGameFinder CSV export into the store, replacing its seasons"""
+        return self.replace(read_games_csv(path))
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Manage the partitioned Parquet game store')
+    parser.add_argument('--root', default=os.path.join('data', 'game_store'))
+    parser.add_argument('--import-csv', help='CSV file to load into the store')
+    parser.add_argument('--compact', action='store_true', help='Rewrite each season partition as one file')
+    args = parser.parse_args()
+
+    store = GameStore(args.root)
+    if args.import_csv:
+        store.import_csv(args.import_csv)
+    if args.compact:
+        store.compact()
+    logger.info(f"Store at {store.root} holds seasons {store.seasons()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+# Compact dtypes for LeagueGameFinder team-game columns. Strings repeated across
+# rows are categorical, counting stats fit in 8/16-bit ints and percentages in
+# float32. GAME_ID keeps its leading zeros.
+GAME_DTYPES = {
+    'SEASON_ID': 'int32',
+    'TEAM_ID': 'int32',
+    'TEAM_ABBREVIATION': 'category',
+    'TEAM_NAME': 'category',
+    'GAME_ID': 'string[pyarrow]',
+    'MATCHUP': 'category',
+    'WL': 'category',
+    'MIN': 'int16',
+    'PTS': 'int16',
+    'FGM': 'int8',
+    'FGA': 'int16',
+    'FG_PCT': 'float32',
+    'FG3M': 'int8',
+    'FG3A': 'int8',
+    'FG3_PCT': 'float32',
+    'FTM': 'int8',
+    'FTA': 'int8',
+    'FT_PCT': 'float32',
+    'OREB': 'int8',
+    'DREB': 'int8',
+    'REB': 'int8',
+    'AST': 'int8',
+    'STL': 'int8',
+    'BLK': 'int8',
+    'TOV': 'int8',
+    'PF': 'int8',
+    'PLUS_MINUS': 'float32',
+}
+
+DATE_COLUMNS = ['GAME_DATE']
+
+
+def _is_integer(dtype):
+    return pd.api.types.is_integer_dtype(pd.api.types.pandas_dtype(dtype))
+
+
+def _integer_dtype(series, dtype):
+    """``dtype`` if every value of ``series`` fits it, float32 when values are missing"""
+    if series.isna().any():
+        return 'float32'
+    bounds = np.iinfo(dtype)
+    if len(series) and (series.min() < bounds.min or series.max() > bounds.max):
+        return series.dtype
+    return dtype
+
+
+def apply_game_schema(games_df):
+    """Cast the known game columns of ``games_df`` to GAME_DTYPES
+
+    Integer columns with missing values become float32, and ones whose values
+    do not fit the narrow type are left alone. Other columns are unchanged.
+    """
+    conversions = {}
+    for column, dtype in GAME_DTYPES.items():
+        if column not in games_df.columns or games_df[column].dtype == dtype:
+            continue
+        if _is_integer(dtype):
+            dtype = _integer_dtype(games_df[column], dtype)
+        conversions[column] = dtype
+
+    for column in DATE_COLUMNS:
+        if column in games_df.columns and not pd.api.types.is_datetime64_any_dtype(games_df[column]):
+            conversions[column] = 'datetime64[ns]'
+
+    return games_df.astype(conversions) if conversions else games_df
+
+
+def read_games_csv(path, **kwargs):
+    """pd.read_csv for team-game files, returning the compact schema"""
+    header = pd.read_csv(path, nrows=0).columns
+    # Strings and floats are parsed straight into their types; integers are
+    # downcast afterwards so a blank cell cannot fail the read
+    dtype = {
+        column: dtype for column, dtype in GAME_DTYPES.items()
+        if column in header and not _is_integer(dtype)
+    }
+    dtype.update(kwargs.pop('dtype', None) or {})
+    return apply_game_schema(pd.read_csv(path, dtype=dtype, **kwargs))
@@ -0,0 +1,207 @@
+"""
+Persistent per-team feature state, updated one game at a time.
+
+Usage:
+    python -m models.feature_store [--csv data/team_games_latest.csv]
+"""
+import os
+import sys
+import logging
+import argparse
+from collections import deque
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from models.features import MATCH_STAT_COLUMNS, ft_drawing_rate, opponent_team_ids, parse_matchup
+
+logger = logging.getLogger(__name__)
+
+FEATURE_STORE_PATH = os.path.join('data', 'feature_store.joblib')
+
+# Box score stats kept per game; FT_DRAWING_RATE is derived from FTA/FGA
+GAME_STATS = ['PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'FTA', 'TOV', 'STL', 'FT_DRAWING_RATE']
+ROLLING_WINDOW = 5
+STREAK_WINDOW = 5
+OVERTIME_WINDOW = 10
+HISTORY_LENGTH = max(ROLLING_WINDOW, STREAK_WINDOW, OVERTIME_WINDOW)
+
+
+class _TeamState:
+    """The last HISTORY_LENGTH games of one team, oldest first"""
+    __slots__ = ('games', 'games_played')
+
+    def __init__(self):
+        # (GAME_ID, GAME_DATE, stats array, win, overtime, opponent id)
+        self.games = deque(maxlen=HISTORY_LENGTH)
+        self.games_played = 0
+
+
+class TeamFeatureStore:
+    """Rolling match features per team plus head-to-head records
+
+    Games are ingested in date order and each one updates its team's state
+    in constant time, so the features for tonight's games are read without
+    reprocessing the season. team_stats() matches what prepare_features
+    computes for a team's next game: rolling means over the last five
+    games, wins in the last five (WIN_STREAK) and the overtime share of the
+    last ten. Games already held in a team's window are replaced when seen
+    again, so re-fetched box score corrections are applied in place.
+    """
+
+    def __init__(self):
+        self.teams = {}
+        # (team id, opponent id) -> [wins, games]
+        self.head_to_head = {}
+        self.abbreviations = {}
+        self.last_game_date = None
+
+    @classmethod
+    def build(cls, games_df):
+        """Store built from a full game history"""
+        store = cls()
+        store.update(games_df)
+        return store
+
+    def update(self, games_df):
+        """Ingest new or corrected team-game rows; returns the number applied"""
+        if games_df.empty:
+            return 0
+
+        for row in games_df[['TEAM_ABBREVIATION', 'TEAM_ID']].drop_duplicates().itertuples(index=False):
+            self.abbreviations[str(row.TEAM_ABBREVIATION)] = int(row.TEAM_ID)
+
+        games_df = games_df.assign(GAME_DATE=pd.to_datetime(games_df['GAME_DATE']))
+        games_df = games_df.sort_values('GAME_DATE', kind='stable')
+        games_df = games_df.assign(
+            FT_DRAWING_RATE=ft_drawing_rate(games_df),
+            OPPONENT_TEAM_ID=opponent_team_ids(parse_matchup(games_df['MATCHUP'])[1], pd.Series(self.abbreviations))
+        )
+
+        stats = games_df[GAME_STATS].to_numpy(dtype=float)
+        applied = 0
+        rows = games_df[['TEAM_ID', 'GAME_ID', 'GAME_DATE', 'WL', 'MIN', 'OPPONENT_TEAM_ID']].itertuples(index=False)
+        for i, row in enumerate(rows):
+            opponent_id = None if pd.isna(row.OPPONENT_TEAM_ID) else int(row.OPPONENT_TEAM_ID)
+            applied += self._ingest(
+                int(row.TEAM_ID), str(row.GAME_ID).zfill(10), row.GAME_DATE, stats[i],
+                row.WL == 'W', row.MIN > 240, opponent_id
+            )
+        logger.info(f"Feature store ingested {applied} of {len(games_df)} rows")
+        return applied
+
+    def _ingest(self, team_id, game_id, game_date, stats, win, overtime, opponent_id):
+        state = self.teams.setdefault(team_id, _TeamState())
+        entry = (game_id, game_date, stats, win, overtime, opponent_id)
+
+        for i, game in enumerate(state.games):
+            if game[0] == game_id:
+                # A correction to a game still in the window
+                self._record_head_to_head(team_id, game[5], game[3], -1)
+                state.games[i] = entry
+                self._record_head_to_head(team_id, opponent_id, win, 1)
+                return 1
+
+        if state.games and game_date < state.games[-1][1]:
+            logger.warning(f"Skipping game {game_id} for team {team_id}: older than its stored window")
+            return 0
+
+        state.games.append(entry)
+        state.games_played += 1
+        self._record_head_to_head(team_id, opponent_id, win, 1)
+        if self.last_game_date is None or game_date > self.last_game_date:
+            self.last_game_date = game_date
+        return 1
+
+    def _record_head_to_head(self, team_id, opponent_id, win, sign):
+        if opponent_id is None:
+            return
+        record = self.head_to_head.setdefault((team_id, opponent_id), [0, 0])
+        record[0] += sign * int(win)
+        record[1] += sign
+
+    def team_id(self, abbreviation):
+        return self.abbreviations.get(abbreviation)
+
+    def team_stats(self, team_id):
+        """MATCH_STAT_COLUMNS for a team's next game, plus TEAM_ID and LATEST_GAME_DATE
+
+        Returns None for teams without any ingested games.
+        """
+        state = self.teams.get(int(team_id))
+        if state is None or not state.games:
+            return None
+
+        games = list(state.games)
+        # Missing percentages (no attempts) are skipped, and a stat missing from
+        # the whole window is 0, as in prepare_features
+        window = np.array([game[2] for game in games[-ROLLING_WINDOW:]])
+        present = ~np.isnan(window)
+        counts = present.sum(axis=0)
+        sums = np.where(present, window, 0.0).sum(axis=0)
+        stats = np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+        features = {f'{name}_ROLLING_AVG_{ROLLING_WINDOW}': float(value) for name, value in zip(GAME_STATS, stats)}
+        features['WIN_STREAK'] = sum(int(game[3]) for game in games[-STREAK_WINDOW:])
+        features['OVERTIME_RATE'] = float(np.mean([game[4] for game in games[-OVERTIME_WINDOW:]]))
+
+        result = {column: features[column] for column in MATCH_STAT_COLUMNS}
+        result['TEAM_ID'] = int(team_id)
+        result['LATEST_GAME_DATE'] = games[-1][1].strftime('%Y-%m-%d')
+        return result
+
+    def head_to_head_win_rate(self, team_id, opponent_id, default=0.5):
+        """Share of stored meetings ``team_id`` won against ``opponent_id``"""
+        wins, games = self.head_to_head.get((int(team_id), int(opponent_id)), (0, 0))
+        return wins / games if games else default
+
+    def save(self, filepath=FEATURE_STORE_PATH):
+        """Write the state as plain containers, so loading does not depend on how it was written"""
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        joblib.dump({
+            'teams': {
+                team_id: {'games': list(state.games), 'games_played': state.games_played}
+                for team_id, state in self.teams.items()
+            },
+            'head_to_head': self.head_to_head,
+            'abbreviations': self.abbreviations,
+            'last_game_date': self.last_game_date
+        }, filepath)
+        logger.info(f"Feature store saved to {filepath}")
+
+    @classmethod
+    def load(cls, filepath=FEATURE_STORE_PATH):
+        data = joblib.load(filepath)
+        store = cls()
+        for team_id, saved in data['teams'].items():
+            state = store.teams[team_id] = _TeamState()
+            state.games.extend(saved['games'])
+            state.games_played = saved['games_played']
+        store.head_to_head = data['head_to_head']
+        store.abbreviations = data['abbreviations']
+        store.last_game_date = data['last_game_date']
+        return store
+
+
+def main():
+    from data.game_store import GameStore
+    from data.schema import read_games_csv
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Rebuild the per-team feature store from the game history')
+    parser.add_argument('--csv', help='Build from this CSV instead of the game store')
+    parser.add_argument('--output', default=FEATURE_STORE_PATH)
+    args = parser.parse_args()
+
+    games_df = read_games_csv(args.csv) if args.csv else GameStore().load()
+    if games_df.empty:
+        logger.error("No games to build the feature store from")
+        return 1
+    store = TeamFeatureStore.build(games_df)
+    store.save(args.output)
+    logger.info(f"Feature store holds {len(store.teams)} teams through {store.last_game_date:%Y-%m-%d}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
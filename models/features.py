@@ -0,0 +1,211 @@
+"""
+Vectorized feature helpers shared by the match predictor and its scripts.
+"""
+import numpy as np
+import pandas as pd
+
+
+def head_to_head_win_rate(games_df, default=0.5):
+    """Win rate of each row's team against its opponent over earlier dates.
+
+    Rows are grouped by (TEAM_ID, OPPONENT_TEAM_ID, GAME_DATE) once, cumulative
+    wins/games are taken per team/opponent pair and the current date is
+    subtracted out, so only strictly earlier games count. Rows without prior
+    meetings (or without an opponent id) get ``default``.
+    """
+    keys = ['TEAM_ID', 'OPPONENT_TEAM_ID', 'GAME_DATE']
+
+    daily = games_df.groupby(keys, sort=True)['WIN'].agg(['sum', 'count'])
+    pair_totals = daily.groupby(level=[0, 1]).cumsum()
+    prior_wins = pair_totals['sum'] - daily['sum']
+    prior_games = pair_totals['count'] - daily['count']
+
+    win_rate = (prior_wins / prior_games.where(prior_games > 0)).rename('H2H_WIN_RATE')
+    rows = pd.MultiIndex.from_frame(games_df[keys])
+    return pd.Series(
+        win_rate.reindex(rows).to_numpy(),
+        index=games_df.index,
+        name='H2H_WIN_RATE'
+    ).fillna(default)
+
+
+def rolling_window_sums(values, groups, windows):
+    """Sums and non-missing counts over each row's previous games, for several windows
+
+    ``values`` is an (n, k) stats matrix whose rows are sorted so each group
+    in ``groups`` is one contiguous block, oldest first. A single prefix sum
+    of the values (missing ones as 0) and of their non-missing counts is
+    taken over all rows. The total over a row's previous ``w`` games is then
+    the prefix at the row minus the prefix at max(row - w, start of its
+    block), so every extra window is one gather and a subtraction.
+
+    Returns ``(sums, counts)`` arrays of shape (len(windows), n, k).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if values.ndim == 1:
+        values = values[:, None]
+    groups = np.asarray(groups)
+    n, k = values.shape
+
+    block_starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]]) if n else np.array([], dtype=np.int64)
+    if len(block_starts) != len(pd.unique(groups)):
+        raise ValueError("Rows must be sorted so that each group is contiguous")
+    block_start = np.repeat(block_starts, np.diff(np.r_[block_starts, n]))
+
+    # Stat-major, so every running sum and window gather walks contiguous memory
+    stats = np.ascontiguousarray(values.T)
+    present = ~np.isnan(stats)
+    complete = present.all()
+    prefix_sums = np.zeros((k, n + 1))
+    np.cumsum(stats if complete else np.where(present, stats, 0.0), axis=1, out=prefix_sums[:, 1:])
+    if not complete:
+        prefix_counts = np.zeros((k, n + 1), dtype=np.int64)
+        np.cumsum(present, axis=1, out=prefix_counts[:, 1:])
+
+    rows = np.arange(n)
+    sums = np.empty((len(windows), k, n))
+    counts = np.empty((len(windows), k, n), dtype=np.int64)
+    for i, window in enumerate(windows):
+        first = np.maximum(rows - window, block_start)
+        np.subtract(prefix_sums[:, :-1], prefix_sums[:, first], out=sums[i])
+        if complete:
+            # Without missing values the count is just the number of rows in the window
+            counts[i] = rows - first
+        else:
+            np.subtract(prefix_counts[:, :-1], prefix_counts[:, first], out=counts[i])
+    return sums.transpose(0, 2, 1), counts.transpose(0, 2, 1)
+
+
+def trailing_window_stats(games_df, columns, windows, group='TEAM_ID'):
+    """Sums and counts of ``columns`` over each row's previous games in ``group``
+
+    ``games_df`` must be sorted by (TEAM_ID, GAME_DATE); a row never sees its
+    own game or later ones. Returns ``{window: (sums, counts)}`` as DataFrames
+    aligned with ``games_df``; rows without earlier games have zero counts.
+    """
+    sums, counts = rolling_window_sums(games_df[columns].to_numpy(dtype=np.float64), games_df[group].to_numpy(), windows)
+    return {
+        window: (
+            pd.DataFrame(sums[i], index=games_df.index, columns=columns),
+            pd.DataFrame(counts[i], index=games_df.index, columns=columns)
+        )
+        for i, window in enumerate(windows)
+    }
+
+
+def trailing_means(games_df, columns, windows, group='TEAM_ID'):
+    """``<column>_ROLLING_AVG_<window>`` means over previous games; NaN without any"""
+    means = {}
+    for window, (sums, counts) in trailing_window_stats(games_df, columns, windows, group).items():
+        window_means = sums / counts.where(counts > 0)
+        for column in columns:
+            means[f'{column}_ROLLING_AVG_{window}'] = window_means[column]
+    return pd.DataFrame(means, index=games_df.index)
+
+
+def ft_drawing_rate(games_df):
+    """FTA per FGA for each row, 0 where the team attempted no field goals"""
+    fta = games_df['FTA'].to_numpy(dtype=float)
+    fga = games_df['FGA'].to_numpy(dtype=float)
+    rate = np.divide(fta, fga, out=np.zeros_like(fta), where=fga > 0)
+    return pd.Series(rate, index=games_df.index, name='FT_DRAWING_RATE')
+
+
+def parse_matchup(matchup):
+    """IS_HOME and OPPONENT_ABBREV from MATCHUP strings such as 'BOS vs. NYK' or 'BOS @ NYK'
+
+    Each distinct matchup is parsed once with the string accessor and the
+    results are broadcast back to the rows through the category codes.
+    Returns an int Series and a categorical Series aligned with ``matchup``;
+    missing matchups give IS_HOME 0 and a missing opponent.
+    """
+    matchup = matchup.astype('category')
+    categories = matchup.cat.categories.astype(str).to_series()
+    is_home = categories.str.contains('vs.', regex=False).to_numpy()
+    opponent = np.where(
+        categories.str.contains('@', regex=False),
+        categories.str.rsplit(n=1).str[-1],
+        categories.str.rsplit('vs.', n=1).str[-1].str.strip()
+    ).astype(object)
+
+    # Code -1 (missing) picks the appended sentinel
+    codes = matchup.cat.codes.to_numpy()
+    is_home = np.append(is_home, False)[codes]
+    opponent = np.append(opponent, np.nan)[codes]
+    return (
+        pd.Series(is_home.astype(int), index=matchup.index, name='IS_HOME'),
+        pd.Series(pd.Categorical(opponent), index=matchup.index, name='OPPONENT_ABBREV')
+    )
+
+
+def team_abbreviation_map(games_df):
+    """TEAM_ABBREVIATION -> TEAM_ID as a Series, taking the first row of each abbreviation"""
+    first_rows = games_df.drop_duplicates('TEAM_ABBREVIATION')
+    return pd.Series(
+        first_rows['TEAM_ID'].to_numpy(),
+        index=first_rows['TEAM_ABBREVIATION'].astype(object).to_numpy(),
+        name='TEAM_ID'
+    )
+
+
+def opponent_team_ids(opponent_abbrev, abbreviation_map):
+    """OPPONENT_TEAM_ID for each row, NaN where the abbreviation is unknown"""
+    return opponent_abbrev.astype(object).map(abbreviation_map).rename('OPPONENT_TEAM_ID')
+
+
+# Per-team stats fed to the model after the encoded ids and IS_HOME flag
+MATCH_STAT_COLUMNS = [
+    'PTS_ROLLING_AVG_5',
+    'FG_PCT_ROLLING_AVG_5',
+    'FT_PCT_ROLLING_AVG_5',
+    'FG3_PCT_ROLLING_AVG_5',
+    'AST_ROLLING_AVG_5',
+    'REB_ROLLING_AVG_5',
+    'FTA_ROLLING_AVG_5',
+    'FT_DRAWING_RATE_ROLLING_AVG_5',
+    'WIN_STREAK',
+    'TOV_ROLLING_AVG_5',
+    'STL_ROLLING_AVG_5',
+    'OVERTIME_RATE'
+]
+
+# Full model input, in column order
+FEATURE_COLUMNS = ['TEAM_ID_ENCODED', 'OPPONENT_TEAM_ID_ENCODED', 'IS_HOME'] + MATCH_STAT_COLUMNS
+
+# Stats that older callers may leave out, with the value used instead
+OPTIONAL_STAT_DEFAULTS = {'OVERTIME_RATE': 0}
+
+
+def team_stats_matrix(team_stats):
+    """Stack per-game team stats into an (n, len(MATCH_STAT_COLUMNS)) array
+
+    ``team_stats`` may be a DataFrame, a list of dicts/Series keyed by the stat
+    columns, or an array already in MATCH_STAT_COLUMNS order.
+    """
+    if isinstance(team_stats, np.ndarray):
+        stats = np.asarray(team_stats, dtype=float)
+        if stats.ndim != 2 or stats.shape[1] != len(MATCH_STAT_COLUMNS):
+            raise ValueError(f"Expected stats array of shape (n, {len(MATCH_STAT_COLUMNS)}), got {stats.shape}")
+        return stats
+
+    stats_df = team_stats if isinstance(team_stats, pd.DataFrame) else pd.DataFrame(list(team_stats))
+    for column, default in OPTIONAL_STAT_DEFAULTS.items():
+        filled = stats_df[column].fillna(default) if column in stats_df.columns else default
+        stats_df = stats_df.assign(**{column: filled})
+
+    missing_columns = [col for col in MATCH_STAT_COLUMNS if col not in stats_df.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required team stats: {missing_columns}")
+    return stats_df[MATCH_STAT_COLUMNS].to_numpy(dtype=float)
+
+
+def build_match_features(home_team_encoded, away_team_encoded, home_team_stats):
+    """Assemble the unscaled (n, 15) model input for home-team predictions"""
+    home_team_encoded = np.asarray(home_team_encoded, dtype=float).reshape(-1, 1)
+    away_team_encoded = np.asarray(away_team_encoded, dtype=float).reshape(-1, 1)
+    stats = team_stats_matrix(home_team_stats)
+    if not len(home_team_encoded) == len(away_team_encoded) == len(stats):
+        raise ValueError("Team ids and team stats must describe the same number of games")
+
+    is_home = np.ones_like(home_team_encoded)
+    return np.hstack([home_team_encoded, away_team_encoded, is_home, stats])
@@ -0,0 +1,249 @@
+"""
+Hyperparameter search for NBAMatchPredictor: grid or random candidates,
+narrowed by successive halving and trained in a process pool.
+
+Features are prepared and scaled once and written as .npy files that
+every worker memory-maps, so the pool shares one copy of the data. Each
+worker caps TensorFlow at --threads-per-worker threads; the default pool
+runs one single-threaded worker per core.
+
+Usage:
+    python -m models.hyperparameter_search [--csv data/training_data_latest.csv]
+        [--strategy random|grid] [--samples 24] [--min-epochs 5] [--max-epochs 45] [--eta 3]
+        [--workers N] [--threads-per-worker 1] [--output models/hyperparameter_leaderboard.csv]
+"""
+import os
+import sys
+import time
+import random
+import shutil
+import logging
+import argparse
+import itertools
+import tempfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from models.metrics import classification_metrics
+
+logger = logging.getLogger(__name__)
+
+LEADERBOARD_PATH = os.path.join('models', 'hyperparameter_leaderboard.csv')
+
+SEARCH_SPACE = {
+    'hidden_units': [(32,), (64, 32), (128, 64), (128, 64, 32)],
+    'dropout': [0.0, 0.1, 0.2, 0.3],
+    'learning_rate': [0.0003, 0.001, 0.003],
+    'batch_size': [32, 64, 128]
+}
+
+DATA_ARRAYS = ['X_train', 'y_train', 'X_val', 'y_val']
+
+# Memory-mapped arrays of the worker process, set by _init_worker
+_DATA = None
+
+
+def grid_candidates(space=SEARCH_SPACE):
+    """Every combination of the values in ``space``"""
+    names = list(space)
+    return [dict(zip(names, values)) for values in itertools.product(*(space[name] for name in names))]
+
+
+def random_candidates(space=SEARCH_SPACE, samples=24, seed=42):
+    """``samples`` distinct combinations drawn at random from ``space``"""
+    grid = grid_candidates(space)
+    return random.Random(seed).sample(grid, min(samples, len(grid)))
+
+
+def write_search_data(games_df, data_dir):
+    """Prepare, split and scale ``games_df`` once and save the arrays for the workers
+
+    Validation is the most recent 20% of game days, as in
+    NBAMatchPredictor.train.
+    """
+    from models.match_predictor import NBAMatchPredictor
+
+    predictor = NBAMatchPredictor()
+    X_train, X_val, y_train, y_val = predictor.create_feature_matrix(predictor.prepare_features(games_df))
+    arrays = {
+        'X_train': np.asarray(X_train, dtype=np.float32),
+        'y_train': np.asarray(y_train, dtype=np.float32).reshape(-1, 1),
+        'X_val': np.asarray(X_val, dtype=np.float32),
+        'y_val': np.asarray(y_val, dtype=np.float32).reshape(-1, 1)
+    }
+    os.makedirs(data_dir, exist_ok=True)
+    for name, array in arrays.items():
+        np.save(os.path.join(data_dir, f'{name}.npy'), array)
+    logger.info(f"Search data written to {data_dir}: {len(arrays['X_train'])} training, "
+                f"{len(arrays['X_val'])} validation rows")
+
+
+def load_search_data(data_dir):
+    """Memory-map the arrays written by write_search_data"""
+    return {name: np.load(os.path.join(data_dir, f'{name}.npy'), mmap_mode='r') for name in DATA_ARRAYS}
+
+
+def _init_worker(data_dir, threads):
+    """Cap TensorFlow's threads before it starts and map the shared data"""
+    global _DATA
+    os.environ['OMP_NUM_THREADS'] = str(threads)
+    os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+    import tensorflow as tf
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+    _DATA = load_search_data(data_dir)
+
+
+def _train_candidate(task, data=None):
+    """Train one candidate for ``task['epochs']`` more epochs and score it on the validation days
+
+    Training resumes from ``task['resume_from']`` (weights and optimizer
+    state) when given, and the model is saved to ``task['checkpoint']`` so a
+    later rung can continue it.
+    """
+    import tensorflow as tf
+    from models.match_predictor import NBAMatchPredictor
+
+    data = data if data is not None else _DATA
+    started = time.perf_counter()
+    predictor = NBAMatchPredictor(**task['config'])
+    if task.get('resume_from'):
+        predictor.model = tf.keras.models.load_model(task['resume_from'])
+    train_step, _, _ = predictor._make_step_functions()
+
+    X_train, y_train = data['X_train'], data['y_train']
+    batch_size = task['config']['batch_size']
+    rng = np.random.default_rng(task['seed'])
+    for _ in range(task['epochs']):
+        # Batches are gathered from the memory-mapped arrays, so no worker holds a full copy
+        order = rng.permutation(len(X_train))
+        for start in range(0, len(order), batch_size):
+            rows = np.sort(order[start:start + batch_size])
+            train_step(tf.constant(X_train[rows]), tf.constant(y_train[rows]))
+
+    probabilities = np.asarray(predictor.model(np.asarray(data['X_val']), training=False)).reshape(-1)
+    predictor.model.save(task['checkpoint'])
+    return {
+        'candidate': task['candidate'],
+        'checkpoint': task['checkpoint'],
+        'seconds': time.perf_counter() - started,
+        **{f'val_{name}': value for name, value in classification_metrics(data['y_val'], probabilities).items()
+           if name != 'games'}
+    }
+
+
+def successive_halving(candidates, run_tasks, checkpoint_dir, min_epochs=5, max_epochs=45, eta=3, seed=42):
+    """Train every candidate briefly, keep the best 1/eta, train those eta times longer, and so on
+
+    ``run_tasks`` takes a list of task dicts and returns their results in
+    any order. Survivors continue from their checkpoints, so a candidate
+    reaching ``max_epochs`` has trained for exactly that many epochs.
+    Returns one leaderboard row per candidate and rung.
+    """
+    survivors = {i: {'epochs': 0, 'checkpoint': None} for i in range(len(candidates))}
+    rows = []
+    rung = 0
+    rung_epochs = min(min_epochs, max_epochs)
+    while True:
+        tasks = [{
+            'candidate': i,
+            'config': candidates[i],
+            'epochs': rung_epochs - state['epochs'],
+            'resume_from': state['checkpoint'],
+            'checkpoint': os.path.join(checkpoint_dir, f'candidate_{i}_rung_{rung}.keras'),
+            'seed': seed + i
+        } for i, state in survivors.items()]
+        results = run_tasks(tasks)
+
+        for result in results:
+            survivors[result['candidate']] = {'epochs': rung_epochs, 'checkpoint': result['checkpoint']}
+            rows.append({'rung': rung, 'epochs': rung_epochs, **candidates[result['candidate']], **result})
+        logger.info(f"Rung {rung}: {len(results)} candidates at {rung_epochs} epochs, best val log-loss "
+                    f"{min(result['val_log_loss'] for result in results):.4f}")
+
+        if rung_epochs >= max_epochs or len(survivors) <= 1:
+            break
+        ranked = sorted(results, key=lambda result: result['val_log_loss'])
+        keep = {result['candidate'] for result in ranked[:max(1, len(ranked) // eta)]}
+        survivors = {i: state for i, state in survivors.items() if i in keep}
+        rung += 1
+        rung_epochs = min(rung_epochs * eta, max_epochs)
+
+    return rows
+
+
+def leaderboard(rows):
+    """Rows ordered best first: furthest rung, then lowest validation log-loss"""
+    board = pd.DataFrame(rows).drop(columns=['checkpoint'])
+    board['hidden_units'] = board['hidden_units'].map(lambda units: '-'.join(str(unit) for unit in units))
+    board = board.sort_values(['rung', 'val_log_loss'], ascending=[False, True], kind='stable')
+    board.insert(0, 'rank', np.arange(1, len(board) + 1))
+    return board.reset_index(drop=True)
+
+
+def run_search(games_df, candidates, workers=None, threads_per_worker=1, min_epochs=5, max_epochs=45,
+               eta=3, work_dir=None):
+    """Search ``candidates`` on ``games_df`` in a pool of worker processes; returns the leaderboard"""
+    workers = workers or max(1, (os.cpu_count() or 1) // threads_per_worker)
+    owns_work_dir = work_dir is None
+    work_dir = work_dir or tempfile.mkdtemp(prefix='hyperparameter_search_')
+    try:
+        data_dir = os.path.join(work_dir, 'data')
+        write_search_data(games_df, data_dir)
+        logger.info(f"Searching {len(candidates)} candidates with {workers} workers "
+                    f"x {threads_per_worker} TensorFlow threads")
+
+        # Spawned workers start without TensorFlow loaded, so the thread caps take effect
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker, initargs=(data_dir, threads_per_worker)) as pool:
+            def run_tasks(tasks):
+                futures = [pool.submit(_train_candidate, task) for task in tasks]
+                return [future.result() for future in as_completed(futures)]
+
+            rows = successive_halving(candidates, run_tasks, work_dir, min_epochs, max_epochs, eta)
+        return leaderboard(rows)
+    finally:
+        if owns_work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main():
+    from data.schema import read_games_csv
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description='Search NBAMatchPredictor hyperparameters')
+    parser.add_argument('--csv', default='data/training_data_latest.csv')
+    parser.add_argument('--strategy', choices=['random', 'grid'], default='random')
+    parser.add_argument('--samples', type=int, default=24, help='Candidates drawn by the random strategy')
+    parser.add_argument('--min-epochs', type=int, default=5)
+    parser.add_argument('--max-epochs', type=int, default=45)
+    parser.add_argument('--eta', type=int, default=3, help='Keep the best 1/eta candidates at each rung')
+    parser.add_argument('--workers', type=int, help='Worker processes (default: cores / threads per worker)')
+    parser.add_argument('--threads-per-worker', type=int, default=1)
+    parser.add_argument('--output', default=LEADERBOARD_PATH)
+    args = parser.parse_args()
+
+    candidates = grid_candidates() if args.strategy == 'grid' else random_candidates(samples=args.samples)
+    try:
+        started = time.perf_counter()
+        board = run_search(
+            read_games_csv(args.csv), candidates, workers=args.workers, threads_per_worker=args.threads_per_worker,
+            min_epochs=args.min_epochs, max_epochs=args.max_epochs, eta=args.eta
+        )
+    except Exception as e:
+        logger.error(f"Error running hyperparameter search: {str(e)}")
+        return 1
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    board.to_csv(args.output, index=False)
+    print(f"\nSearched {len(candidates)} candidates in {time.perf_counter() - started:.0f}s; "
+          f"leaderboard written to {args.output}\n")
+    print(board.head(10).to_string(index=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
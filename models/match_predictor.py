@@ -1,131 +1,152 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import LabelEncoder, StandardScaler
-from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers, models, optimizers, callbacks
 import joblib
+import json
 import logging
-import matplotlib.pyplot as plt
-import seaborn as sns
-from tensorflow.keras.callbacks import TensorBoard
+import os
 import time
 
+# TensorFlow, matplotlib, seaborn and the sklearn training utilities are
+# imported inside the methods that need them, so loading this module to
+# prepare features or run predictions stays cheap.
+
+from models.features import (
+    FEATURE_COLUMNS, build_match_features, ft_drawing_rate, head_to_head_win_rate,
+    opponent_team_ids, parse_matchup, team_abbreviation_map, trailing_window_stats
+)
+from models.metrics import classification_metrics
+from models.numpy_predictor import NUMPY_MODEL_SUFFIX
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Appended to the save_model filepath for the held-out evaluation metrics
+METRICS_SUFFIX = '_metrics.json'
+
+# Network and training settings; models/hyperparameter_search.py tunes these
+DEFAULT_HYPERPARAMETERS = {
+    'hidden_units': (64, 32),
+    'dropout': 0.1,
+    'learning_rate': 0.001,
+    'batch_size': 64
+}
+
 class NBAMatchPredictor:
-    def __init__(self):
-        """Initialize the NBA match predictor"""
+    def __init__(self, **hyperparameters):
+        """Initialize the NBA match predictor
+
+        Keyword arguments override DEFAULT_HYPERPARAMETERS.
+        """
+        unknown = set(hyperparameters) - set(DEFAULT_HYPERPARAMETERS)
+        if unknown:
+            raise ValueError(f"Unknown hyperparameters: {sorted(unknown)}")
+        self.hyperparameters = {**DEFAULT_HYPERPARAMETERS, **hyperparameters}
         self.model = self._build_model()
         self.team_encoder = LabelEncoder()
         self.scaler = StandardScaler()
         self.history = None
+        self.metrics = None
+        self.accuracy = None
+        # Date of the newest game the model has been trained on
+        self.trained_through = None
         
     def _build_model(self):
         """Build the TensorFlow model with Sequential API"""
-        model = models.Sequential([
-            layers.Input(shape=(15,)),  # Updated input shape to 15 features
-            layers.Dense(64, activation='relu'),
-            layers.BatchNormalization(),
-            layers.Dropout(0.1),
-            layers.Dense(32, activation='relu'),
-            layers.BatchNormalization(),
-            layers.Dropout(0.1),
-            layers.Dense(1, activation='sigmoid')
-        ])
+        from tensorflow.keras import layers, models, optimizers
+        
+        model = models.Sequential([layers.Input(shape=(15,))])  # Updated input shape to 15 features
+        for units in self.hyperparameters['hidden_units']:
+            model.add(layers.Dense(units, activation='relu'))
+            model.add(layers.BatchNormalization())
+            model.add(layers.Dropout(self.hyperparameters['dropout']))
+        model.add(layers.Dense(1, activation='sigmoid'))
         
         model.compile(
-            optimizer=optimizers.Adam(learning_rate=0.001),
+            optimizer=optimizers.Adam(learning_rate=self.hyperparameters['learning_rate']),
             loss='binary_crossentropy',
             metrics=['accuracy']
         )
         return model
         
-    def prepare_features(self, games_df):
-        """Prepare features for the model with enhanced feature engineering"""
+    def prepare_features(self, games_df, fit_encoder=True):
+        """Prepare features for the model with enhanced feature engineering
+
+        With ``fit_encoder=False`` the team encoder of a loaded model is kept,
+        and teams it has not seen raise ValueError.
+        """
         try:
             # Convert date to datetime
             games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
             
             # Create win/loss binary column
-            games_df['WIN'] = (games_df['WL'] == 'W').astype(int)
+            games_df['WIN'] = (games_df['WL'] == 'W').astype(np.int8)
             
             # Create overtime boolean feature
-            games_df['IS_OVERTIME'] = (games_df['MIN'] > 240).astype(int)
+            games_df['IS_OVERTIME'] = (games_df['MIN'] > 240).astype(np.int8)
             logger.info(f"Identified {games_df['IS_OVERTIME'].sum()} overtime games out of {len(games_df)} total games")
             
-            # Calculate rolling averages with different windows
-            features = ['PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'FTA', 'TOV', 'STL', 'BLK']
-            windows = [5, 10]  # Multiple windows for better trend capture
-            
-            for feature in features:
-                for window in windows:
-                    games_df[f'{feature}_ROLLING_AVG_{window}'] = games_df.groupby('TEAM_ID')[feature].transform(
-                        lambda x: x.rolling(window=window, min_periods=1).mean()
-                    )
+            # Rolling windows need each team's games in time order; LeagueGameFinder
+            # returns newest first
+            games_df = games_df.sort_values(['TEAM_ID', 'GAME_DATE'], kind='stable')
             
             # Add free throw drawing ability (FTA per FGA) with handling for divide by zero
-            games_df['FT_DRAWING_RATE'] = games_df.apply(
-                lambda row: row['FTA'] / row['FGA'] if row['FGA'] > 0 else 0, 
-                axis=1
+            games_df['FT_DRAWING_RATE'] = ft_drawing_rate(games_df).astype(np.float32)
+            
+            # Rolling averages over each team's previous games only, with multiple
+            # windows for better trend capture
+            features = ['PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'FTA', 'TOV', 'STL', 'BLK']
+            windows = [5, 10]
+            window_stats = trailing_window_stats(
+                games_df, features + ['FT_DRAWING_RATE', 'WIN', 'IS_OVERTIME'], windows
             )
+            means = {
+                window: (sums / counts.where(counts > 0)).astype(np.float32)
+                for window, (sums, counts) in window_stats.items()
+            }
+            for feature in features:
+                for window in windows:
+                    games_df[f'{feature}_ROLLING_AVG_{window}'] = means[window][feature]
             
             # Add rolling average of free throw drawing rate
-            games_df['FT_DRAWING_RATE_ROLLING_AVG_5'] = games_df.groupby('TEAM_ID')['FT_DRAWING_RATE'].transform(
-                lambda x: x.rolling(window=5, min_periods=1).mean()
-            )
+            games_df['FT_DRAWING_RATE_ROLLING_AVG_5'] = means[5]['FT_DRAWING_RATE']
             
-            # Add win streak feature
-            games_df['WIN_STREAK'] = games_df.groupby('TEAM_ID')['WIN'].transform(
-                lambda x: x.rolling(window=5, min_periods=1).sum()
-            )
+            # Add win streak feature (wins in the previous five games)
+            games_df['WIN_STREAK'] = window_stats[5][0]['WIN'].astype(np.float32)
             
-            # Add overtime rate (percentage of games that go to overtime)
-            games_df['OVERTIME_RATE'] = games_df.groupby('TEAM_ID')['IS_OVERTIME'].transform(
-                lambda x: x.rolling(window=10, min_periods=1).mean()
-            )
+            # Add overtime rate (share of the previous ten games that went to overtime)
+            games_df['OVERTIME_RATE'] = means[10]['IS_OVERTIME']
             
-            # Extract opponent from MATCHUP
-            games_df['IS_HOME'] = games_df['MATCHUP'].apply(lambda x: 1 if 'vs.' in x else 0)
-            games_df['OPPONENT_ABBREV'] = games_df['MATCHUP'].apply(
-                lambda x: x.split()[-1] if '@' in x else x.split('vs.')[-1].strip()
-            )
+            # A team's first game has no earlier games to average
+            rolling_columns = [column for column in games_df.columns if '_ROLLING_AVG_' in column] + ['OVERTIME_RATE']
+            first_games = int((window_stats[5][1]['WIN'] == 0).sum())
+            if first_games:
+                logger.info(f"{first_games} rows are a team's first game; their rolling averages are 0")
+                games_df[rolling_columns] = games_df[rolling_columns].fillna(0)
             
-            # Create mapping of team abbreviations to IDs
-            team_abbrev_to_id = {}
-            for _, row in games_df.drop_duplicates('TEAM_ABBREVIATION')[['TEAM_ABBREVIATION', 'TEAM_ID']].iterrows():
-                team_abbrev_to_id[row['TEAM_ABBREVIATION']] = row['TEAM_ID']
+            # Extract opponent from MATCHUP
+            is_home, games_df['OPPONENT_ABBREV'] = parse_matchup(games_df['MATCHUP'])
+            games_df['IS_HOME'] = is_home.astype(np.int8)
             
             # Map opponent abbreviations to IDs
-            games_df['OPPONENT_TEAM_ID'] = games_df['OPPONENT_ABBREV'].map(team_abbrev_to_id)
-            
-            # Calculate head-to-head win rate
-            games_df['H2H_WIN_RATE'] = games_df.apply(
-                lambda row: games_df[
-                    (games_df['TEAM_ID'] == row['TEAM_ID']) & 
-                    (games_df['OPPONENT_TEAM_ID'] == row['OPPONENT_TEAM_ID']) &
-                    (games_df['GAME_DATE'] < row['GAME_DATE'])
-                ]['WIN'].mean() if len(games_df[
-                    (games_df['TEAM_ID'] == row['TEAM_ID']) & 
-                    (games_df['OPPONENT_TEAM_ID'] == row['OPPONENT_TEAM_ID']) &
-                    (games_df['GAME_DATE'] < row['GAME_DATE'])
-                ]) > 0 else 0.5,
-                axis=1
+            games_df['OPPONENT_TEAM_ID'] = opponent_team_ids(
+                games_df['OPPONENT_ABBREV'], team_abbreviation_map(games_df)
             )
             
+            # Calculate head-to-head win rate from earlier meetings
+            games_df['H2H_WIN_RATE'] = head_to_head_win_rate(games_df).astype(np.float32)
+            
             # Encode team IDs
             all_team_ids = pd.concat([
                 games_df['TEAM_ID'],
                 games_df['OPPONENT_TEAM_ID']
             ]).unique()
             
-            self.team_encoder.fit(all_team_ids)
+            if fit_encoder:
+                self.team_encoder.fit(all_team_ids)
             games_df['TEAM_ID_ENCODED'] = self.team_encoder.transform(games_df['TEAM_ID'])
             games_df['OPPONENT_TEAM_ID_ENCODED'] = self.team_encoder.transform(games_df['OPPONENT_TEAM_ID'])
             
@@ -133,7 +154,11 @@ class NBAMatchPredictor:
             for col in games_df.columns:
                 if games_df[col].isna().any():
                     logger.warning(f"Column {col} contains {games_df[col].isna().sum()} NaN values. Filling with 0.")
-                    games_df[col] = games_df[col].fillna(0)
+                    column = games_df[col]
+                    # Categoricals only accept fill values that are already categories
+                    if isinstance(column.dtype, pd.CategoricalDtype) and 0 not in column.cat.categories:
+                        column = column.cat.add_categories([0])
+                    games_df[col] = column.fillna(0)
             
             return games_df
             
@@ -141,25 +166,13 @@ class NBAMatchPredictor:
             logger.error(f"Error in prepare_features: {str(e)}")
             raise
 
-    def create_feature_matrix(self, games_df):
-        """Create feature matrix for training/prediction with enhanced features"""
-        feature_columns = [
-            'TEAM_ID_ENCODED',                  # 1
-            'OPPONENT_TEAM_ID_ENCODED',         # 2
-            'IS_HOME',                          # 3
-            'PTS_ROLLING_AVG_5',                # 4
-            'FG_PCT_ROLLING_AVG_5',             # 5
-            'FT_PCT_ROLLING_AVG_5',             # 6
-            'FG3_PCT_ROLLING_AVG_5',            # 7
-            'AST_ROLLING_AVG_5',                # 8
-            'REB_ROLLING_AVG_5',                # 9
-            'FTA_ROLLING_AVG_5',                # 10
-            'FT_DRAWING_RATE_ROLLING_AVG_5',    # 11
-            'WIN_STREAK',                       # 12
-            'TOV_ROLLING_AVG_5',                # 13
-            'STL_ROLLING_AVG_5',                # 14
-            'OVERTIME_RATE'                     # 15 - New feature
-        ]
+    def create_feature_matrix(self, games_df, test_size=0.2):
+        """Create feature matrix for training/prediction with enhanced features
+
+        The most recent ``test_size`` share of game days is held out, so the
+        model is evaluated on games played after everything it trained on.
+        """
+        feature_columns = FEATURE_COLUMNS
         
         # Ensure all features exist
         missing_columns = [col for col in feature_columns if col not in games_df.columns]
@@ -183,10 +196,15 @@ class NBAMatchPredictor:
             logger.warning("Filling NaN values with 0")
             X = X.fillna(0)
         
-        # Split first, then scale
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
+        # Split by date first, then scale; a random split would train on later games
+        dates = games_df['GAME_DATE'].to_numpy()
+        order = np.argsort(dates, kind='stable')
+        cutoff = self._holdout_start(dates, test_size)
+        train_rows = order[dates[order] < cutoff]
+        test_rows = order[dates[order] >= cutoff]
+        X_train, X_test = X.iloc[train_rows], X.iloc[test_rows]
+        y_train, y_test = y.iloc[train_rows], y.iloc[test_rows]
+        logger.info(f"Holding out {len(test_rows)} rows from {pd.Timestamp(cutoff):%Y-%m-%d} on for evaluation")
         
         # Fit scaler only on training data
         self.scaler.fit(X_train)
@@ -195,8 +213,21 @@ class NBAMatchPredictor:
         
         return X_train, X_test, y_train, y_test
 
-    def train(self, games_df, verbose=1, validation_split=0.2):
-        """Train the prediction model with improved training process"""
+    @staticmethod
+    def _holdout_start(dates, test_size=0.2):
+        """First game day of the newest ``test_size`` share of rows, which is held out of training"""
+        dates = np.sort(np.asarray(dates))
+        return dates[int(len(dates) * (1 - test_size))]
+
+    def train(self, games_df, verbose=1, validation_split=0.2, epochs=150, jit_compile=False):
+        """Train the prediction model with improved training process
+
+        Set ``jit_compile`` to compile the train/validation steps with XLA.
+        """
+        import tensorflow as tf
+        from tensorflow.keras import callbacks
+        from sklearn.metrics import accuracy_score, classification_report
+        
         try:
             # Prepare data
             processed_df = self.prepare_features(games_df)
@@ -210,10 +241,13 @@ class NBAMatchPredictor:
             logger.info(f"X_train shape: {X_train.shape}")
             logger.info(f"y_train shape: {y_train.shape}")
             
-            # Convert to TensorFlow datasets
-            train_dataset = tf.data.Dataset.from_tensor_slices((X_train, y_train)).batch(64)
+            # Convert to TensorFlow datasets, holding the validation rows out of training
+            # so the early stopping and LR schedule see genuinely unseen data
             val_size = int(len(X_train) * validation_split)
-            val_dataset = tf.data.Dataset.from_tensor_slices((X_train[-val_size:], y_train[-val_size:])).batch(64)
+            fit_size = len(X_train) - val_size
+            batch_size = self.hyperparameters['batch_size']
+            train_dataset = tf.data.Dataset.from_tensor_slices((X_train[:fit_size], y_train[:fit_size])).batch(batch_size)
+            val_dataset = tf.data.Dataset.from_tensor_slices((X_train[fit_size:], y_train[fit_size:])).batch(batch_size)
             
             # Callbacks
             early_stopping = callbacks.EarlyStopping(
@@ -231,7 +265,7 @@ class NBAMatchPredictor:
             
             # Set up TensorBoard callback
             log_dir = f"logs/fit/{time.strftime('%Y%m%d-%H%M%S')}"
-            tensorboard_callback = TensorBoard(
+            tensorboard_callback = callbacks.TensorBoard(
                 log_dir=log_dir,
                 histogram_freq=1,
                 write_graph=True
@@ -241,61 +275,27 @@ class NBAMatchPredictor:
             print("To monitor training progress, run:")
             print(f"tensorboard --logdir {log_dir}")
             
-            # Train model using custom training loop
-            epochs = 150
-            history = {'loss': [], 'accuracy': [], 'val_loss': [], 'val_accuracy': []}
-            
-            for epoch in range(epochs):
-                # Training
-                train_loss = tf.keras.metrics.Mean()
-                train_accuracy = tf.keras.metrics.BinaryAccuracy()
-                
-                for x_batch, y_batch in train_dataset:
-                    with tf.GradientTape() as tape:
-                        predictions = self.model(x_batch, training=True)
-                        loss = tf.keras.losses.binary_crossentropy(y_batch, predictions)
-                    
-                    gradients = tape.gradient(loss, self.model.trainable_variables)
-                    self.model.optimizer.apply_gradients(zip(gradients, self.model.trainable_variables))
-                    
-                    train_loss.update_state(loss)
-                    train_accuracy.update_state(y_batch, predictions)
-                
-                # Validation
-                val_loss = tf.keras.metrics.Mean()
-                val_accuracy = tf.keras.metrics.BinaryAccuracy()
-                
-                for x_batch, y_batch in val_dataset:
-                    predictions = self.model(x_batch, training=False)
-                    loss = tf.keras.losses.binary_crossentropy(y_batch, predictions)
-                    
-                    val_loss.update_state(loss)
-                    val_accuracy.update_state(y_batch, predictions)
-                
-                # Store metrics
-                history['loss'].append(train_loss.result().numpy())
-                history['accuracy'].append(train_accuracy.result().numpy())
-                history['val_loss'].append(val_loss.result().numpy())
-                history['val_accuracy'].append(val_accuracy.result().numpy())
-                
-                if verbose:
-                    print(
-                        f"\rEpoch {epoch+1}/{epochs} - "
-                        f"loss: {train_loss.result():.4f} - "
-                        f"accuracy: {train_accuracy.result():.4f} - "
-                        f"val_loss: {val_loss.result():.4f} - "
-                        f"val_accuracy: {val_accuracy.result():.4f}",
-                        end="\n"  # Changed to \n for clearer output
-                    )
+            # Train model using compiled custom training loop
+            history = self._run_training_loop(
+                train_dataset, val_dataset, epochs=epochs, verbose=verbose, jit_compile=jit_compile,
+                callback_list=[early_stopping, reduce_lr, tensorboard_callback]
+            )
             
             # Store history
             self.history = type('History', (), {'history': history})()
             
             # Evaluate
-            y_pred = (self.model.predict(X_test) > 0.5).astype(int)
+            win_probs = self.model.predict(X_test).reshape(-1)
+            y_pred = (win_probs > 0.5).astype(int)
             accuracy = accuracy_score(y_test.reshape(-1), y_pred.reshape(-1))  # Reshape for sklearn metrics
+            self.metrics = classification_metrics(y_test, win_probs)
+            self.accuracy = self.metrics['accuracy']
+            # The held-out days were never trained on, so the first fine-tune treats them as new
+            holdout_start = self._holdout_start(processed_df['GAME_DATE'].to_numpy())
+            self.trained_through = processed_df.loc[processed_df['GAME_DATE'] < holdout_start, 'GAME_DATE'].max()
             
             logger.info(f"\nModel accuracy: {accuracy:.3f}")
+            logger.info(f"Log-loss: {self.metrics['log_loss']:.4f}, Brier score: {self.metrics['brier']:.4f}")
             logger.info("\nClassification Report:")
             logger.info(classification_report(y_test.reshape(-1), y_pred.reshape(-1)))  # Reshape for sklearn metrics
             
@@ -314,8 +314,184 @@ class NBAMatchPredictor:
             logger.error(f"Error training model: {str(e)}")
             raise
 
+    def fine_tune(self, games_df, epochs=5, replay_size=2000, learning_rate=0.0001, max_drift_z=4.0,
+                  min_drift=0.25, max_accuracy_drop=0.05, min_check_rows=20, jit_compile=False, seed=42):
+        """Continue training a loaded model on games played since ``trained_through``
+
+        Returns the metrics on the new games before training (``games == 0`` when there are
+        none), or None when drift or an accuracy drop means a full retrain is needed.
+        """
+        import tensorflow as tf
+        
+        if self.trained_through is None:
+            logger.info("Model has no recorded training date; a full retrain is needed")
+            return None
+        
+        processed_df = self.prepare_features(games_df, fit_encoder=False)
+        is_new = (processed_df['GAME_DATE'] > self.trained_through).to_numpy()
+        if not is_new.any():
+            logger.info(f"No games after {self.trained_through:%Y-%m-%d} to fine-tune on")
+            return classification_metrics([], [])
+        
+        X = self.scaler.transform(processed_df[FEATURE_COLUMNS]).astype(np.float32)
+        y = processed_df['WIN'].to_numpy(dtype=np.float32).reshape(-1, 1)
+        X_new, y_new = X[is_new], y[is_new]
+        
+        if len(X_new) >= min_check_rows:
+            # Scaled features have unit variance, so the standard error of their mean is 1/sqrt(n).
+            # A night's mean is noisy, so it must be max_drift_z standard errors out; with many
+            # new rows the min_drift floor keeps a small, harmless shift from forcing a retrain
+            shift = np.abs(X_new.mean(axis=0))
+            threshold = max(min_drift, max_drift_z / np.sqrt(len(X_new)))
+            if shift.max() > threshold:
+                feature = int(shift.argmax())
+                logger.warning(
+                    f"Feature drift in new games: {FEATURE_COLUMNS[feature]} moved {shift[feature]:.2f} "
+                    f"standard deviations ({shift[feature] * np.sqrt(len(X_new)):.1f} standard errors); "
+                    f"a full retrain is needed"
+                )
+                return None
+        
+        new_metrics = classification_metrics(y_new, np.asarray(self.model(X_new, training=False)))
+        logger.info(f"Accuracy on {len(X_new)} new rows before fine-tuning: {new_metrics['accuracy']:.3f}")
+        if len(X_new) >= min_check_rows and self.accuracy is not None:
+            # On a night or two of games, allow two standard errors of sampling noise
+            standard_error = np.sqrt(self.accuracy * (1 - self.accuracy) / len(X_new))
+            if new_metrics['accuracy'] < self.accuracy - max(max_accuracy_drop, 2 * standard_error):
+                logger.warning(
+                    f"Accuracy on new games fell to {new_metrics['accuracy']:.3f} from {self.accuracy:.3f}; "
+                    f"a full retrain is needed"
+                )
+                return None
+        
+        # New games plus a replay sample of the history, so the model does not drift towards the last few nights
+        rng = np.random.default_rng(seed)
+        old_rows = np.flatnonzero(~is_new)
+        replay_rows = rng.choice(old_rows, min(replay_size, len(old_rows)), replace=False)
+        rows = np.concatenate([np.flatnonzero(is_new), replay_rows])
+        
+        self.model.optimizer.learning_rate.assign(learning_rate)
+        batch_size = self.hyperparameters['batch_size']
+        dataset = tf.data.Dataset.from_tensor_slices((X[rows], y[rows])).shuffle(len(rows), seed=seed).batch(batch_size)
+        train_step, _, _ = self._make_step_functions(jit_compile=jit_compile)
+        for _ in range(epochs):
+            for x_batch, y_batch in dataset:
+                train_step(x_batch, y_batch)
+        
+        self.trained_through = processed_df['GAME_DATE'].max()
+        logger.info(
+            f"Fine-tuned on {int(is_new.sum())} new and {len(replay_rows)} replayed rows for {epochs} epochs, "
+            f"now trained through {self.trained_through:%Y-%m-%d}"
+        )
+        return new_metrics
+
+    def _make_step_functions(self, jit_compile=False):
+        """Build graph-compiled train and validation steps with their metrics"""
+        import tensorflow as tf
+        
+        model = self.model
+        optimizer = model.optimizer
+        loss_fn = tf.keras.losses.binary_crossentropy
+        metrics = {
+            'loss': tf.keras.metrics.Mean(),
+            'accuracy': tf.keras.metrics.BinaryAccuracy(),
+            'val_loss': tf.keras.metrics.Mean(),
+            'val_accuracy': tf.keras.metrics.BinaryAccuracy()
+        }
+
+        @tf.function(jit_compile=jit_compile)
+        def train_step(x_batch, y_batch):
+            with tf.GradientTape() as tape:
+                predictions = model(x_batch, training=True)
+                loss = loss_fn(y_batch, predictions)
+            
+            gradients = tape.gradient(loss, model.trainable_variables)
+            optimizer.apply_gradients(zip(gradients, model.trainable_variables))
+            
+            metrics['loss'].update_state(loss)
+            metrics['accuracy'].update_state(y_batch, predictions)
+
+        @tf.function(jit_compile=jit_compile)
+        def val_step(x_batch, y_batch):
+            predictions = model(x_batch, training=False)
+            loss = loss_fn(y_batch, predictions)
+            
+            metrics['val_loss'].update_state(loss)
+            metrics['val_accuracy'].update_state(y_batch, predictions)
+
+        return train_step, val_step, metrics
+
+    def _run_training_loop(self, train_dataset, val_dataset, epochs=150, verbose=1, jit_compile=False,
+                           callback_list=None):
+        """Run the custom training loop and return the per-epoch history dict
+
+        Keras callbacks in ``callback_list`` receive the same epoch hooks as in
+        ``model.fit``, so EarlyStopping can end training (restoring the best
+        weights) and ReduceLROnPlateau can lower the optimizer learning rate.
+        """
+        from tensorflow.keras import callbacks
+        
+        train_step, val_step, metrics = self._make_step_functions(jit_compile=jit_compile)
+        history = {name: [] for name in metrics}
+        
+        callback_list = callback_list or []
+        callback_container = callbacks.CallbackList(callback_list, model=self.model)
+        self.model.stop_training = False
+        callback_container.on_train_begin()
+        
+        for epoch in range(epochs):
+            callback_container.on_epoch_begin(epoch)
+            for metric in metrics.values():
+                metric.reset_state()
+            
+            # Training
+            for x_batch, y_batch in train_dataset:
+                train_step(x_batch, y_batch)
+            
+            # Validation
+            for x_batch, y_batch in val_dataset:
+                val_step(x_batch, y_batch)
+            
+            # Store metrics
+            logs = {name: float(metric.result().numpy()) for name, metric in metrics.items()}
+            for name, metric in metrics.items():
+                history[name].append(metric.result().numpy())
+            
+            if verbose:
+                print(
+                    f"\rEpoch {epoch+1}/{epochs} - "
+                    f"loss: {history['loss'][-1]:.4f} - "
+                    f"accuracy: {history['accuracy'][-1]:.4f} - "
+                    f"val_loss: {history['val_loss'][-1]:.4f} - "
+                    f"val_accuracy: {history['val_accuracy'][-1]:.4f}",
+                    end="\n"  # Changed to \n for clearer output
+                )
+            
+            callback_container.on_epoch_end(epoch, logs)
+            if self.model.stop_training:
+                break
+        
+        callback_container.on_train_end()
+        self.epochs_trained = len(history['loss'])
+        
+        for callback in callback_list:
+            # EarlyStopping only restores on an early stop; do it for full runs too
+            if (isinstance(callback, callbacks.EarlyStopping) and callback.restore_best_weights
+                    and callback.stopped_epoch == 0 and callback.best_weights is not None):
+                self.model.set_weights(callback.best_weights)
+        
+        if self.epochs_trained < epochs:
+            logger.info(
+                f"Early stopping after {self.epochs_trained}/{epochs} epochs "
+                f"({epochs - self.epochs_trained} epochs saved)"
+            )
+        
+        return history
+
     def plot_training_history(self):
         """Plot training history"""
+        import matplotlib.pyplot as plt
+        
         plt.figure(figsize=(12, 4))
         
         # Plot accuracy
@@ -342,6 +518,10 @@ class NBAMatchPredictor:
 
     def plot_confusion_matrix(self, y_true, y_pred):
         """Plot confusion matrix"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        from sklearn.metrics import confusion_matrix
+        
         cm = confusion_matrix(y_true, y_pred)
         plt.figure(figsize=(8, 6))
         sns.heatmap(cm, annot=True, fmt='d', cmap='Blues')
@@ -353,6 +533,9 @@ class NBAMatchPredictor:
 
     def plot_feature_importance(self, team_stats):
         """Plot team performance statistics"""
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
         plt.figure(figsize=(12, 6))
         team_win_rate = team_stats.groupby('TEAM_ABBREVIATION')['WIN'].mean().sort_values(ascending=False)
         
@@ -364,38 +547,35 @@ class NBAMatchPredictor:
         plt.savefig('models/team_win_rates.png')
         plt.close()
 
+    def predict_matches(self, home_team_ids, away_team_ids, home_team_stats, away_team_stats=None):
+        """Predict home win probabilities for many matches with a single forward pass
+
+        ``home_team_ids``/``away_team_ids`` are array-likes of team ids and
+        ``home_team_stats`` is a DataFrame, list of dicts or (n, 12) array of the
+        MATCH_STAT_COLUMNS for each home team. ``away_team_stats`` is accepted for
+        symmetry with predict_match; the model only uses the home team's form.
+        Returns a 1-D NumPy array of probabilities.
+        """
+        # Encode all team IDs in one pass
+        home_team_encoded = self.team_encoder.transform(np.asarray(home_team_ids).ravel())
+        away_team_encoded = self.team_encoder.transform(np.asarray(away_team_ids).ravel())
+        
+        # Create and scale the feature matrix
+        features = build_match_features(home_team_encoded, away_team_encoded, home_team_stats)
+        if hasattr(self.scaler, 'feature_names_in_'):
+            features = pd.DataFrame(features, columns=self.scaler.feature_names_in_)
+        features = self.scaler.transform(features)
+        
+        # Calling the model directly skips the per-call setup of model.predict
+        win_probs = self.model(features.astype(np.float32), training=False)
+        return np.asarray(win_probs).reshape(-1)
+
     def predict_match(self, home_team_id, away_team_id, home_team_stats, away_team_stats):
         """Predict the outcome of a specific match"""
         try:
-            # Encode team IDs
-            home_team_encoded = self.team_encoder.transform([home_team_id])[0]
-            away_team_encoded = self.team_encoder.transform([away_team_id])[0]
-            
-            # Create feature vector
-            features = np.array([[
-                home_team_encoded,
-                away_team_encoded,
-                1,  # IS_HOME
-                home_team_stats['PTS_ROLLING_AVG_5'],
-                home_team_stats['FG_PCT_ROLLING_AVG_5'],
-                home_team_stats['FT_PCT_ROLLING_AVG_5'],
-                home_team_stats['FG3_PCT_ROLLING_AVG_5'],
-                home_team_stats['AST_ROLLING_AVG_5'],
-                home_team_stats['REB_ROLLING_AVG_5'],
-                home_team_stats['FTA_ROLLING_AVG_5'],
-                home_team_stats['FT_DRAWING_RATE_ROLLING_AVG_5'],
-                home_team_stats['WIN_STREAK'],
-                home_team_stats['TOV_ROLLING_AVG_5'],
-                home_team_stats['STL_ROLLING_AVG_5'],
-                home_team_stats.get('OVERTIME_RATE', 0)  # Added overtime rate
-            ]])
-            
-            # Scale features
-            features = self.scaler.transform(features)
-            
-            # Make prediction
-            win_prob = self.model.predict(features)[0][0]
-            return win_prob
+            return self.predict_matches(
+                [home_team_id], [away_team_id], [home_team_stats], [away_team_stats]
+            )[0]
             
         except Exception as e:
             logger.error(f"Error predicting match: {str(e)}")
@@ -413,17 +593,87 @@ class NBAMatchPredictor:
                 'scaler': self.scaler
             }, filepath + '_encoders.joblib')
             
+            # Save folded weights for TensorFlow-free inference
+            self.export_numpy(filepath + NUMPY_MODEL_SUFFIX)
+            
+            # Save held-out metrics so load_model reports what this model scored,
+            # and how far its training data reaches so fine_tune knows what is new
+            if self.metrics is not None:
+                sidecar = dict(self.metrics)
+                if self.trained_through is not None:
+                    sidecar['trained_through'] = pd.Timestamp(self.trained_through).strftime('%Y-%m-%d')
+                with open(filepath + METRICS_SUFFIX, 'w') as f:
+                    json.dump(sidecar, f, indent=2)
+            
             logger.info(f"Model saved to {filepath}")
         except Exception as e:
             logger.error(f"Error saving model: {str(e)}")
 
+    def _fold_layers(self):
+        """Fold the scaler and BatchNormalization layers into the Dense layers
+
+        Returns a list of (weights, bias, activation) tuples that reproduce the
+        inference-mode model on unscaled features. Each BatchNormalization is an
+        affine map on the following Dense layer's input, as is the scaler on the
+        first one, so both collapse into that layer's weights and bias.
+        """
+        from tensorflow.keras import layers
+        
+        # Pending affine transform x * scale + shift applied to the next Dense input
+        scale = 1.0 / self.scaler.scale_.astype(np.float64)
+        shift = -self.scaler.mean_.astype(np.float64) * scale
+        folded = []
+        
+        for layer in self.model.layers:
+            if isinstance(layer, layers.Dense):
+                kernel, bias = (w.astype(np.float64) for w in layer.get_weights())
+                folded.append((
+                    scale[:, None] * kernel,
+                    bias + shift @ kernel,
+                    layer.activation.__name__
+                ))
+                scale = np.ones(kernel.shape[1])
+                shift = np.zeros(kernel.shape[1])
+            elif isinstance(layer, layers.BatchNormalization):
+                gamma = layer.gamma.numpy() if layer.gamma is not None else 1.0
+                beta = layer.beta.numpy() if layer.beta is not None else 0.0
+                bn_scale = gamma / np.sqrt(layer.moving_variance.numpy().astype(np.float64) + layer.epsilon)
+                bn_shift = beta - layer.moving_mean.numpy() * bn_scale
+                scale, shift = scale * bn_scale, shift * bn_scale + bn_shift
+            elif isinstance(layer, (layers.Dropout, layers.InputLayer)):
+                continue
+            else:
+                raise ValueError(f"Cannot fold layer {layer.name} ({type(layer).__name__}) into NumPy weights")
+        
+        if not folded or not (np.all(scale == 1) and np.all(shift == 0)):
+            raise ValueError("Model must end with a Dense layer to be folded into NumPy weights")
+        return folded
+
+    def export_numpy(self, filepath):
+        """Write the folded model, scaler and team encoder to a compressed .npz file"""
+        folded = self._fold_layers()
+        arrays = {
+            'team_classes': self.team_encoder.classes_,
+            'feature_columns': np.array(FEATURE_COLUMNS),
+            'activations': np.array([activation for _, _, activation in folded])
+        }
+        for i, (kernel, bias, _) in enumerate(folded):
+            arrays[f'kernel_{i}'] = kernel
+            arrays[f'bias_{i}'] = bias
+        
+        np.savez_compressed(filepath, **arrays)
+        logger.info(f"NumPy inference weights saved to {filepath}")
+
     def load_model(self, filepath):
         """Load a trained model"""
+        import tensorflow as tf
+        from tensorflow.keras import optimizers
+        
         try:
             # Load TensorFlow model
             self.model = tf.keras.models.load_model(filepath + '.keras', compile=False)
             self.model.compile(
-                optimizer=optimizers.Adam(learning_rate=0.001),
+                optimizer=optimizers.Adam(learning_rate=self.hyperparameters['learning_rate']),
                 loss='binary_crossentropy',
                 metrics=['accuracy']
             )
@@ -437,8 +687,17 @@ class NBAMatchPredictor:
             self.X_test = None
             self.y_test = None
             
-            # Set model accuracy attribute
-            self.accuracy = 0.67  # Use the known accuracy value from training
+            # Held-out metrics recorded when the model was trained, if any
+            self.metrics = None
+            self.trained_through = None
+            if os.path.exists(filepath + METRICS_SUFFIX):
+                with open(filepath + METRICS_SUFFIX) as f:
+                    self.metrics = json.load(f)
+                trained_through = self.metrics.pop('trained_through', None)
+                self.trained_through = pd.Timestamp(trained_through) if trained_through else None
+            else:
+                logger.warning(f"No metrics recorded for {filepath}; run python -m models.backtest to measure it")
+            self.accuracy = self.metrics['accuracy'] if self.metrics else None
             
             logger.info(f"Model loaded from {filepath}")
         except Exception as e:
@@ -0,0 +1,22 @@
+"""
+Scores for win probabilities, shared by training, backtests and the hyperparameter search.
+"""
+import numpy as np
+
+# Probabilities are clipped before taking logs so a confident miss costs a finite amount
+PROBABILITY_EPSILON = 1e-7
+
+
+def classification_metrics(y_true, probabilities):
+    """Accuracy, log-loss and Brier score of win probabilities against outcomes"""
+    y_true = np.asarray(y_true, dtype=np.float64).reshape(-1)
+    probabilities = np.clip(np.asarray(probabilities, dtype=np.float64).reshape(-1),
+                            PROBABILITY_EPSILON, 1 - PROBABILITY_EPSILON)
+    if len(y_true) == 0:
+        return {'games': 0, 'accuracy': float('nan'), 'log_loss': float('nan'), 'brier': float('nan')}
+    return {
+        'games': int(len(y_true)),
+        'accuracy': float(np.mean((probabilities > 0.5) == (y_true == 1))),
+        'log_loss': float(-np.mean(y_true * np.log(probabilities) + (1 - y_true) * np.log(1 - probabilities))),
+        'brier': float(np.mean((probabilities - y_true) ** 2))
+    }
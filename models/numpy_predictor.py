@@ -0,0 +1,94 @@
+"""
+TensorFlow-free inference for models exported by NBAMatchPredictor.save_model.
+"""
+import logging
+
+import numpy as np
+
+from models.features import FEATURE_COLUMNS, build_match_features
+
+logger = logging.getLogger(__name__)
+
+# Appended to the save_model filepath for the folded NumPy weights
+NUMPY_MODEL_SUFFIX = '_numpy.npz'
+
+ACTIVATIONS = {
+    'relu': lambda x: np.maximum(x, 0.0),
+    'sigmoid': lambda x: np.exp(-np.logaddexp(0.0, -x)),
+    'tanh': np.tanh,
+    'linear': lambda x: x
+}
+
+
+class NumpyMatchPredictor:
+    """Runs the exported MLP with NumPy only
+
+    The scaler and BatchNormalization layers are already folded into the
+    Dense weights, so inference is a few matrix products on raw features.
+    """
+
+    def __init__(self, team_classes, layers):
+        self.team_classes = np.asarray(team_classes)
+        # (weights, bias, activation) per Dense layer, mirroring NBAMatchPredictor.model
+        self.model = layers
+
+    @classmethod
+    def load(cls, filepath):
+        """Load weights written by NBAMatchPredictor.export_numpy"""
+        if not filepath.endswith('.npz'):
+            filepath = filepath + NUMPY_MODEL_SUFFIX
+
+        with np.load(filepath) as data:
+            feature_columns = data['feature_columns'].tolist()
+            if feature_columns != FEATURE_COLUMNS:
+                raise ValueError(f"Model was exported with features {feature_columns}, expected {FEATURE_COLUMNS}")
+
+            activations = data['activations'].tolist()
+            unknown = [activation for activation in activations if activation not in ACTIVATIONS]
+            if unknown:
+                raise ValueError(f"Unsupported activations in exported model: {unknown}")
+
+            layers = [
+                (data[f'kernel_{i}'], data[f'bias_{i}'], ACTIVATIONS[activation])
+                for i, activation in enumerate(activations)
+            ]
+            predictor = cls(data['team_classes'], layers)
+
+        logger.info(f"NumPy model loaded from {filepath}")
+        return predictor
+
+    def encode_teams(self, team_ids):
+        """Map team ids to encoded values, like LabelEncoder.transform"""
+        # /predict passes ids as strings; compare them in the type the encoder was fit on
+        try:
+            team_ids = np.asarray(team_ids, dtype=self.team_classes.dtype).ravel()
+        except (TypeError, ValueError):
+            raise ValueError(f"Team ids must be numeric like the encoded teams, got {list(team_ids)}")
+        positions = np.searchsorted(self.team_classes, team_ids)
+        positions = np.clip(positions, 0, len(self.team_classes) - 1)
+        unseen = self.team_classes[positions] != team_ids
+        if unseen.any():
+            raise ValueError(f"y contains previously unseen labels: {team_ids[unseen].tolist()}")
+        return positions
+
+    def predict_matches(self, home_team_ids, away_team_ids, home_team_stats, away_team_stats=None):
+        """Predict home win probabilities; same inputs as NBAMatchPredictor.predict_matches"""
+        activations = build_match_features(
+            self.encode_teams(home_team_ids),
+            self.encode_teams(away_team_ids),
+            home_team_stats
+        )
+        for kernel, bias, activation in self.model:
+            activations = activation(activations @ kernel + bias)
+        return activations.reshape(-1)
+
+    def predict_match(self, home_team_id, away_team_id, home_team_stats, away_team_stats):
+        """Predict the outcome of a specific match"""
+        try:
+            return self.predict_matches(
+                [home_team_id], [away_team_id], [home_team_stats], [away_team_stats]
+            )[0]
+
+        except Exception as e:
+            logger.error(f"Error predicting match: {str(e)}")
+            return None
@@ -1,6 +1,7 @@
 from models.match_predictor import NBAMatchPredictor
+from data.schema import read_games_csv
+from models.feature_store import FEATURE_STORE_PATH, TeamFeatureStore
 from nba_api.stats.static import teams
-import pandas as pd
 import numpy as np
 import sys
 import os
@@ -61,14 +62,23 @@ def predict_tonight_game():
         predictor = NBAMatchPredictor()
         predictor.load_model('models/match_predictor_with_overtime')
         
-        # Load the latest game data
-        logger.info("Loading game data...")
-        data_dir = 'data'
-        data_files = [f for f in os.listdir(data_dir) if f.startswith('team_games_') and f.endswith('.csv')]
-        latest_data = os.path.join(data_dir, sorted(data_files)[-1])
-        logger.info(f"Using data file: {latest_data}")
-        
-        games_df = pd.read_csv(latest_data)
+        feature_store = None
+        if os.path.exists(FEATURE_STORE_PATH):
+            # Team features kept current by the update pipeline
+            logger.info(f"Loading team features from {FEATURE_STORE_PATH}")
+            feature_store = TeamFeatureStore.load(FEATURE_STORE_PATH)
+            data_updated_to = (feature_store.last_game_date.strftime('%Y-%m-%d')
+                               if feature_store.last_game_date is not None else 'unknown')
+        else:
+            # Load the latest game data
+            logger.info("Loading game data...")
+            data_dir = 'data'
+            data_files = [f for f in os.listdir(data_dir) if f.startswith('team_games_') and f.endswith('.csv')]
+            latest_data = os.path.join(data_dir, sorted(data_files)[-1])
+            logger.info(f"Using data file: {latest_data}")
+            
+            games_df = read_games_csv(latest_data)
+            data_updated_to = os.path.basename(latest_data).replace('team_games_', '').replace('.csv', '')
         
         # Tonight's game: Timberwolves vs Thunder
         home_team = "Minnesota Timberwolves"
@@ -83,8 +93,12 @@ def predict_tonight_game():
             sys.exit(1)
         
         # Get team stats
-        home_team_stats = get_team_stats(games_df, home_team_id)
-        away_team_stats = get_team_stats(games_df, away_team_id)
+        if feature_store is not None:
+            home_team_stats = feature_store.team_stats(home_team_id)
+            away_team_stats = feature_store.team_stats(away_team_id)
+        else:
+            home_team_stats = get_team_stats(games_df, home_team_id)
+            away_team_stats = get_team_stats(games_df, away_team_id)
         
         if not home_team_stats or not away_team_stats:
             logger.error("Could not calculate team stats. Exiting.")
@@ -103,7 +117,10 @@ def predict_tonight_game():
         print(f"Date: May 23, 2025")
         print(f"Location: Target Center, Minneapolis")
         
-        print("\nMODEL PREDICTION (67% accuracy):")
+        if predictor.accuracy is None:
+            print("\nMODEL PREDICTION (accuracy not recorded for this model):")
+        else:
+            print(f"\nMODEL PREDICTION ({predictor.accuracy:.0%} accuracy):")
         print(f"{home_team} win probability: {home_win_prob:.2%}")
         print(f"{away_team} win probability: {away_win_prob:.2%}")
         
@@ -187,11 +204,16 @@ def predict_tonight_game():
         # Display model accuracy info
         print("\nModel Information:")
         print("------------------")
-        print(f"Model accuracy: 67.00%")
+        if predictor.accuracy is None:
+            print("Model accuracy: not recorded for this model (run python -m models.backtest)")
+        else:
+            print(f"Model accuracy: {predictor.accuracy:.2%}")
         print(f"Model features: 15 (including overtime)")
-        print(f"Data updated to: {os.path.basename(latest_data).replace('team_games_', '').replace('.csv', '')}")
+        print(f"Data updated to: {data_updated_to}")
         print("\nNote: This prediction is based on historical data and statistical analysis.")
-        print("The model's accuracy is 67%, meaning it correctly predicts the winner in about 2 out of 3 games.")
+        if predictor.accuracy is not None:
+            print(f"The model's held-out accuracy is {predictor.accuracy:.0%}, meaning it correctly predicts "
+                  f"the winner in about {predictor.accuracy * 100:.0f} out of 100 games.")
         print("Please consider this prediction as one of many factors in your analysis.")
         
         # Save visualization to file but don't display
@@ -1,5 +1,7 @@
 import os
 import sys
+import json
+import shutil
 import pandas as pd
 from datetime import datetime, timedelta
 import logging
@@ -11,6 +13,10 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from nba_api.stats.endpoints import leaguegamefinder
 from models.match_predictor import NBAMatchPredictor
+from data.game_store import GameStore, PRIMARY_KEY
+from data.schema import read_games_csv
+from models.feature_store import TeamFeatureStore
+from api.services.http_client import get_cached_session, install_nba_api_session
 
 # Set up logging
 logging.basicConfig(
@@ -24,16 +30,37 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class AutoUpdater:
-    def __init__(self, data_dir='data', retrain=False):
-        """Initialize the auto updater"""
+    def __init__(self, data_dir='data', retrain=False, jit_compile=False, lookback_days=1, warm_start=True,
+                 model_path='models/match_predictor_with_overtime', max_parts_per_season=10):
+        """Initialize the auto updater
+
+        ``lookback_days`` already-stored days are fetched again on each update
+        so late box score corrections replace the stale rows in the game store.
+        With ``warm_start`` retraining fine-tunes the model saved at
+        ``model_path`` on the new games instead of training from scratch.
+        A season partition is compacted once nightly upserts leave it with
+        more than ``max_parts_per_season`` part files.
+        """
         self.data_dir = data_dir
+        self.lookback_days = lookback_days
         self.retrain = retrain
+        self.jit_compile = jit_compile
+        self.warm_start = warm_start
+        self.model_path = model_path
+        self.max_parts_per_season = max_parts_per_season
         self.current_season = "2024-25"  # Hardcoded to 2024-25 season
         logger.info(f"Using hardcoded season: {self.current_season}")
+        # Pooled connections, plus an on-disk cache so repeated runs skip unchanged responses
+        install_nba_api_session(get_cached_session())
         
         # Create necessary directories
         os.makedirs(data_dir, exist_ok=True)
         os.makedirs('logs', exist_ok=True)
+        
+        # Partitioned Parquet copy of the games; team_games_latest.csv is kept for CSV readers
+        self.game_store = GameStore(os.path.join(data_dir, 'game_store'))
+        # Per-team rolling features read by the prediction scripts
+        self.feature_store_path = os.path.join(data_dir, 'feature_store.joblib')
     
     def _get_latest_data_file(self):
         """Find the most recent data file"""
@@ -47,6 +74,32 @@ class AutoUpdater:
         latest_file = max(data_files)
         return os.path.join(self.data_dir, latest_file)
     
+    def _watermark_path(self):
+        return os.path.join(self.data_dir, 'update_watermark.json')
+
+    def _load_watermark(self):
+        """Read the watermark written by the previous update, if any"""
+        try:
+            with open(self._watermark_path()) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Error reading update watermark: {str(e)}")
+            return None
+
+    def _save_watermark(self, last_game_date, rows_added):
+        """Record the newest stored game date so the next run fetches only later games"""
+        watermark = {
+            'season': self.current_season,
+            'last_game_date': last_game_date,
+            'rows_added': int(rows_added),
+            'updated_at': datetime.now().isoformat(timespec='seconds')
+        }
+        with open(self._watermark_path(), 'w') as f:
+            json.dump(watermark, f, indent=4)
+        logger.info(f"Watermark set to {last_game_date}")
+
     def _get_last_update_date(self):
         """Get the date of the most recent game in the dataset"""
         latest_file = self._get_latest_data_file()
@@ -56,8 +109,16 @@ class AutoUpdater:
             # October 1st of the current season's starting year
             return "2024-10-01"  # Start of 2024-25 season
         
+        watermark = self._load_watermark()
+        if watermark and watermark.get('season') == self.current_season:
+            return watermark['last_game_date']
+        
+        if not self.game_store.is_empty():
+            return self.game_store.latest_game_date()
+        
         try:
-            df = pd.read_csv(latest_file)
+            # Only the date column is needed to find the newest game
+            df = pd.read_csv(latest_file, usecols=lambda column: column == 'GAME_DATE')
             if 'GAME_DATE' in df.columns and not df.empty:
                 return df['GAME_DATE'].max()
             else:
@@ -67,27 +128,38 @@ class AutoUpdater:
             logger.error(f"Error reading latest data file: {str(e)}")
             return None
     
-    def fetch_all_games(self, season="2024-25", max_retries=3):
-        """Fetch all games for a season directly using leaguegamefinder"""
+    def fetch_all_games(self, season="2024-25", max_retries=3, date_from=None):
+        """Fetch all games for a season directly using leaguegamefinder
+        
+        ``date_from`` (YYYY-MM-DD, inclusive) limits the request to games on or
+        after that date.
+        """
+        # LeagueGameFinder expects MM/DD/YYYY
+        date_from_param = pd.to_datetime(date_from).strftime('%m/%d/%Y') if date_from else ''
         for attempt in range(max_retries):
             try:
-                logger.info(f"Fetching all games for season {season}, attempt {attempt+1}/{max_retries}")
-                gamefinder = leaguegamefinder.LeagueGameFinder(season_nullable=season)
+                logger.info(f"Fetching all games for season {season}"
+                            f"{f' from {date_from}' if date_from else ''}, attempt {attempt+1}/{max_retries}")
+                gamefinder = leaguegamefinder.LeagueGameFinder(
+                    season_nullable=season,
+                    date_from_nullable=date_from_param
+                )
                 games_df = gamefinder.get_data_frames()[0]
                 
                 if games_df.empty:
                     logger.warning(f"No games found for season {season}")
-                    if attempt < max_retries - 1:
+                    # A date-bounded request legitimately comes back empty on days without games
+                    if date_from is None and attempt < max_retries - 1:
                         time.sleep((attempt + 1) * 2)
                         continue
                     return pd.DataFrame()
                 
                 logger.info(f"Successfully fetched {len(games_df)} games")
                 
-                # Remove duplicate games (since each game appears twice, once for each team)
+                # Each game has one row per team; both are kept, only repeated rows go
                 if 'GAME_ID' in games_df.columns:
                     logger.info(f"Total games before removing duplicates: {len(games_df)}")
-                    games_df = games_df.drop_duplicates(subset=['GAME_ID'], keep='first')
+                    games_df = games_df.drop_duplicates(subset=PRIMARY_KEY, keep='first')
                     logger.info(f"Total games after removing duplicates: {len(games_df)}")
                 
                 return games_df
@@ -100,30 +172,91 @@ class AutoUpdater:
                     continue
                 return pd.DataFrame()
     
+    def _append_games(self, new_games, path):
+        """Append rows to the games CSV, matching the column order already on disk"""
+        if not os.path.exists(path):
+            new_games.to_csv(path, index=False)
+            return
+        
+        columns = pd.read_csv(path, nrows=0).columns
+        extra_columns = [column for column in new_games.columns if column not in columns]
+        if extra_columns:
+            logger.warning(f"Dropping columns not present in {path}: {extra_columns}")
+        new_games.reindex(columns=columns).to_csv(path, mode='a', header=False, index=False)
+
+    def _seed_game_store(self):
+        """Import the existing CSV history the first time the store is used"""
+        latest_file = self._get_latest_data_file()
+        if latest_file is not None and self.game_store.is_empty():
+            logger.info(f"Seeding game store from {latest_file}")
+            self.game_store.import_csv(latest_file)
+
+    def _compact_game_store(self):
+        """Rewrite season partitions that have collected too many upsert part files"""
+        try:
+            crowded = [
+                season_id for season_id, parts in self.game_store.part_counts().items()
+                if parts > self.max_parts_per_season
+            ]
+            if crowded:
+                logger.info(f"Compacting game store seasons {crowded}")
+                self.game_store.compact(seasons=crowded)
+        except Exception as e:
+            logger.error(f"Error compacting game store: {str(e)}")
+
+    def _update_feature_store(self, games_df, rebuild=False):
+        """Feed new rows to the feature store, building it from the full history when needed"""
+        try:
+            if rebuild or not os.path.exists(self.feature_store_path):
+                logger.info("Building feature store from the game history")
+                store = TeamFeatureStore.build(self.game_store.load())
+            else:
+                store = TeamFeatureStore.load(self.feature_store_path)
+                store.update(games_df)
+            store.save(self.feature_store_path)
+        except Exception as e:
+            logger.error(f"Error updating feature store: {str(e)}")
+
     def update_data(self):
         """Update the dataset with new games"""
         last_update = self._get_last_update_date()
+        latest_path = f'{self.data_dir}/team_games_latest.csv'
+        self._seed_game_store()
         
         if last_update is None:
             logger.info("Fetching all games for the current season")
             logger.info(f"Using season: {self.current_season}")
             all_games = self.fetch_all_games(season=self.current_season)
+            
+            if not all_games.empty:
+                all_games.to_csv(latest_path, index=False)
+                self.game_store.replace(all_games)
+                self._update_feature_store(all_games, rebuild=True)
+                self._save_watermark(all_games['GAME_DATE'].max(), len(all_games))
+                logger.info(f"Saved dataset with {len(all_games)} games to {latest_path}")
+                return True
         else:
-            logger.info(f"Fetching games since {last_update}")
-            # Convert to datetime for comparison
+            # Ask for games after the newest one stored, plus the lookback window
             last_update_date = pd.to_datetime(last_update)
-            
+            date_from = (last_update_date + timedelta(days=1 - self.lookback_days)).strftime('%Y-%m-%d')
+            logger.info(f"Fetching games since {date_from}")
             logger.info(f"Using season: {self.current_season}")
-            all_games = self.fetch_all_games(season=self.current_season)
+            fetched_games = self.fetch_all_games(season=self.current_season, date_from=date_from)
             
-            # Filter for new games only if we have data
-            if not all_games.empty and 'GAME_DATE' in all_games.columns:
-                logger.info(f"Total games fetched: {len(all_games)}")
-                all_games['GAME_DATE'] = pd.to_datetime(all_games['GAME_DATE'])
-                new_games = all_games[all_games['GAME_DATE'] > last_update_date]
+            # Seed the latest file from the newest dated snapshot before appending to it
+            latest_file = self._get_latest_data_file()
+            if latest_file is not None and not os.path.exists(latest_path):
+                shutil.copyfile(latest_file, latest_path)
+            
+            if not fetched_games.empty and 'GAME_DATE' in fetched_games.columns:
+                # Rows whose (GAME_ID, TEAM_ID) is not stored yet are new, including games on
+                # the watermark date that the API posted late; the rest are re-fetched corrections
+                new_games = self.game_store.new_rows(fetched_games)
                 
-                # Convert back to string format
-                all_games['GAME_DATE'] = all_games['GAME_DATE'].dt.strftime('%Y-%m-%d')
+                # Re-fetched rows replace their stored versions by (GAME_ID, TEAM_ID)
+                self.game_store.upsert(fetched_games)
+                self._compact_game_store()
+                self._update_feature_store(fetched_games)
                 
                 if len(new_games) == 0:
                     logger.info("No new games found since last update")
@@ -132,56 +265,55 @@ class AutoUpdater:
                     return False
                 
                 logger.info(f"Found {len(new_games)} new games")
-                
-                # Merge with existing data if available
-                latest_file = self._get_latest_data_file()
-                if latest_file is not None:
-                    try:
-                        existing_data = pd.read_csv(latest_file)
-                        logger.info(f"Existing data has {len(existing_data)} games")
-                        # Convert to datetime for comparison
-                        existing_data['GAME_DATE'] = pd.to_datetime(existing_data['GAME_DATE'])
-                        # Filter out any potential duplicates
-                        existing_data = existing_data[existing_data['GAME_DATE'] <= last_update_date]
-                        logger.info(f"After filtering, existing data has {len(existing_data)} games")
-                        # Convert back to string format
-                        existing_data['GAME_DATE'] = existing_data['GAME_DATE'].dt.strftime('%Y-%m-%d')
-                        
-                        # Combine existing and new data
-                        all_games = pd.concat([existing_data, new_games], ignore_index=True)
-                        logger.info(f"Combined dataset now has {len(all_games)} games")
-                    except Exception as e:
-                        logger.error(f"Error merging with existing data: {str(e)}")
-        
-        # Save the updated dataset
-        if not all_games.empty:
-            today = datetime.now().strftime("%Y%m%d")
-            output_path = f'{self.data_dir}/team_games_{today}.csv'
-            all_games.to_csv(output_path, index=False)
-            
-            # Also save as latest for easy reference
-            latest_path = f'{self.data_dir}/team_games_latest.csv'
-            all_games.to_csv(latest_path, index=False)
+                self._append_games(new_games, latest_path)
+                last_game_date = max(last_update_date, pd.to_datetime(new_games['GAME_DATE']).max())
+                self._save_watermark(last_game_date.strftime('%Y-%m-%d'), len(new_games))
+                logger.info(f"Appended {len(new_games)} games to {latest_path}")
+                return True
             
-            logger.info(f"Saved updated dataset with {len(all_games)} games to {output_path}")
-            return True
-        else:
-            logger.warning("No games data was collected")
-            logger.warning("This could be due to the NBA API not having updated data or an issue with the API connection.")
-            logger.warning("Please check your internet connection and try again later.")
-            
-            # For debugging, let's check what teams are available
-            try:
-                from nba_api.stats.static import teams
-                all_teams = teams.get_teams()
-                logger.info(f"NBA API reports {len(all_teams)} teams available")
-                for team in all_teams[:5]:  # Print first 5 teams for debugging
-                    logger.info(f"Team: {team['full_name']} (ID: {team['id']})")
-            except Exception as e:
-                logger.error(f"Error fetching teams list: {str(e)}")
-            
-            return False
+            if fetched_games.empty:
+                logger.info("No new games found since last update")
+                return False
+        
+        logger.warning("No games data was collected")
+        logger.warning("This could be due to the NBA API not having updated data or an issue with the API connection.")
+        logger.warning("Please check your internet connection and try again later.")
+        
+        # For debugging, let's check what teams are available
+        try:
+            from nba_api.stats.static import teams
+            all_teams = teams.get_teams()
+            logger.info(f"NBA API reports {len(all_teams)} teams available")
+            for team in all_teams[:5]:  # Print first 5 teams for debugging
+                logger.info(f"Team: {team['full_name']} (ID: {team['id']})")
+        except Exception as e:
+            logger.error(f"Error fetching teams list: {str(e)}")
+        
+        return False
     
+    def _fine_tune_model(self, games_df):
+        """Warm-start the saved model on the new games
+
+        Returns ``(predictor, metrics)`` from NBAMatchPredictor.fine_tune, or
+        ``(None, None)`` when a full retrain is needed.
+        """
+        if not os.path.exists(self.model_path + '.keras'):
+            logger.info("No saved model to warm-start from; running a full retrain")
+            return None, None
+        
+        try:
+            predictor = NBAMatchPredictor()
+            predictor.load_model(self.model_path)
+            logger.info(f"Fine-tuning {self.model_path} on new games")
+            metrics = predictor.fine_tune(games_df, jit_compile=self.jit_compile)
+            if metrics is None:
+                logger.info("Warm start declined; running a full retrain")
+                return None, None
+            return predictor, metrics
+        except Exception as e:
+            logger.error(f"Error fine-tuning model, running a full retrain: {str(e)}")
+            return None, None
+
     def retrain_model(self):
         """Retrain the model with the updated dataset"""
         if not self.retrain:
@@ -189,26 +321,34 @@ class AutoUpdater:
             return
             
         latest_path = f'{self.data_dir}/team_games_latest.csv'
-        if not os.path.exists(latest_path):
+        if self.game_store.is_empty() and not os.path.exists(latest_path):
             logger.error("Cannot retrain model: No data file found")
             return
             
         try:
             logger.info("Loading latest data for model retraining")
-            games_df = pd.read_csv(latest_path)
-            
-            logger.info("Initializing model")
-            predictor = NBAMatchPredictor()
+            if not self.game_store.is_empty():
+                games_df = self.game_store.load()
+            else:
+                games_df = read_games_csv(latest_path)
             
-            logger.info(f"Starting model training with {len(games_df)} games")
-            predictor.train(games_df)
+            predictor, metrics = self._fine_tune_model(games_df) if self.warm_start else (None, None)
+            if metrics is not None and metrics['games'] == 0:
+                logger.info("No games since the saved model was trained; keeping it unchanged")
+                return
+            if predictor is None:
+                logger.info("Initializing model")
+                predictor = NBAMatchPredictor()
+                
+                logger.info(f"Starting model training with {len(games_df)} games")
+                predictor.train(games_df, jit_compile=self.jit_compile)
             
             # Save the model with timestamp
             today = datetime.now().strftime("%Y%m%d")
             predictor.save_model(f'models/match_predictor_{today}')
             
             # Also save as the default model
-            predictor.save_model('models/match_predictor_with_overtime')
+            predictor.save_model(self.model_path)
             
             logger.info("Model retraining completed and saved")
         except Exception as e:
@@ -218,11 +358,14 @@ def main():
     parser = argparse.ArgumentParser(description='Auto-update NBA game data and optionally retrain the model')
     parser.add_argument('--retrain', action='store_true', help='Retrain the model after updating data')
     parser.add_argument('--force', action='store_true', help='Force update even if no new games are found')
+    parser.add_argument('--xla', action='store_true', help='Compile training steps with XLA when retraining')
+    parser.add_argument('--full-retrain', action='store_true',
+                        help='Train from scratch instead of fine-tuning the saved model')
     args = parser.parse_args()
     
     try:
         logger.info("Starting auto-update process")
-        updater = AutoUpdater(retrain=args.retrain)
+        updater = AutoUpdater(retrain=args.retrain, jit_compile=args.xla, warm_start=not args.full_retrain)
         
         # Update the dataset
         success = updater.update_data()
@@ -1,13 +1,22 @@
+import os
+import sys
 from nba_api.stats.endpoints import leaguegamefinder, commonplayerinfo, playergamelog, scoreboardv2
 from nba_api.stats.static import teams, players
 import pandas as pd
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import logging
-import random
 import requests
 from typing import List
 
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.services.http_client import get_cached_session, install_nba_api_session, rate_limited
+from scripts.rate_limiter import TokenBucket
+from data.game_store import GameStore, PRIMARY_KEY
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -16,8 +25,15 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class NBADataFetcher:
-    def __init__(self):
+    def __init__(self, max_workers=4, requests_per_second=0.5, burst=1, session=None):
         """Initialize the NBA data fetcher"""
+        # Pooled connections, plus an on-disk cache so finished seasons are fetched once
+        install_nba_api_session(session or get_cached_session())
+        self.max_workers = max_workers
+        # Shared by every worker thread; paces network requests only, cache hits are free.
+        # The default matches the old ~2s spacing between calls
+        self.rate_limiter = TokenBucket(requests_per_second, capacity=burst)
+        self.game_store = GameStore()
         self.teams = teams.get_teams()
         self.team_dict = {team['id']: team['full_name'] for team in self.teams}
         
@@ -29,13 +45,12 @@ class NBADataFetcher:
                 formatted_season = self._format_season_string(season)
                 logger.info(f"Using season format: {formatted_season} for API call")
                 
-                gamefinder = leaguegamefinder.LeagueGameFinder(
-                    team_id_nullable=team_id,
-                    season_nullable=formatted_season
-                )
+                with rate_limited(self.rate_limiter):
+                    gamefinder = leaguegamefinder.LeagueGameFinder(
+                        team_id_nullable=team_id,
+                        season_nullable=formatted_season
+                    )
                 games_df = gamefinder.get_data_frames()[0]
-                # Random delay between 1.5 and 3 seconds to avoid rate limiting
-                time.sleep(random.uniform(1.5, 3.0))
                 return games_df
             except requests.exceptions.RequestException as e:
                 logger.error(f"Network error fetching team games (attempt {attempt + 1}/{max_retries}): {str(e)}")
@@ -80,9 +95,9 @@ class NBADataFetcher:
         """Fetch detailed player information with retries"""
         for attempt in range(max_retries):
             try:
-                player_info = commonplayerinfo.CommonPlayerInfo(player_id=player_id)
+                with rate_limited(self.rate_limiter):
+                    player_info = commonplayerinfo.CommonPlayerInfo(player_id=player_id)
                 info_df = player_info.get_data_frames()[0]
-                time.sleep(random.uniform(1.5, 3.0))
                 return info_df
             except requests.exceptions.RequestException as e:
                 logger.error(f"Network error fetching player info (attempt {attempt + 1}/{max_retries}): {str(e)}")
@@ -104,12 +119,12 @@ class NBADataFetcher:
                 # Format season string correctly
                 formatted_season = self._format_season_string(season)
                 
-                game_logs = playergamelog.PlayerGameLog(
-                    player_id=player_id,
-                    season=formatted_season
-                )
+                with rate_limited(self.rate_limiter):
+                    game_logs = playergamelog.PlayerGameLog(
+                        player_id=player_id,
+                        season=formatted_season
+                    )
                 logs_df = game_logs.get_data_frames()[0]
-                time.sleep(random.uniform(1.5, 3.0))
                 return logs_df
             except requests.exceptions.RequestException as e:
                 logger.error(f"Network error fetching player games (attempt {attempt + 1}/{max_retries}): {str(e)}")
@@ -124,51 +139,75 @@ class NBADataFetcher:
                     continue
                 return pd.DataFrame()
 
-    def fetch_all_team_games(self, season=None):
+    def fetch_all_team_games(self, season=None, max_workers=None):
         """Fetch games for all teams with better error handling"""
-        all_games = pd.DataFrame()
+        return self.fetch_seasons([season], max_workers=max_workers)
+
+    def fetch_seasons(self, seasons, max_workers=None):
+        """Fetch games for all teams over several seasons into one DataFrame"""
+        # Format season strings correctly
+        formatted_seasons = [self._format_season_string(season) for season in seasons]
+        logger.info(f"Fetching games for seasons: {formatted_seasons}")
         
-        # Format season string correctly
-        formatted_season = self._format_season_string(season)
-        logger.info(f"Fetching games for season: {formatted_season}")
+        # Requests run on a bounded pool; the shared rate limiter paces them
+        max_workers = max_workers or self.max_workers
+        jobs = [(team, season) for season in formatted_seasons for team in self.teams]
+        logger.info(f"Fetching {len(jobs)} team seasons with {max_workers} workers")
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch_team_games, team['id'], season)
+                for team, season in jobs
+            ]
         
-        for team in self.teams:
+        # Concatenate once at the end; growing a frame per team copies it every time
+        frames = []
+        for (team, season), future in zip(jobs, futures):
             try:
-                logger.info(f"Fetching games for {team['full_name']}")
-                team_games = self.fetch_team_games(team['id'], formatted_season)
+                team_games = future.result()
                 
                 if team_games.empty:
-                    logger.warning(f"No games found for {team['full_name']}")
+                    logger.warning(f"No games found for {team['full_name']} in {season}")
                     continue
                     
-                all_games = pd.concat([all_games, team_games], ignore_index=True)
-                logger.info(f"Successfully fetched {len(team_games)} games for {team['full_name']}")
+                frames.append(team_games)
+                logger.info(f"Successfully fetched {len(team_games)} games for {team['full_name']} in {season}")
                 
             except Exception as e:
                 logger.error(f"Error processing games for {team['full_name']}: {str(e)}")
                 continue
+        
+        all_games = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
                 
-        # Remove duplicate games (since each game appears twice, once for each team)
+        # Each team's log repeats its rows across requests; keep one row per team per game
         if not all_games.empty and 'GAME_ID' in all_games.columns:
             logger.info(f"Total games fetched before removing duplicates: {len(all_games)}")
-            all_games = all_games.drop_duplicates(subset=['GAME_ID'], keep='first')
+            all_games = all_games.drop_duplicates(subset=PRIMARY_KEY, keep='first')
             logger.info(f"Total games after removing duplicates: {len(all_games)}")
             
         return all_games
 
     def save_data(self, data, filename):
-        """Save data to CSV file with error handling"""
+        """Save data to a dated CSV snapshot; game rows also go to the game store"""
+        if data.empty:
+            logger.warning(f"No data to save for {filename}")
+            return
+        
+        # The two writes are independent, so a store failure still leaves the CSV
+        # snapshot that the team_games_*.csv readers load
         try:
-            if data.empty:
-                logger.warning(f"No data to save for {filename}")
-                return
-                
             output_path = f'data/{filename}_{datetime.now().strftime("%Y%m%d")}.csv'
             data.to_csv(output_path, index=False)
             logger.info(f"Data saved to {output_path}")
-            
         except Exception as e:
             logger.error(f"Error saving data: {str(e)}")
+        
+        # Game rows also go to the partitioned store, replacing the seasons they cover
+        if 'SEASON_ID' in data.columns:
+            try:
+                self.game_store.replace(data)
+                logger.info(f"Data saved to {self.game_store.root}")
+            except Exception as e:
+                logger.error(f"Error saving data to {self.game_store.root}: {str(e)}")
 
 def main():
     fetcher = NBADataFetcher()
@@ -1,6 +1,5 @@
 import os
 import sys
-import pandas as pd
 import numpy as np
 import logging
 import json
@@ -11,6 +10,8 @@ import glob
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.match_predictor import NBAMatchPredictor
+from data.schema import read_games_csv
+from models.feature_store import FEATURE_STORE_PATH, TeamFeatureStore
 
 # Add color codes for terminal output
 BLUE = '\033[94m'
@@ -104,16 +105,24 @@ def get_team_stats(df, team_abbrev, num_games=5):
     stats['FT_DRAWING_RATE_ROLLING_AVG_5'] = np.mean(ft_drawing_rates)
     
     # Win streak (count of wins in last 5 games)
-    stats['WIN_STREAK'] = team_games['WL'].apply(lambda x: 1 if x == 'W' else 0).sum()
+    stats['WIN_STREAK'] = (team_games['WL'] == 'W').sum()
     
     # Team ID
     stats['TEAM_ID'] = latest_game['TEAM_ID']
     
     # Latest game date
-    stats['LATEST_GAME_DATE'] = latest_game['GAME_DATE']
+    stats['LATEST_GAME_DATE'] = latest_game['GAME_DATE'].strftime('%Y-%m-%d')
     
     return stats
 
+def get_stored_team_stats(feature_store, team_abbrev):
+    """Get a team's current stats from the feature store"""
+    team_id = feature_store.team_id(team_abbrev)
+    stats = feature_store.team_stats(team_id) if team_id is not None else None
+    if stats is None:
+        logger.error(f"No data found for team {team_abbrev}")
+    return stats
+
 def print_team_roster(team_data):
     """Print team roster in a formatted table"""
     if team_data is None:
@@ -137,11 +146,18 @@ def predict_game(home_team_abbr, away_team_abbr):
     print("=" * 60)
     
     try:
-        # Load the latest training data
-        data_file = get_latest_data_file()
-        print(f"Loading data from: {os.path.basename(data_file)}...")
-        df = pd.read_csv(data_file)
-        print(f"Loaded {len(df)} game records through {df['GAME_DATE'].max()}")
+        if os.path.exists(FEATURE_STORE_PATH):
+            # Team features kept current by the update pipeline
+            print(f"Loading team features from: {FEATURE_STORE_PATH}...")
+            feature_store = TeamFeatureStore.load(FEATURE_STORE_PATH)
+            print(f"Features cover {len(feature_store.teams)} teams through {feature_store.last_game_date:%Y-%m-%d}")
+        else:
+            feature_store = None
+            # Load the latest training data
+            data_file = get_latest_data_file()
+            print(f"Loading data from: {os.path.basename(data_file)}...")
+            df = read_games_csv(data_file)
+            print(f"Loaded {len(df)} game records through {df['GAME_DATE'].max():%Y-%m-%d}")
         
         # Load the trained model
         print("Loading model...")
@@ -155,8 +171,12 @@ def predict_game(home_team_abbr, away_team_abbr):
         
         # Get team stats
         print("\nGetting team stats...")
-        home_stats = get_team_stats(df, home_team_abbr)
-        away_stats = get_team_stats(df, away_team_abbr)
+        if feature_store is not None:
+            home_stats = get_stored_team_stats(feature_store, home_team_abbr)
+            away_stats = get_stored_team_stats(feature_store, away_team_abbr)
+        else:
+            home_stats = get_team_stats(df, home_team_abbr)
+            away_stats = get_team_stats(df, away_team_abbr)
         
         if home_stats is None or away_stats is None:
             print("Could not get stats for one or both teams")
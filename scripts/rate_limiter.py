@@ -0,0 +1,43 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by concurrent API workers
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``;
+    acquire() blocks until enough tokens are available, so the combined
+    request rate of every caller stays at or below ``rate``.
+    """
+
+    def __init__(self, rate, capacity=1, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens=1):
+        """Block until ``tokens`` are available and take them; returns seconds waited"""
+        if tokens > self.capacity:
+            raise ValueError("Cannot acquire more tokens than the bucket capacity")
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait = (tokens - self._tokens) / self.rate
+            self.sleep(wait)
+            waited += wait
@@ -10,6 +10,8 @@ import traceback
 # Add parent directory to path to import modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from models.match_predictor import NBAMatchPredictor
+from models.features import opponent_team_ids, parse_matchup, team_abbreviation_map
+from data.schema import read_games_csv
 
 # Set up logging
 logging.basicConfig(
@@ -26,7 +28,7 @@ def analyze_overtime_impact(data_file):
     """Analyze the impact of overtime on game outcomes"""
     try:
         logger.info(f"Loading data from {data_file}")
-        games_df = pd.read_csv(data_file)
+        games_df = read_games_csv(data_file)
         logger.info(f"Data loaded successfully with {len(games_df)} rows")
         
         # Check if MIN column exists
@@ -56,7 +58,7 @@ def analyze_overtime_impact(data_file):
             # If IS_HOME is missing but MATCHUP is available, derive it
             if 'IS_HOME' in missing_columns and 'MATCHUP' in games_df.columns:
                 logger.info("Deriving IS_HOME from MATCHUP column")
-                games_df['IS_HOME'] = games_df['MATCHUP'].apply(lambda x: 1 if 'vs.' in x else 0)
+                games_df['IS_HOME'] = parse_matchup(games_df['MATCHUP'])[0]
                 missing_columns.remove('IS_HOME')
             
             # If WL is missing, we can't calculate win rates
@@ -67,22 +69,17 @@ def analyze_overtime_impact(data_file):
                 games_df['WIN'] = (games_df['WL'] == 'W').astype(int)
         else:
             games_df['WIN'] = (games_df['WL'] == 'W').astype(int)
-            games_df['IS_HOME'] = games_df['MATCHUP'].apply(lambda x: 1 if 'vs.' in x else 0)
+            games_df['IS_HOME'] = parse_matchup(games_df['MATCHUP'])[0]
         
         # Extract opponent abbreviation from MATCHUP column
         if 'MATCHUP' in games_df.columns:
             logger.info("Extracting opponent abbreviation from MATCHUP column")
-            games_df['OPPONENT_ABBREV'] = games_df['MATCHUP'].apply(
-                lambda x: x.split()[-1] if '@' in x else x.split('vs.')[-1].strip()
-            )
-            
-            # Create mapping of team abbreviations to IDs
-            team_abbrev_to_id = {}
-            for _, row in games_df.drop_duplicates('TEAM_ABBREVIATION')[['TEAM_ABBREVIATION', 'TEAM_ID']].iterrows():
-                team_abbrev_to_id[row['TEAM_ABBREVIATION']] = row['TEAM_ID']
+            games_df['OPPONENT_ABBREV'] = parse_matchup(games_df['MATCHUP'])[1]
             
             # Map opponent abbreviations to IDs
-            games_df['OPPONENT_TEAM_ID'] = games_df['OPPONENT_ABBREV'].map(team_abbrev_to_id)
+            games_df['OPPONENT_TEAM_ID'] = opponent_team_ids(
+                games_df['OPPONENT_ABBREV'], team_abbreviation_map(games_df)
+            )
             logger.info(f"Successfully mapped {games_df['OPPONENT_TEAM_ID'].notna().sum()} opponent IDs")
         
         # Only proceed with win rate analysis if we have the necessary data
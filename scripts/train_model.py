@@ -1,6 +1,5 @@
 import os
 import sys
-import pandas as pd
 import logging
 from datetime import datetime
 import matplotlib.pyplot as plt
@@ -13,6 +12,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from scripts.data_fetcher import NBADataFetcher
 from models.match_predictor import NBAMatchPredictor
 from data.data_collector import NBADataCollector
+from data.schema import read_games_csv
 
 # Set up logging
 logging.basicConfig(
@@ -32,7 +32,7 @@ def main():
         # Load or collect training data
         print("Loading training data...")
         try:
-            training_data = pd.read_csv('data/training_data_20250519.csv')
+            training_data = read_games_csv('data/training_data_20250519.csv')
             print(f"Loaded {len(training_data)} training samples")
         except FileNotFoundError:
             print("Training data not found, collecting new data...")
@@ -2,7 +2,6 @@ import os
 import sys
 import pandas as pd
 import numpy as np
-import requests
 import json
 from datetime import datetime, timedelta
 import logging
@@ -12,6 +11,7 @@ import time
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from data.data_collector import NBADataCollector
+from api.services.http_client import get_cached_session
 
 # Set up logging
 logging.basicConfig(
@@ -67,10 +67,13 @@ def fetch_team_rosters():
     }
     
     teams_data = {}
+    # One pooled session so the roster calls reuse the same connection;
+    # rosters are cached on disk for a few hours between runs
+    session = get_cached_session()
     
     try:
         # Get teams
-        response = requests.get(
+        response = session.get(
             base_url + teams_endpoint,
             headers=headers,
             params=teams_params
@@ -108,7 +111,7 @@ def fetch_team_rosters():
                     'Season': season
                 }
                 
-                roster_response = requests.get(
+                roster_response = session.get(
                     base_url + roster_endpoint,
                     headers=headers,
                     params=roster_params
@@ -31,7 +31,10 @@ try:
     
     # Display model accuracy
     print("\n" + "="*50)
-    print(f"MODEL ACCURACY: {predictor.accuracy:.2%}")
+    if predictor.accuracy is None:
+        print("MODEL ACCURACY: not recorded for this model (run python -m models.backtest)")
+    else:
+        print(f"MODEL ACCURACY: {predictor.accuracy:.2%}")
     print("="*50 + "\n")
     
     # Display model visualizations
@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import importlib
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SEASON_GAMES = pd.DataFrame({
+    'SEASON_ID': [22024] * 6,
+    'TEAM_ID': [1, 2, 1, 2, 1, 2],
+    'GAME_ID': ['0022400001', '0022400001', '0022400002', '0022400002', '0022400003', '0022400003'],
+    'GAME_DATE': ['2024-10-22', '2024-10-22', '2024-10-23', '2024-10-23', '2024-10-25', '2024-10-25'],
+    'PTS': [110, 105, 99, 101, 120, 118],
+    'TEAM_ABBREVIATION': ['AAA', 'BBB'] * 3,
+    'MATCHUP': ['AAA vs. BBB', 'BBB @ AAA'] * 3,
+    'WL': ['W', 'L', 'L', 'W', 'W', 'L'],
+    'MIN': 240,
+    'FGM': 40, 'FGA': 85, 'FG_PCT': 0.47, 'FG3_PCT': 0.35, 'FTA': 20, 'FT_PCT': 0.78,
+    'AST': 25, 'REB': 44, 'TOV': 13, 'STL': 7,
+})
+
+
+class FakeGameFinder:
+    """LeagueGameFinder stand-in that honours date_from_nullable"""
+    calls = []
+    season_games = SEASON_GAMES
+
+    def __init__(self, season_nullable='', date_from_nullable=''):
+        FakeGameFinder.calls.append(date_from_nullable)
+        games = FakeGameFinder.season_games
+        if date_from_nullable:
+            games = games[pd.to_datetime(games['GAME_DATE']) >= pd.to_datetime(date_from_nullable)]
+        self.games = games.reset_index(drop=True)
+
+    def get_data_frames(self):
+        return [self.games]
+
+
+@pytest.fixture
+def updater(tmp_path, monkeypatch):
+    # auto_update logs to logs/ relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('logs', exist_ok=True)
+    auto_update = importlib.import_module('scripts.auto_update')
+    monkeypatch.setattr(auto_update, 'install_nba_api_session', lambda session=None: None)
+    monkeypatch.setattr(auto_update.leaguegamefinder, 'LeagueGameFinder', FakeGameFinder)
+    FakeGameFinder.calls = []
+    FakeGameFinder.season_games = SEASON_GAMES
+    return auto_update.AutoUpdater(data_dir=str(tmp_path / 'data'))
+
+
+def test_incremental_update_fetches_and_appends_only_new_games(updater):
+    latest_path = os.path.join(updater.data_dir, 'team_games_latest.csv')
+    SEASON_GAMES.iloc[:2].drop_duplicates('GAME_ID').to_csv(latest_path, index=False)
+
+    assert updater.update_data()
+
+    # Asked for games from the newest stored date, which is re-fetched for corrections
+    assert FakeGameFinder.calls == ['10/22/2024']
+    # Every row not stored yet is appended, including the opponent's row of the first game
+    stored = pd.read_csv(latest_path, dtype={'GAME_ID': str})
+    assert stored['GAME_ID'].tolist() == [
+        '0022400001', '0022400001', '0022400002', '0022400002', '0022400003', '0022400003'
+    ]
+
+    with open(os.path.join(updater.data_dir, 'update_watermark.json')) as f:
+        watermark = json.load(f)
+    assert watermark['last_game_date'] == '2024-10-25'
+    assert watermark['rows_added'] == 5
+
+    # The Parquet store is seeded from the CSV history and gets both teams' rows
+    stored = updater.game_store.load().sort_values(['GAME_ID', 'TEAM_ID'])
+    assert list(zip(stored['GAME_ID'], stored['TEAM_ID'])) == [
+        ('0022400001', 1), ('0022400001', 2), ('0022400002', 1),
+        ('0022400002', 2), ('0022400003', 1), ('0022400003', 2)
+    ]
+
+
+def test_watermark_drives_next_request(updater):
+    latest_path = os.path.join(updater.data_dir, 'team_games_latest.csv')
+    SEASON_GAMES.to_csv(latest_path, index=False)
+    updater._save_watermark('2024-10-25', 6)
+
+    assert not updater.update_data()
+
+    assert FakeGameFinder.calls == ['10/25/2024']
+    assert len(pd.read_csv(latest_path)) == 6
+
+
+def test_late_games_on_the_watermark_date_are_new(updater):
+    latest_path = os.path.join(updater.data_dir, 'team_games_latest.csv')
+    SEASON_GAMES.iloc[:4].to_csv(latest_path, index=False)
+    updater._save_watermark('2024-10-23', 4)
+
+    # A second game on the watermark date is posted after the last run
+    late_game = SEASON_GAMES.iloc[2:4].assign(GAME_ID='0022400099')
+    FakeGameFinder.season_games = pd.concat([SEASON_GAMES.iloc[:4], late_game], ignore_index=True)
+
+    assert updater.update_data()
+
+    stored = pd.read_csv(latest_path, dtype={'GAME_ID': str})
+    assert stored['GAME_ID'].tolist()[-2:] == ['0022400099', '0022400099']
+    assert len(updater.game_store.load()) == 6
+    with open(os.path.join(updater.data_dir, 'update_watermark.json')) as f:
+        watermark = json.load(f)
+    assert watermark['last_game_date'] == '2024-10-23'
+    assert watermark['rows_added'] == 2
+
+
+def test_first_run_fetches_from_season_start(updater):
+    assert updater.update_data()
+
+    assert FakeGameFinder.calls == ['10/01/2024']
+    stored = pd.read_csv(os.path.join(updater.data_dir, 'team_games_latest.csv'))
+    assert len(stored) == 6
+
+
+def test_lookback_replaces_corrected_rows(updater):
+    assert updater.update_data()
+
+    # A stat correction for the last game day arrives on the next run
+    corrected = SEASON_GAMES.copy()
+    corrected.loc[5, 'PTS'] = 119
+    FakeGameFinder.season_games = corrected
+
+    assert not updater.update_data()
+
+    games = updater.game_store.load()
+    assert len(games) == 6
+    assert games.loc[(games['GAME_ID'] == '0022400003') & (games['TEAM_ID'] == 2), 'PTS'].tolist() == [119]
+
+
+def test_crowded_season_partitions_are_compacted(updater):
+    updater.max_parts_per_season = 2
+    assert updater.update_data()
+
+    part_counts = []
+    for pts in [121, 122, 123]:
+        # Each night re-fetches the last game day, adding one part file
+        FakeGameFinder.season_games = SEASON_GAMES.assign(PTS=pts)
+        updater.update_data()
+        part_counts.append(updater.game_store.part_counts()[22024])
+
+    assert part_counts == [2, 1, 2]
+    games = updater.game_store.load()
+    assert len(games) == 6
+    assert games.loc[games['GAME_ID'] == '0022400003', 'PTS'].tolist() == [123, 123]
+
+
+def test_update_maintains_feature_store(updater):
+    from models.feature_store import TeamFeatureStore
+
+    assert updater.update_data()
+    store = TeamFeatureStore.load(updater.feature_store_path)
+    assert store.team_stats(1)['PTS_ROLLING_AVG_5'] == pytest.approx((110 + 99 + 120) / 3)
+
+    corrected = SEASON_GAMES.copy()
+    corrected.loc[4, 'PTS'] = 123
+    FakeGameFinder.season_games = corrected
+    updater.update_data()
+
+    store = TeamFeatureStore.load(updater.feature_store_path)
+    assert store.team_stats(1)['PTS_ROLLING_AVG_5'] == pytest.approx((110 + 99 + 123) / 3)
+
+
+class FakePredictor:
+    """NBAMatchPredictor stand-in recording how the model was retrained"""
+    events = []
+    fine_tune_result = {'games': 30, 'accuracy': 0.6}
+
+    def load_model(self, filepath):
+        FakePredictor.events.append('load')
+
+    def fine_tune(self, games_df, jit_compile=False):
+        FakePredictor.events.append('fine_tune')
+        return FakePredictor.fine_tune_result
+
+    def train(self, games_df, jit_compile=False):
+        FakePredictor.events.append('train')
+
+    def save_model(self, filepath):
+        FakePredictor.events.append('save')
+
+
+@pytest.mark.parametrize('saved_model, fine_tune_result, expected', [
+    (True, {'games': 30, 'accuracy': 0.6}, ['load', 'fine_tune', 'save', 'save']),
+    (True, None, ['load', 'fine_tune', 'train', 'save', 'save']),
+    (True, {'games': 0}, ['load', 'fine_tune']),
+    (False, {'games': 30, 'accuracy': 0.6}, ['train', 'save', 'save']),
+])
+def test_retrain_warm_starts_and_falls_back_to_full_training(updater, monkeypatch, saved_model, fine_tune_result,
+                                                            expected):
+    auto_update = importlib.import_module('scripts.auto_update')
+    monkeypatch.setattr(auto_update, 'NBAMatchPredictor', FakePredictor)
+    FakePredictor.events = []
+    FakePredictor.fine_tune_result = fine_tune_result
+    updater.update_data()
+    updater.retrain = True
+    if saved_model:
+        os.makedirs('models', exist_ok=True)
+        open(updater.model_path + '.keras', 'w').close()
+
+    updater.retrain_model()
+
+    assert FakePredictor.events == expected
@@ -0,0 +1,110 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.backtest import LogisticBacktestModel, walk_forward
+from models.metrics import classification_metrics
+from models.features import FEATURE_COLUMNS
+
+
+class RecordingModel:
+    """Predicts the training win rate and remembers what it was fitted on"""
+
+    def __init__(self):
+        self.fits = []
+
+    def fit(self, X, y):
+        self.fits.append(len(X))
+        self.rate = float(np.mean(y))
+        return self
+
+    def predict_proba(self, X):
+        return np.full(len(X), self.rate)
+
+
+@pytest.fixture(scope='module')
+def features_df():
+    games_df = make_games(1200, seed=5)
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    rng = np.random.default_rng(5)
+    features = pd.DataFrame(rng.normal(size=(len(games_df), len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    features['IS_HOME'] = games_df['MATCHUP'].str.contains('vs.').astype(int)
+    return pd.concat([
+        games_df[['GAME_ID', 'GAME_DATE', 'TEAM_ID']],
+        features,
+        (games_df['WL'] == 'W').astype(int).rename('WIN')
+    ], axis=1).sample(frac=1, random_state=1)
+
+
+def test_classification_metrics():
+    metrics = classification_metrics([1, 0, 1, 0], [0.9, 0.2, 0.4, 0.5])
+
+    assert metrics['games'] == 4
+    assert metrics['accuracy'] == pytest.approx(0.75)
+    assert metrics['brier'] == pytest.approx((0.01 + 0.04 + 0.36 + 0.25) / 4)
+    assert metrics['log_loss'] == pytest.approx(-np.mean(np.log([0.9, 0.8, 0.4, 0.5])))
+
+
+def test_walk_forward_trains_only_on_earlier_days(features_df):
+    model = RecordingModel()
+    result = walk_forward(features_df, model, refit_days=1, min_train_rows=200)
+
+    ordered = features_df.sort_values('GAME_DATE', kind='stable')
+    for day in result.daily.itertuples():
+        # Every row counted as training data is dated before the scored day
+        assert (ordered['GAME_DATE'].iloc[:day.TRAIN_ROWS] < day.GAME_DATE).all()
+        assert (ordered['GAME_DATE'].iloc[day.TRAIN_ROWS:] >= day.GAME_DATE).all()
+    assert model.fits == result.daily['TRAIN_ROWS'].tolist()
+
+    # One prediction per game, from the home side
+    assert result.predictions['GAME_ID'].is_unique
+    home_games = features_df[(features_df['IS_HOME'] == 1) & (features_df['GAME_DATE'] >= result.daily['GAME_DATE'].min())]
+    assert len(result.predictions) == len(home_games)
+
+
+def test_walk_forward_refits_on_schedule(features_df):
+    model = RecordingModel()
+    result = walk_forward(features_df, model, refit_days=7, min_train_rows=200)
+
+    days = (result.daily['GAME_DATE'].max() - result.daily['GAME_DATE'].min()).days
+    assert result.fits == len(model.fits) == days // 7 + 1
+
+
+def test_walk_forward_summary(features_df):
+    result = walk_forward(features_df, LogisticBacktestModel(), start_date='2015-10-20', refit_days=10)
+    summary = result.summary()
+
+    expected = classification_metrics(result.predictions['WIN'], result.predictions['PROBABILITY'])
+    for name in ['games', 'accuracy', 'log_loss', 'brier']:
+        assert summary[name] == pytest.approx(expected[name])
+    assert result.daily['GAME_DATE'].min() >= pd.Timestamp('2015-10-20')
+    assert summary['days'] == len(result.daily)
+
+
+def test_load_model_reads_recorded_metrics(tmp_path):
+    pytest.importorskip('tensorflow')
+    from models.match_predictor import NBAMatchPredictor
+
+    rng = np.random.default_rng(0)
+    predictor = NBAMatchPredictor()
+    predictor.team_encoder.fit(np.arange(30).astype(float))
+    predictor.scaler.fit(rng.normal(size=(50, len(FEATURE_COLUMNS))))
+    predictor.metrics = {'games': 40, 'accuracy': 0.6, 'log_loss': 0.66, 'brier': 0.23}
+
+    filepath = str(tmp_path / 'match_predictor')
+    predictor.save_model(filepath)
+    loaded = NBAMatchPredictor()
+    loaded.load_model(filepath)
+    assert loaded.metrics == predictor.metrics
+    assert loaded.accuracy == 0.6
+
+    os.remove(filepath + '_metrics.json')
+    loaded.load_model(filepath)
+    assert loaded.metrics is None and loaded.accuracy is None
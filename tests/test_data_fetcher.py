@@ -0,0 +1,152 @@
+import os
+import sys
+import json
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nba_api.stats.library.http import NBAStatsHTTP
+from api.services.http_client import create_session
+from scripts.data_fetcher import NBADataFetcher
+
+TEAMS = [{'id': team_id, 'full_name': f'Team {team_id}'} for team_id in [1, 2, 3, 4]]
+
+
+def team_games(team_id, season):
+    """Two games between teams 1 and 2 and teams 3 and 4, from ``team_id``'s side"""
+    opponent = {1: 2, 2: 1, 3: 4, 4: 3}[team_id]
+    first_game = 10 * int(season[:4]) + min(team_id, opponent)
+    return pd.DataFrame({
+        'SEASON_ID': 20000 + int(season[:4]),
+        'TEAM_ID': team_id,
+        'GAME_ID': [f'{first_game:010d}', f'{first_game + 100:010d}'],
+        'PTS': 100 + team_id,
+    })
+
+
+@pytest.fixture
+def fetcher():
+    fetcher = NBADataFetcher(max_workers=4, requests_per_second=1000, session=create_session())
+    fetcher.teams = TEAMS
+    return fetcher
+
+
+def test_seasons_are_concatenated_once(fetcher, monkeypatch):
+    requests = []
+
+    def fetch_team_games(team_id, season=None):
+        requests.append((team_id, season))
+        return team_games(team_id, season)
+
+    concat_calls = []
+    concat = pd.concat
+    monkeypatch.setattr(pd, 'concat', lambda *args, **kwargs: concat_calls.append(1) or concat(*args, **kwargs))
+    monkeypatch.setattr(fetcher, 'fetch_team_games', fetch_team_games)
+
+    games = fetcher.fetch_seasons(['2022-23', 2023, '2024'])
+
+    assert len(concat_calls) == 1
+    assert sorted(requests) == sorted((team['id'], season) for season in ['2022-23', '2023-24', '2024-25']
+                                      for team in TEAMS)
+    assert sorted(games['SEASON_ID'].unique()) == [22022, 22023, 22024]
+    assert len(games) == 3 * len(TEAMS) * 2
+
+
+def test_duplicates_are_dropped_per_game_and_team(fetcher, monkeypatch):
+    # Each team's log repeats its first game, as overlapping requests do
+    monkeypatch.setattr(fetcher, 'fetch_team_games', lambda team_id, season=None: pd.concat(
+        [team_games(team_id, season), team_games(team_id, season).iloc[:1]], ignore_index=True
+    ))
+
+    games = fetcher.fetch_all_team_games(season='2024-25')
+
+    assert not games.duplicated(['GAME_ID', 'TEAM_ID']).any()
+    # Both teams keep their row of every game they played against each other
+    assert games.groupby('GAME_ID')['TEAM_ID'].apply(sorted).tolist() == [[1, 2], [3, 4], [1, 2], [3, 4]]
+
+
+def test_failing_and_empty_teams_are_skipped(fetcher, monkeypatch):
+    def fetch_team_games(team_id, season=None):
+        if team_id == 3:
+            raise RuntimeError("Connection reset")
+        if team_id == 4:
+            return pd.DataFrame()
+        return team_games(team_id, season)
+
+    monkeypatch.setattr(fetcher, 'fetch_team_games', fetch_team_games)
+
+    games = fetcher.fetch_all_team_games(season='2024-25')
+
+    assert sorted(games['TEAM_ID'].unique()) == [1, 2]
+    assert len(games) == 4
+
+
+class StubGameFinder(ThreadingHTTPServer):
+    """Local LeagueGameFinder that records when each request arrives"""
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), StubGameFinderHandler)
+        self.arrivals = []
+        self.lock = threading.Lock()
+
+
+class StubGameFinderHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.arrivals.append(time.monotonic())
+        body = json.dumps({'resultSets': [{
+            'name': 'LeagueGameFinderResults',
+            'headers': ['SEASON_ID', 'TEAM_ID', 'GAME_ID', 'PTS'],
+            'rowSet': []
+        }]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def test_shared_rate_limiter_paces_the_workers(monkeypatch):
+    server = StubGameFinder()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(NBAStatsHTTP, 'base_url', f"http://127.0.0.1:{server.server_address[1]}/stats/{{endpoint}}")
+    rate = 20
+    fetcher = NBADataFetcher(max_workers=4, requests_per_second=rate, burst=1, session=create_session())
+    fetcher.teams = TEAMS * 2
+
+    try:
+        fetcher.fetch_all_team_games(season='2024-25')
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # Four workers, but requests leave no faster than the bucket refills
+    arrivals = sorted(server.arrivals)
+    assert len(arrivals) == len(fetcher.teams)
+    assert arrivals[-1] - arrivals[0] >= 0.9 * (len(arrivals) - 1) / rate
+
+
+def test_csv_snapshot_is_saved_when_the_game_store_fails(fetcher, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('data')
+
+    def replace(games_df):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(fetcher.game_store, 'replace', replace)
+
+    fetcher.save_data(team_games(1, '2024-25'), 'team_games')
+
+    snapshots = list((tmp_path / 'data').glob('team_games_*.csv'))
+    assert len(snapshots) == 1
+    assert len(pd.read_csv(snapshots[0])) == 2
@@ -0,0 +1,117 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.features import MATCH_STAT_COLUMNS
+from models.feature_store import TeamFeatureStore
+
+
+def reference_team_stats(games_df):
+    """Latest-game features computed over the whole history with pandas"""
+    games_df = games_df.assign(
+        GAME_DATE=pd.to_datetime(games_df['GAME_DATE']),
+        FT_DRAWING_RATE=games_df['FTA'] / games_df['FGA'],
+        WIN=(games_df['WL'] == 'W').astype(int),
+        IS_OVERTIME=(games_df['MIN'] > 240).astype(int)
+    ).sort_values('GAME_DATE', kind='stable')
+    grouped = games_df.groupby('TEAM_ID')
+    stats = {}
+    for name in ['PTS', 'FG_PCT', 'FT_PCT', 'FG3_PCT', 'AST', 'REB', 'FTA', 'TOV', 'STL', 'FT_DRAWING_RATE']:
+        stats[f'{name}_ROLLING_AVG_5'] = grouped[name].apply(lambda x: x.tail(5).mean()).fillna(0)
+    stats['WIN_STREAK'] = grouped['WIN'].apply(lambda x: x.tail(5).sum())
+    stats['OVERTIME_RATE'] = grouped['IS_OVERTIME'].apply(lambda x: x.tail(10).mean())
+    return pd.DataFrame(stats)[MATCH_STAT_COLUMNS]
+
+
+@pytest.fixture
+def games():
+    games = make_games(1200)
+    rng = np.random.default_rng(4)
+    # Games without free throw or three-point attempts have no percentage
+    no_free_throws = rng.random(len(games)) < 0.1
+    games.loc[no_free_throws, ['FTM', 'FTA']] = 0
+    games.loc[no_free_throws, 'FT_PCT'] = np.nan
+    games.loc[rng.random(len(games)) < 0.1, 'FG3_PCT'] = np.nan
+    # One team without a free throw percentage in its last five games
+    team_games = games[games['TEAM_ID'] == games['TEAM_ID'].iloc[0]]
+    last_five = pd.to_datetime(team_games['GAME_DATE']).sort_values(kind='stable').index[-5:]
+    games.loc[last_five, 'FT_PCT'] = np.nan
+    return games
+
+
+def stored_stats(store, team_ids):
+    return pd.DataFrame([store.team_stats(team_id) for team_id in team_ids], index=team_ids)[MATCH_STAT_COLUMNS]
+
+
+def test_build_matches_full_recomputation(games):
+    store = TeamFeatureStore.build(games)
+    expected = reference_team_stats(games)
+
+    np.testing.assert_allclose(stored_stats(store, expected.index).to_numpy(), expected.to_numpy(), rtol=1e-9)
+    assert store.last_game_date == pd.to_datetime(games['GAME_DATE']).max()
+
+
+def test_incremental_updates_match_build(games):
+    dates = pd.to_datetime(games['GAME_DATE'])
+    cutoff = dates.sort_values().iloc[len(games) // 2]
+    store = TeamFeatureStore.build(games[dates <= cutoff])
+    # Re-sending the last day as well, as the update lookback does, changes nothing
+    store.update(games[dates >= cutoff])
+
+    full = TeamFeatureStore.build(games)
+    team_ids = sorted(full.teams)
+    pd.testing.assert_frame_equal(stored_stats(store, team_ids), stored_stats(full, team_ids))
+    assert store.head_to_head == full.head_to_head
+
+
+def test_corrected_game_replaces_stale_row(games):
+    store = TeamFeatureStore.build(games)
+    last = games.assign(GAME_DATE=pd.to_datetime(games['GAME_DATE'])).sort_values('GAME_DATE').iloc[-1]
+    team_id = int(last['TEAM_ID'])
+    before = store.team_stats(team_id)
+
+    corrected = last.to_frame().T.assign(PTS=last['PTS'] + 10, WL='L' if last['WL'] == 'W' else 'W')
+    store.update(corrected)
+
+    after = store.team_stats(team_id)
+    assert after['PTS_ROLLING_AVG_5'] == pytest.approx(before['PTS_ROLLING_AVG_5'] + 2)
+    assert abs(after['WIN_STREAK'] - before['WIN_STREAK']) == 1
+    assert store.teams[team_id].games_played == (games['TEAM_ID'] == team_id).sum()
+
+
+def test_save_and_load_round_trip(games, tmp_path):
+    store = TeamFeatureStore.build(games)
+    path = str(tmp_path / 'feature_store.joblib')
+    store.save(path)
+
+    loaded = TeamFeatureStore.load(path)
+    team_id = next(iter(store.teams))
+    assert loaded.team_stats(team_id) == store.team_stats(team_id)
+    opponent_id = next(opp for team, opp in store.head_to_head if team == team_id)
+    assert loaded.head_to_head_win_rate(team_id, opponent_id) == store.head_to_head_win_rate(team_id, opponent_id)
+    assert loaded.team_stats(1) is None
+
+
+def test_team_stats_are_the_features_of_the_next_game(games):
+    pytest.importorskip('tensorflow')
+    from models.match_predictor import NBAMatchPredictor
+
+    store = TeamFeatureStore.build(games)
+    games = games.assign(GAME_DATE=pd.to_datetime(games['GAME_DATE']))
+    # One future game per team: prepare_features derives its features from the stored history
+    next_date = games['GAME_DATE'].max() + pd.Timedelta(days=1)
+    next_games = games.drop_duplicates('TEAM_ID').assign(GAME_DATE=next_date)
+    features = NBAMatchPredictor().prepare_features(pd.concat([games, next_games], ignore_index=True))
+    next_features = features[features['GAME_DATE'] == next_date].set_index('TEAM_ID')[MATCH_STAT_COLUMNS]
+
+    stored = stored_stats(store, next_features.index)
+    assert not stored.isna().any().any()
+    np.testing.assert_allclose(stored.to_numpy(), next_features.to_numpy(dtype=np.float64), rtol=1e-5, atol=1e-6)
+    assert stored.loc[games['TEAM_ID'].iloc[0], 'FT_PCT_ROLLING_AVG_5'] == 0
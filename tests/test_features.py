@@ -0,0 +1,157 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.features import (
+    ft_drawing_rate, head_to_head_win_rate, opponent_team_ids, parse_matchup, team_abbreviation_map,
+    rolling_window_sums, trailing_means
+)
+
+
+def reference_head_to_head(games_df):
+    """Row-wise definition the vectorized feature must reproduce"""
+    rates = []
+    for _, row in games_df.iterrows():
+        prior = games_df[
+            (games_df['TEAM_ID'] == row['TEAM_ID']) &
+            (games_df['OPPONENT_TEAM_ID'] == row['OPPONENT_TEAM_ID']) &
+            (games_df['GAME_DATE'] < row['GAME_DATE'])
+        ]
+        rates.append(prior['WIN'].mean() if len(prior) > 0 else 0.5)
+    return np.array(rates)
+
+
+@pytest.fixture
+def h2h_games():
+    rng = np.random.default_rng(7)
+    n = 400
+    games_df = pd.DataFrame({
+        'TEAM_ID': rng.integers(1, 5, n),
+        'OPPONENT_TEAM_ID': rng.integers(1, 5, n).astype(float),
+        'GAME_DATE': pd.Timestamp('2024-10-22') + pd.to_timedelta(rng.integers(0, 60, n), unit='D'),
+        'WIN': rng.integers(0, 2, n),
+    })
+    # Unmapped opponents never match anything
+    games_df.loc[::37, 'OPPONENT_TEAM_ID'] = np.nan
+    # Shuffle the index so alignment is exercised as well
+    return games_df.sample(frac=1, random_state=3).set_index(rng.permutation(n) * 10)
+
+
+def test_head_to_head_matches_reference(h2h_games):
+    result = head_to_head_win_rate(h2h_games)
+
+    assert result.index.equals(h2h_games.index)
+    np.testing.assert_allclose(result.to_numpy(), reference_head_to_head(h2h_games), rtol=0, atol=1e-12)
+
+
+def test_head_to_head_defaults_without_prior_meetings(h2h_games):
+    result = head_to_head_win_rate(h2h_games)
+
+    assert (result[h2h_games['OPPONENT_TEAM_ID'].isna()] == 0.5).all()
+    first_meetings = h2h_games['GAME_DATE'] == h2h_games.groupby(
+        ['TEAM_ID', 'OPPONENT_TEAM_ID'])['GAME_DATE'].transform('min')
+    assert (result[first_meetings] == 0.5).all()
+
+
+def reference_matchup_features(games_df):
+    """Row-wise definitions prepare_features used before vectorizing"""
+    ft_rate = games_df.apply(lambda row: row['FTA'] / row['FGA'] if row['FGA'] > 0 else 0, axis=1)
+    is_home = games_df['MATCHUP'].apply(lambda x: 1 if 'vs.' in x else 0)
+    opponent = games_df['MATCHUP'].apply(lambda x: x.split()[-1] if '@' in x else x.split('vs.')[-1].strip())
+    team_abbrev_to_id = {}
+    for _, row in games_df.drop_duplicates('TEAM_ABBREVIATION')[['TEAM_ABBREVIATION', 'TEAM_ID']].iterrows():
+        team_abbrev_to_id[row['TEAM_ABBREVIATION']] = row['TEAM_ID']
+    return ft_rate, is_home, opponent, opponent.map(team_abbrev_to_id)
+
+
+@pytest.fixture
+def matchup_games():
+    games_df = make_games(600)
+    games_df.loc[::50, 'FGA'] = 0
+    # An opponent with no rows of its own stays unmapped
+    games_df.loc[7, 'MATCHUP'] = 'T01 @ XYZ'
+    return games_df.set_index(np.arange(len(games_df))[::-1] * 3)
+
+
+def test_matchup_features_match_row_wise_versions(matchup_games):
+    ft_rate, is_home, opponent, opponent_ids = reference_matchup_features(matchup_games)
+
+    vectorized_home, vectorized_opponent = parse_matchup(matchup_games['MATCHUP'])
+    pd.testing.assert_series_equal(ft_drawing_rate(matchup_games), ft_rate.rename('FT_DRAWING_RATE'))
+    pd.testing.assert_series_equal(vectorized_home, is_home.rename('IS_HOME'))
+    pd.testing.assert_series_equal(vectorized_opponent.astype(object), opponent.rename('OPPONENT_ABBREV'))
+    pd.testing.assert_series_equal(
+        opponent_team_ids(vectorized_opponent, team_abbreviation_map(matchup_games)),
+        opponent_ids.rename('OPPONENT_TEAM_ID')
+    )
+
+
+def test_parse_matchup_handles_categoricals_and_missing_values():
+    matchup = pd.Series(['BOS vs. NYK', 'NYK @ BOS', None, 'BOS vs. NYK'], dtype='category')
+
+    is_home, opponent = parse_matchup(matchup)
+
+    assert is_home.tolist() == [1, 0, 0, 1]
+    assert opponent.iloc[[0, 1, 3]].tolist() == ['NYK', 'BOS', 'NYK']
+    assert pd.isna(opponent.iloc[2])
+
+
+@pytest.fixture
+def team_games():
+    games_df = make_games(900)
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    games_df.loc[::23, 'FG3_PCT'] = np.nan
+    return games_df.sort_values(['TEAM_ID', 'GAME_DATE'], kind='stable')
+
+
+def test_trailing_means_use_only_earlier_games(team_games):
+    columns = ['PTS', 'FG3_PCT']
+    result = trailing_means(team_games, columns, [3, 5])
+
+    for column in columns:
+        for window in [3, 5]:
+            expected = team_games.groupby('TEAM_ID')[column].transform(
+                lambda x: x.shift(1).rolling(window=window, min_periods=1).mean()
+            )
+            np.testing.assert_allclose(result[f'{column}_ROLLING_AVG_{window}'], expected, rtol=1e-12)
+
+    first_games = ~team_games['TEAM_ID'].duplicated()
+    assert result.loc[first_games].isna().all().all()
+
+
+def test_trailing_means_ignore_later_games(team_games):
+    before = trailing_means(team_games, ['PTS'], [5])
+    last_games = ~team_games['TEAM_ID'].duplicated(keep='last')
+    changed = team_games.assign(PTS=team_games['PTS'].where(~last_games, 500))
+
+    after = trailing_means(changed, ['PTS'], [5])
+
+    pd.testing.assert_frame_equal(before, after)
+
+
+def test_rolling_window_sums_handle_any_window_set():
+    rng = np.random.default_rng(11)
+    groups = np.repeat([4, 1, 9], [30, 2, 17])
+    values = rng.normal(size=(len(groups), 3))
+    values[rng.random(values.shape) < 0.1] = np.nan
+    windows = [1, 3, 5, 10, 20, 40]
+
+    sums, counts = rolling_window_sums(values, groups, windows)
+
+    starts = {group: np.flatnonzero(groups == group)[0] for group in np.unique(groups)}
+    for i, window in enumerate(windows):
+        for row in range(len(groups)):
+            previous = values[max(row - window, starts[groups[row]]):row]
+            np.testing.assert_allclose(sums[i, row], np.nansum(previous, axis=0), atol=1e-9)
+            np.testing.assert_array_equal(counts[i, row], (~np.isnan(previous)).sum(axis=0))
+
+def test_rolling_window_sums_require_contiguous_groups():
+    with pytest.raises(ValueError):
+        rolling_window_sums(np.ones((3, 1)), np.array([1, 2, 1]), [5])
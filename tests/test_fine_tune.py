@@ -0,0 +1,130 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from models.features import FEATURE_COLUMNS
+
+pytest.importorskip('tensorflow')
+
+TRAINED_THROUGH = pd.Timestamp('2015-11-05')
+
+
+@pytest.fixture(scope='module')
+def games_df():
+    games_df = make_games(1500, seed=9)
+    games_df['GAME_DATE'] = pd.to_datetime(games_df['GAME_DATE'])
+    return games_df
+
+
+@pytest.fixture(scope='module')
+def saved_model(games_df, tmp_path_factory):
+    """A model 'trained' on games through TRAINED_THROUGH, saved with its sidecar"""
+    import tensorflow as tf
+    from models.match_predictor import NBAMatchPredictor
+
+    tf.random.set_seed(0)
+    predictor = NBAMatchPredictor()
+    history = predictor.prepare_features(games_df[games_df['GAME_DATE'] <= TRAINED_THROUGH].copy())
+    # The encoder must know every team the later games involve
+    predictor.prepare_features(games_df.copy())
+    predictor.scaler.fit(history[FEATURE_COLUMNS])
+    predictor.metrics = {'games': 100, 'accuracy': 0.5, 'log_loss': 0.69, 'brier': 0.25}
+    predictor.trained_through = history['GAME_DATE'].max()
+
+    filepath = str(tmp_path_factory.mktemp('model') / 'match_predictor')
+    predictor.save_model(filepath)
+    return filepath
+
+
+def load(filepath):
+    from models.match_predictor import NBAMatchPredictor
+
+    predictor = NBAMatchPredictor()
+    predictor.load_model(filepath)
+    return predictor
+
+
+def test_fine_tune_trains_on_new_games(games_df, saved_model):
+    predictor = load(saved_model)
+    assert predictor.trained_through == TRAINED_THROUGH
+    weights = [w.copy() for w in predictor.model.get_weights()]
+
+    metrics = predictor.fine_tune(games_df.copy(), epochs=2, replay_size=200)
+
+    assert metrics is not None and metrics['games'] == int((games_df['GAME_DATE'] > TRAINED_THROUGH).sum())
+    assert predictor.trained_through == games_df['GAME_DATE'].max()
+    assert any(not np.allclose(before, after) for before, after in zip(weights, predictor.model.get_weights()))
+
+
+def test_fine_tune_accepts_ordinary_single_nights(games_df, saved_model, caplog):
+    nights = np.sort(games_df.loc[games_df['GAME_DATE'] > TRAINED_THROUGH, 'GAME_DATE'].unique())[:5]
+    for night in nights:
+        # Only one night of new games: the drift check must not mistake sampling noise for drift
+        predictor = load(saved_model)
+        predictor.trained_through = pd.Timestamp(night) - pd.Timedelta(days=1)
+        # The untrained fixture model's accuracy on one night is arbitrary; only drift is checked here
+        predictor.accuracy = None
+        metrics = predictor.fine_tune(games_df[games_df['GAME_DATE'] <= night].copy(), epochs=1, replay_size=100)
+
+        assert metrics is not None and metrics['games'] >= 20
+    assert 'Feature drift' not in caplog.text
+
+
+def test_fine_tune_declines_on_drift_or_accuracy_drop(games_df, saved_model, caplog):
+    drifted = games_df.copy()
+    drifted.loc[drifted['GAME_DATE'] > TRAINED_THROUGH, 'PTS'] += 60
+    predictor = load(saved_model)
+    weights = [w.copy() for w in predictor.model.get_weights()]
+    assert predictor.fine_tune(drifted, epochs=1) is None
+    assert 'Feature drift in new games: PTS_ROLLING_AVG_5' in caplog.text
+    assert all(np.array_equal(before, after) for before, after in zip(weights, predictor.model.get_weights()))
+    assert predictor.trained_through == TRAINED_THROUGH
+
+    predictor = load(saved_model)
+    predictor.accuracy = 0.99
+    assert predictor.fine_tune(games_df.copy(), epochs=1) is None
+    assert 'Accuracy on new games fell' in caplog.text
+
+
+def test_fine_tune_without_new_games_changes_nothing(games_df, saved_model):
+    predictor = load(saved_model)
+    weights = [w.copy() for w in predictor.model.get_weights()]
+
+    metrics = predictor.fine_tune(games_df[games_df['GAME_DATE'] <= TRAINED_THROUGH].copy(), epochs=1)
+
+    assert metrics is not None and metrics['games'] == 0
+    assert predictor.trained_through == TRAINED_THROUGH
+    assert all(np.array_equal(before, after) for before, after in zip(weights, predictor.model.get_weights()))
+
+
+def test_fine_tune_rejects_unknown_teams(games_df, saved_model):
+    expansion = games_df.copy()
+    expansion.loc[expansion.index[-2:], 'TEAM_ID'] = 1
+    predictor = load(saved_model)
+
+    with pytest.raises(ValueError):
+        predictor.fine_tune(expansion, epochs=1)
+
+
+def test_first_fine_tune_after_training_covers_the_held_out_days(games_df, tmp_path, monkeypatch):
+    from models.match_predictor import NBAMatchPredictor
+
+    # train() writes its plots and TensorBoard logs relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    os.makedirs('models')
+    predictor = NBAMatchPredictor()
+    predictor.train(games_df.copy(), verbose=0, epochs=1)
+
+    holdout_start = NBAMatchPredictor._holdout_start(games_df['GAME_DATE'].to_numpy())
+    assert predictor.trained_through == games_df.loc[games_df['GAME_DATE'] < holdout_start, 'GAME_DATE'].max()
+
+    predictor.accuracy = None
+    metrics = predictor.fine_tune(games_df.copy(), epochs=1, max_drift_z=np.inf, min_drift=np.inf)
+    assert metrics['games'] == int((games_df['GAME_DATE'] >= holdout_start).sum())
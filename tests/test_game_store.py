@@ -0,0 +1,122 @@
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.game_store import GameStore
+
+
+def make_rows(season_id, game_ids, date, pts=100):
+    return pd.DataFrame({
+        'SEASON_ID': season_id,
+        'TEAM_ID': 1610612737,
+        'GAME_ID': game_ids,
+        'GAME_DATE': date,
+        'PTS': pts,
+        'FG_PCT': 0.5,
+    })
+
+
+@pytest.fixture
+def store(tmp_path):
+    return GameStore(str(tmp_path / 'game_store'))
+
+
+def test_upsert_partitions_by_season(store):
+    store.upsert(make_rows(22023, [22300001, 22300002], '2024-01-01'))
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-02'))
+
+    assert store.seasons() == [22023, 22024]
+    games = store.load()
+    assert len(games) == 3
+    assert games.columns[0] == 'SEASON_ID'
+    # CSV-parsed ids regain their leading zeros
+    assert sorted(games['GAME_ID']) == ['0022300001', '0022300002', '0022400001']
+    assert pd.api.types.is_datetime64_any_dtype(games['GAME_DATE'])
+    assert store.latest_game_date() == '2025-01-02'
+
+
+def test_load_selected_columns_and_seasons(store):
+    store.upsert(make_rows(22023, ['0022300001'], '2024-01-01', pts=90))
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-01', pts=110))
+
+    games = store.load(columns=['GAME_ID', 'PTS'], seasons=[22024])
+
+    assert list(games.columns) == ['GAME_ID', 'PTS']
+    assert games['PTS'].tolist() == [110]
+
+
+def test_replace_overwrites_only_given_seasons(store):
+    store.upsert(make_rows(22023, ['0022300001'], '2024-01-01'))
+    store.upsert(make_rows(22024, ['0022400001', '0022400002'], '2025-01-01'))
+
+    store.replace(make_rows(22024, ['0022400003'], '2025-02-01'))
+
+    assert sorted(store.load(columns=['GAME_ID'])['GAME_ID']) == ['0022300001', '0022400003']
+
+
+def test_upserts_conform_to_stored_schema(store):
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-01', pts=100))
+    # Integer FG_PCT, a missing column and an extra one must not split the schema
+    late_rows = make_rows(22024, ['0022400002'], '2025-01-02').assign(FG_PCT=1, EXTRA=1).drop(columns=['PTS'])
+    store.upsert(late_rows)
+
+    games = store.load().sort_values('GAME_ID')
+    assert 'EXTRA' not in games.columns
+    assert pd.api.types.is_float_dtype(games['FG_PCT'])
+    assert games['PTS'].isna().tolist() == [False, True]
+
+
+def test_empty_store(store):
+    assert store.is_empty()
+    assert store.load().empty
+    assert store.latest_game_date() is None
+
+
+def test_upsert_replaces_rows_by_game_and_team(store):
+    store.upsert(make_rows(22024, ['0022400001', '0022400002'], '2025-01-01', pts=100))
+    # The opponent's row for the same game is a different key
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-01', pts=95).assign(TEAM_ID=1610612738))
+    # A corrected box score replaces the stale row
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-01', pts=104))
+
+    games = store.load().sort_values(['GAME_ID', 'TEAM_ID'])
+    assert list(zip(games['GAME_ID'], games['TEAM_ID'], games['PTS'])) == [
+        ('0022400001', 1610612737, 104),
+        ('0022400001', 1610612738, 95),
+        ('0022400002', 1610612737, 100),
+    ]
+    assert store.load(columns=['PTS'], seasons=[22024])['PTS'].sort_values().tolist() == [95, 100, 104]
+
+
+def test_compact_drops_superseded_rows(store, tmp_path):
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-01', pts=100))
+    store.upsert(make_rows(22024, ['0022400001'], '2025-01-01', pts=104))
+
+    store.compact()
+
+    partition = tmp_path / 'game_store' / 'SEASON_ID=22024'
+    assert len(list(partition.glob('*.parquet'))) == 1
+    assert pd.read_parquet(next(partition.glob('*.parquet')))['PTS'].tolist() == [104]
+
+
+def test_rows_without_a_key_are_rejected(store):
+    with pytest.raises(ValueError):
+        store.upsert(make_rows(22024, ['0022400001'], '2025-01-01').drop(columns=['TEAM_ID']))
+
+
+def test_new_rows_are_the_keys_not_stored_yet(store):
+    assert len(store.new_rows(make_rows(22024, ['0022400001'], '2025-01-01'))) == 1
+
+    store.upsert(make_rows(22024, ['0022400001', '0022400002'], '2025-01-01'))
+    fetched = pd.concat([
+        make_rows(22024, [22400001, 22400003], '2025-01-01', pts=104),
+        make_rows(22024, ['0022400001'], '2025-01-01').assign(TEAM_ID=1610612738),
+    ], ignore_index=True)
+
+    new_rows = store.new_rows(fetched)
+    assert list(zip(new_rows['GAME_ID'], new_rows['TEAM_ID'])) == [(22400003, 1610612737), ('0022400001', 1610612738)]
@@ -0,0 +1,71 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.hyperparameter_search import (
+    SEARCH_SPACE, _train_candidate, grid_candidates, leaderboard, load_search_data,
+    random_candidates, successive_halving
+)
+
+
+def test_candidates_cover_the_search_space():
+    grid = grid_candidates()
+    assert len(grid) == np.prod([len(values) for values in SEARCH_SPACE.values()])
+    assert len({tuple(candidate.items()) for candidate in grid}) == len(grid)
+
+    sample = random_candidates(samples=10, seed=3)
+    assert sample == random_candidates(samples=10, seed=3)
+    assert len({tuple(candidate.items()) for candidate in sample}) == 10
+    assert all(candidate in grid for candidate in sample)
+
+
+def test_successive_halving_keeps_the_best_and_resumes_them(tmp_path):
+    candidates = [{'hidden_units': (8,), 'dropout': 0.0, 'learning_rate': 0.001, 'batch_size': 32, 'id': i}
+                  for i in range(9)]
+    calls = []
+
+    def run_tasks(tasks):
+        calls.append(tasks)
+        # Lower ids are better and improve with training
+        return [{'candidate': task['candidate'], 'checkpoint': task['checkpoint'],
+                 'val_log_loss': task['candidate'] + 1.0 / (1 + task['epochs'])} for task in reversed(tasks)]
+
+    rows = successive_halving(candidates, run_tasks, str(tmp_path), min_epochs=2, max_epochs=18, eta=3)
+
+    assert [sorted(task['candidate'] for task in tasks) for tasks in calls] == [list(range(9)), [0, 1, 2], [0]]
+    # Survivors only train the epochs they have not had yet, from their last checkpoint
+    assert [task['epochs'] for task in calls[1]] == [4, 4, 4]
+    assert calls[2][0]['epochs'] == 12
+    assert calls[2][0]['resume_from'] == calls[1][0]['checkpoint']
+
+    board = leaderboard(rows)
+    assert board.loc[0, 'candidate'] == 0 and board.loc[0, 'epochs'] == 18
+    assert board['rank'].tolist() == list(range(1, len(rows) + 1))
+    assert board.loc[0, 'hidden_units'] == '8'
+
+
+def test_train_candidate_reads_memory_mapped_data_and_resumes(tmp_path):
+    pytest.importorskip('tensorflow')
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 15)).astype(np.float32)
+    y = (X[:, 3] + rng.normal(0, 0.5, 300) > 0).astype(np.float32).reshape(-1, 1)
+    for name, array in {'X_train': X[:240], 'y_train': y[:240], 'X_val': X[240:], 'y_val': y[240:]}.items():
+        np.save(tmp_path / f'{name}.npy', array)
+
+    data = load_search_data(str(tmp_path))
+    assert isinstance(data['X_train'], np.memmap)
+
+    task = {'candidate': 0, 'config': {'hidden_units': (8,), 'dropout': 0.0, 'learning_rate': 0.01, 'batch_size': 32},
+            'epochs': 1, 'resume_from': None, 'checkpoint': str(tmp_path / 'rung_0.keras'), 'seed': 0}
+    first = _train_candidate(task, data)
+    resumed = _train_candidate({**task, 'epochs': 5, 'resume_from': first['checkpoint'],
+                                'checkpoint': str(tmp_path / 'rung_1.keras')}, data)
+
+    assert os.path.exists(resumed['checkpoint'])
+    assert set(first) >= {'val_accuracy', 'val_log_loss', 'val_brier', 'seconds'}
+    assert resumed['val_log_loss'] < first['val_log_loss']
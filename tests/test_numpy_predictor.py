@@ -0,0 +1,95 @@
+import os
+import sys
+import subprocess
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.numpy_predictor import NumpyMatchPredictor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture(scope='module')
+def exported_predictor(tmp_path_factory):
+    pytest.importorskip('tensorflow')
+    from models.features import FEATURE_COLUMNS
+    from models.match_predictor import NBAMatchPredictor
+
+    rng = np.random.default_rng(0)
+    predictor = NBAMatchPredictor()
+    team_ids = 1610612737 + np.arange(30)
+    predictor.team_encoder.fit(team_ids.astype(float))
+
+    X = pd.DataFrame(rng.normal(size=(500, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    X['TEAM_ID_ENCODED'] = rng.integers(0, 30, len(X))
+    X['OPPONENT_TEAM_ID_ENCODED'] = rng.integers(0, 30, len(X))
+    X['PTS_ROLLING_AVG_5'] = rng.normal(112, 8, len(X))
+    predictor.scaler.fit(X)
+
+    # Give every BatchNormalization non-trivial statistics so folding is exercised
+    for layer in predictor.model.layers:
+        if layer.__class__.__name__ == 'BatchNormalization':
+            size = layer.gamma.shape[0]
+            layer.set_weights([
+                rng.uniform(0.5, 1.5, size),
+                rng.normal(0, 0.2, size),
+                rng.uniform(0, 1, size),
+                rng.uniform(0.2, 2, size)
+            ])
+
+    filepath = str(tmp_path_factory.mktemp('model') / 'match_predictor')
+    predictor.save_model(filepath)
+    return predictor, filepath, team_ids, X
+
+
+def test_numpy_predictions_match_keras(exported_predictor):
+    predictor, filepath, team_ids, X = exported_predictor
+    numpy_predictor = NumpyMatchPredictor.load(filepath)
+
+    rng = np.random.default_rng(1)
+    home_ids = rng.choice(team_ids, 200)
+    away_ids = rng.choice(team_ids, 200)
+    stats = X.sample(200, random_state=2).drop(columns=['TEAM_ID_ENCODED', 'OPPONENT_TEAM_ID_ENCODED', 'IS_HOME'])
+
+    expected = predictor.predict_matches(home_ids, away_ids, stats)
+    result = numpy_predictor.predict_matches(home_ids, away_ids, stats)
+
+    np.testing.assert_allclose(result, expected, rtol=0, atol=1e-6)
+    assert numpy_predictor.predict_match(home_ids[0], away_ids[0], stats.iloc[0], stats.iloc[0]) == pytest.approx(
+        expected[0], abs=1e-6)
+
+
+def test_numpy_predictor_rejects_unknown_teams(exported_predictor):
+    _, filepath, _, X = exported_predictor
+    numpy_predictor = NumpyMatchPredictor.load(filepath)
+
+    stats = X.iloc[:1].drop(columns=['TEAM_ID_ENCODED', 'OPPONENT_TEAM_ID_ENCODED', 'IS_HOME'])
+    with pytest.raises(ValueError):
+        numpy_predictor.predict_matches([1], [1610612737], stats)
+
+
+def test_numpy_predictor_accepts_string_team_ids(exported_predictor):
+    _, filepath, team_ids, X = exported_predictor
+    numpy_predictor = NumpyMatchPredictor.load(filepath)
+    stats = X.iloc[:1].drop(columns=['TEAM_ID_ENCODED', 'OPPONENT_TEAM_ID_ENCODED', 'IS_HOME'])
+
+    # api/main.py passes the request's team ids as strings
+    expected = numpy_predictor.predict_matches(team_ids[:1], team_ids[1:2], stats)
+    result = numpy_predictor.predict_match(str(team_ids[0]), str(team_ids[1]), stats.iloc[0], stats.iloc[0])
+    assert result == pytest.approx(expected[0], abs=1e-6)
+
+    with pytest.raises(ValueError, match='numeric'):
+        numpy_predictor.predict_matches(['LAL'], [str(team_ids[1])], stats)
+
+
+def test_numpy_predictor_does_not_import_tensorflow():
+    code = (
+        "import sys; from models.numpy_predictor import NumpyMatchPredictor; "
+        "sys.exit('tensorflow' in sys.modules)"
+    )
+    assert subprocess.run([sys.executable, '-c', code], cwd=ROOT).returncode == 0
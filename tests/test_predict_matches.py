@@ -0,0 +1,85 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.features import FEATURE_COLUMNS, MATCH_STAT_COLUMNS
+
+pytest.importorskip('tensorflow')
+
+TEAM_IDS = 1610612737 + np.arange(30)
+
+
+@pytest.fixture(scope='module')
+def predictor():
+    from models.match_predictor import NBAMatchPredictor
+
+    rng = np.random.default_rng(0)
+    predictor = NBAMatchPredictor()
+    predictor.team_encoder.fit(TEAM_IDS.astype(float))
+    X = pd.DataFrame(rng.normal(size=(500, len(FEATURE_COLUMNS))), columns=FEATURE_COLUMNS)
+    X['TEAM_ID_ENCODED'] = rng.integers(0, 30, len(X))
+    X['OPPONENT_TEAM_ID_ENCODED'] = rng.integers(0, 30, len(X))
+    predictor.scaler.fit(X)
+    return predictor
+
+
+@pytest.fixture(scope='module')
+def matches():
+    rng = np.random.default_rng(1)
+    home_ids = rng.choice(TEAM_IDS, 20)
+    away_ids = rng.choice(TEAM_IDS, 20)
+    stats = pd.DataFrame(rng.normal(size=(20, len(MATCH_STAT_COLUMNS))), columns=MATCH_STAT_COLUMNS)
+    return home_ids, away_ids, stats
+
+
+def test_batch_matches_per_row_predictions(predictor, matches):
+    home_ids, away_ids, stats = matches
+
+    batch = predictor.predict_matches(home_ids, away_ids, stats)
+
+    rows = [
+        predictor.predict_match(home_id, away_id, row.to_dict(), None)
+        for home_id, away_id, (_, row) in zip(home_ids, away_ids, stats.iterrows())
+    ]
+    assert batch.shape == (len(stats),)
+    np.testing.assert_allclose(batch, rows, rtol=1e-5)
+
+
+@pytest.mark.parametrize('as_input', [
+    lambda stats: stats,
+    lambda stats: stats.to_dict('records'),
+    lambda stats: stats.to_numpy(),
+], ids=['dataframe', 'list_of_dicts', 'ndarray'])
+def test_stats_input_formats_agree(predictor, matches, as_input):
+    home_ids, away_ids, stats = matches
+    expected = predictor.predict_matches(home_ids, away_ids, stats)
+
+    np.testing.assert_allclose(predictor.predict_matches(home_ids, away_ids, as_input(stats)), expected, rtol=1e-6)
+
+
+def test_overtime_rate_defaults_to_zero(predictor, matches):
+    home_ids, away_ids, stats = matches
+    expected = predictor.predict_matches(home_ids, away_ids, stats.assign(OVERTIME_RATE=0.0))
+    without_overtime = stats.drop(columns=['OVERTIME_RATE'])
+
+    np.testing.assert_allclose(predictor.predict_matches(home_ids, away_ids, without_overtime), expected, rtol=1e-6)
+    np.testing.assert_allclose(
+        predictor.predict_matches(home_ids, away_ids, without_overtime.to_dict('records')), expected, rtol=1e-6
+    )
+
+
+def test_mismatched_lengths_raise(predictor, matches):
+    home_ids, away_ids, stats = matches
+
+    with pytest.raises(ValueError):
+        predictor.predict_matches(home_ids, away_ids[:-1], stats)
+    with pytest.raises(ValueError):
+        predictor.predict_matches(home_ids, away_ids, stats.iloc[:-1])
+    with pytest.raises(ValueError):
+        predictor.predict_matches(home_ids, away_ids, stats.to_numpy()[:, :-1])
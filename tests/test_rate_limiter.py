@@ -0,0 +1,66 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scripts.rate_limiter import TokenBucket
+
+
+class FakeClock:
+    """Clock whose sleep() advances time instantly"""
+
+    def __init__(self):
+        self.now = 0.0
+        self.lock = threading.Lock()
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        with self.lock:
+            self.now += seconds
+
+
+def test_burst_then_steady_rate():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2, capacity=3, clock=clock, sleep=clock.sleep)
+
+    waits = [bucket.acquire() for _ in range(7)]
+
+    # The first three ride the burst, the rest are spaced 1/rate apart
+    assert waits[:3] == [0, 0, 0]
+    assert clock.now == pytest.approx(2.0)
+
+
+def test_tokens_refill_while_idle():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1, capacity=2, clock=clock, sleep=clock.sleep)
+    bucket.acquire(2)
+
+    clock.now += 10
+    assert bucket.acquire(2) == 0
+
+
+def test_concurrent_callers_share_the_rate():
+    bucket = TokenBucket(rate=50, capacity=1)
+    threads = [threading.Thread(target=bucket.acquire) for _ in range(10)]
+
+    start = bucket.clock()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Nine refills at 50/s, whatever the thread count
+    assert bucket.clock() - start >= 9 / 50 * 0.9
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, capacity=1).acquire(2)
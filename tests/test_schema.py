@@ -0,0 +1,63 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import make_games
+from data.schema import GAME_DTYPES, apply_game_schema, read_games_csv
+
+
+@pytest.fixture
+def games_csv(tmp_path):
+    path = tmp_path / 'team_games_latest.csv'
+    make_games(600).to_csv(path, index=False)
+    return str(path)
+
+
+def test_read_games_csv_uses_compact_dtypes(games_csv):
+    games = read_games_csv(games_csv)
+
+    for column, dtype in GAME_DTYPES.items():
+        assert games[column].dtype == dtype, column
+    assert pd.api.types.is_datetime64_any_dtype(games['GAME_DATE'])
+    assert games['GAME_ID'].str.startswith('00').all()
+
+    default = pd.read_csv(games_csv)
+    assert games.memory_usage(deep=True).sum() < default.memory_usage(deep=True).sum() / 2
+
+
+def test_integers_with_gaps_or_large_values_are_kept_safe():
+    games = pd.DataFrame({'PTS': [100.0, np.nan], 'AST': [20, 300], 'TEAM_ID': [1, 2]})
+
+    games = apply_game_schema(games)
+
+    assert games['PTS'].dtype == 'float32'
+    assert games['AST'].tolist() == [20, 300]
+    assert games['TEAM_ID'].dtype == 'int32'
+
+
+def test_prepare_features_matches_default_dtypes(games_csv):
+    pytest.importorskip('tensorflow')
+    from models.features import FEATURE_COLUMNS
+    from models.match_predictor import NBAMatchPredictor
+
+    compact = read_games_csv(games_csv)
+    # A missing team name must not break the NaN fill on a categorical column
+    compact.loc[0, 'TEAM_NAME'] = np.nan
+    default = pd.read_csv(games_csv)
+
+    predictor = NBAMatchPredictor()
+    compact_features = predictor.prepare_features(compact)
+    default_features = predictor.prepare_features(default)
+
+    np.testing.assert_allclose(
+        compact_features[FEATURE_COLUMNS].to_numpy(dtype=float),
+        default_features[FEATURE_COLUMNS].to_numpy(dtype=float),
+        rtol=1e-5, atol=1e-5
+    )
+    assert compact_features['PTS_ROLLING_AVG_5'].dtype == np.float32
@@ -0,0 +1,90 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+tf = pytest.importorskip('tensorflow')
+
+LEARNING_RATE = 0.01
+
+
+def datasets(seed=0):
+    """Validation labels are the opposite of the training labels, so the
+    validation loss gets worse with every epoch after the first"""
+    rng = np.random.default_rng(seed)
+    X_train = rng.normal(size=(512, 15)).astype(np.float32)
+    X_val = rng.normal(size=(256, 15)).astype(np.float32)
+    y_train = (X_train[:, 0] > 0).astype(np.float32).reshape(-1, 1)
+    y_val = (X_val[:, 0] <= 0).astype(np.float32).reshape(-1, 1)
+    return (tf.data.Dataset.from_tensor_slices((X_train, y_train)).batch(64),
+            tf.data.Dataset.from_tensor_slices((X_val, y_val)).batch(64))
+
+
+@pytest.fixture
+def predictor():
+    from models.match_predictor import NBAMatchPredictor
+
+    tf.random.set_seed(0)
+    return NBAMatchPredictor(hidden_units=(16,), dropout=0.0, learning_rate=LEARNING_RATE)
+
+
+def weights_after_each_epoch(predictor):
+    snapshots = []
+    recorder = tf.keras.callbacks.LambdaCallback(
+        on_epoch_end=lambda epoch, logs: snapshots.append([w.copy() for w in predictor.model.get_weights()])
+    )
+    return snapshots, recorder
+
+
+def test_early_stopping_ends_the_loop_and_restores_the_best_weights(predictor):
+    train_dataset, val_dataset = datasets()
+    snapshots, recorder = weights_after_each_epoch(predictor)
+    early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=3, restore_best_weights=True)
+
+    history = predictor._run_training_loop(
+        train_dataset, val_dataset, epochs=50, verbose=0, callback_list=[recorder, early_stopping]
+    )
+
+    assert np.argmin(history['val_loss']) == 0
+    assert predictor.epochs_trained == 4 == len(history['loss'])
+    assert all(np.array_equal(best, restored) for best, restored in zip(snapshots[0], predictor.model.get_weights()))
+
+
+def test_best_weights_are_restored_when_all_epochs_run(predictor):
+    train_dataset, val_dataset = datasets()
+    snapshots, recorder = weights_after_each_epoch(predictor)
+    early_stopping = tf.keras.callbacks.EarlyStopping(monitor='val_loss', patience=10, restore_best_weights=True)
+
+    predictor._run_training_loop(train_dataset, val_dataset, epochs=3, verbose=0,
+                                 callback_list=[recorder, early_stopping])
+
+    assert predictor.epochs_trained == 3
+    assert all(np.array_equal(best, restored) for best, restored in zip(snapshots[0], predictor.model.get_weights()))
+
+
+def test_reduce_lr_on_plateau_lowers_the_learning_rate(predictor):
+    train_dataset, val_dataset = datasets()
+    reduce_lr = tf.keras.callbacks.ReduceLROnPlateau(monitor='val_loss', factor=0.5, patience=1, min_lr=0.0001)
+
+    predictor._run_training_loop(train_dataset, val_dataset, epochs=3, verbose=0, callback_list=[reduce_lr])
+
+    # No improvement after epoch 1, so the rate is halved after epochs 2 and 3
+    assert float(predictor.model.optimizer.learning_rate.numpy()) == pytest.approx(LEARNING_RATE / 4)
+    assert predictor.epochs_trained == 3
+
+
+@pytest.mark.parametrize('jit_compile', [False, True], ids=['tf.function', 'xla'])
+def test_history_has_one_entry_per_epoch(predictor, jit_compile):
+    train_dataset, val_dataset = datasets()
+
+    history = predictor._run_training_loop(train_dataset, val_dataset, epochs=3, verbose=0, jit_compile=jit_compile)
+
+    assert set(history) == {'loss', 'accuracy', 'val_loss', 'val_accuracy'}
+    assert all(len(values) == 3 for values in history.values())
+    assert all(np.isfinite(values).all() for values in history.values())
+    # Training labels are learnable, so the compiled steps do update the weights
+    assert history['loss'][-1] < history['loss'][0]